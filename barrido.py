@@ -0,0 +1,147 @@
+"""
+Módulo de Barrido de Parámetros
+Ejecuta la misma carga sobre una grilla de configuraciones en paralelo
+y reúne las métricas en una tabla
+"""
+
+import argparse
+import csv
+import itertools
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from constantes import MEMORIA_DEFAULT, NIVELES_MLFQ, PERIODO_BOOST_MLFQ, INTERVALO_ENVEJECIMIENTO
+from simulacion import run, generar_carga
+
+COLUMNAS = [
+    'algoritmo', 'quantum', 'estrategia_mem', 'memoria_total',
+    'ticks', 'terminados', 'no_admitidos', 'throughput',
+    'retorno_promedio', 'espera_promedio', 'respuesta_promedio',
+    'fragmentacion_externa', 'compactaciones', 'desbalance'
+]
+
+
+def crear_celdas(algoritmos, quantums, estrategias, memorias):
+    """
+    Producto cartesiano de la grilla, en un orden fijo
+
+    Returns:
+        Lista de dicts con algoritmo, quantum, estrategia_mem y memoria_total
+    """
+    return [
+        {'algoritmo': algoritmo, 'quantum': quantum, 'estrategia_mem': estrategia, 'memoria_total': memoria}
+        for algoritmo, quantum, estrategia, memoria in itertools.product(algoritmos, quantums, estrategias, memorias)
+    ]
+
+
+def ejecutar_celda(argumentos):
+    """
+    Ejecuta una celda de la grilla en un coordinador independiente
+    (función de módulo para poder enviarla a otro proceso)
+
+    Args:
+        argumentos: Tupla (celda, procesos, semilla, opciones de run)
+
+    Returns:
+        Fila de la tabla de resultados
+    """
+    celda, procesos, semilla, opciones = argumentos
+    resultado = run(procesos, semilla=semilla, **celda, **opciones)
+    metricas = resultado['metricas'][celda['algoritmo']]
+    fila = dict(celda)
+    fila.update({
+        'ticks': resultado['ticks'],
+        'terminados': resultado['terminados'],
+        'no_admitidos': resultado['no_admitidos'],
+        'throughput': metricas['throughput'],
+        'retorno_promedio': metricas['retorno']['promedio'],
+        'espera_promedio': metricas['espera']['promedio'],
+        'respuesta_promedio': metricas['respuesta']['promedio'],
+        'fragmentacion_externa': resultado['memoria']['fragmentacion_externa'],
+        'compactaciones': resultado['compactacion']['compactaciones'],
+        'desbalance': resultado['nucleos']['desbalance']
+    })
+    return fila
+
+
+def barrer(procesos, algoritmos, quantums=(3,), estrategias=("First Fit",), memorias=(MEMORIA_DEFAULT,),
+           semilla=0, trabajadores=None, **opciones):
+    """
+    Ejecuta la carga en cada celda de la grilla algoritmo × quantum × estrategia × memoria
+
+    Todas las celdas usan la misma carga y la misma semilla de I/O (números
+    aleatorios comunes), y cada una resiembra su generador al empezar, así
+    que el resultado no depende de cuántos trabajadores haya ni del orden
+    en que terminen
+
+    Args:
+        procesos: Lista de tuplas (tamaño KB, ráfaga, prioridad)
+        algoritmos, quantums, estrategias, memorias: Valores de la grilla
+        semilla: Semilla de la I/O de cada celda
+        trabajadores: Procesos del pool (None: todos los núcleos; 1: sin pool)
+        **opciones: Argumentos adicionales para simulacion.run (ticks, eventos, num_nucleos...)
+
+    Returns:
+        Lista de filas (dicts con las claves de COLUMNAS) en el orden de la grilla
+    """
+    celdas = crear_celdas(algoritmos, quantums, estrategias, memorias)
+    tareas = [(celda, procesos, semilla, opciones) for celda in celdas]
+    if trabajadores == 1:
+        return [ejecutar_celda(tarea) for tarea in tareas]
+    with ProcessPoolExecutor(max_workers=trabajadores) as pool:
+        # map conserva el orden de las tareas
+        return list(pool.map(ejecutar_celda, tareas))
+
+
+def escribir_csv(filas, archivo):
+    """
+    Escribe la tabla de resultados en formato CSV
+    """
+    escritor = csv.DictWriter(archivo, fieldnames=COLUMNAS)
+    escritor.writeheader()
+    escritor.writerows(filas)
+
+
+def main(argv=None):
+    """
+    Punto de entrada de la línea de comandos: imprime la tabla en CSV
+    """
+    parser = argparse.ArgumentParser(description="Barrido de parámetros del simulador")
+    parser.add_argument("--algoritmos", nargs="+", default=["Round Robin", "FCFS", "SJF"])
+    parser.add_argument("--quantums", nargs="+", type=int, default=[3])
+    parser.add_argument("--estrategias", nargs="+", default=["First Fit"])
+    parser.add_argument("--memorias", nargs="+", type=int, default=[MEMORIA_DEFAULT])
+    parser.add_argument("--procesos", type=int, default=50, help="Procesos aleatorios de la carga")
+    parser.add_argument("--semilla", type=int, default=0, help="Semilla de la carga y de la I/O")
+    parser.add_argument("--ticks", type=int, default=None, help="Máximo de ticks por celda")
+    parser.add_argument("--nucleos", type=int, default=1, help="Número de núcleos de CPU")
+    parser.add_argument("--niveles-mlfq", type=int, default=NIVELES_MLFQ, help="Niveles de MLFQ")
+    parser.add_argument("--quantums-mlfq", nargs="+", type=int, default=None,
+                        help="Quantum de cada nivel de MLFQ (por defecto se duplica en cada nivel)")
+    parser.add_argument("--periodo-boost", type=int, default=PERIODO_BOOST_MLFQ,
+                        help="Ticks entre cada boost de prioridad en MLFQ")
+    parser.add_argument("--envejecimiento", type=int, default=INTERVALO_ENVEJECIMIENTO,
+                        help="Ticks de espera por punto de prioridad (0 lo desactiva)")
+    parser.add_argument("--trabajadores", type=int, default=os.cpu_count(), help="Procesos en paralelo")
+    parser.add_argument("--salida", default=None, help="Archivo CSV (por defecto la salida estándar)")
+    args = parser.parse_args(argv)
+
+    filas = barrer(
+        generar_carga(args.procesos, args.semilla),
+        args.algoritmos, args.quantums, args.estrategias, args.memorias,
+        semilla=args.semilla, trabajadores=args.trabajadores,
+        ticks=args.ticks, eventos=True, num_nucleos=args.nucleos,
+        niveles_mlfq=args.niveles_mlfq, quantums_mlfq=args.quantums_mlfq,
+        periodo_boost=args.periodo_boost, intervalo_envejecimiento=args.envejecimiento
+    )
+    if args.salida:
+        with open(args.salida, "w", newline="", encoding="utf-8") as archivo:
+            escribir_csv(filas, archivo)
+    else:
+        escribir_csv(filas, sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,436 @@
+"""
+Módulo de Benchmarks
+Mide el rendimiento del núcleo de la simulación y lo compara con una línea base
+
+Uso:
+    python benchmark.py --salida base.json                  Genera la línea base
+    python benchmark.py --salida hoy.json --base base.json  Compara; sale con 1 si hay regresiones
+"""
+
+import argparse
+import gc
+import json
+import pickle
+import platform
+import random
+import sys
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from constantes import ALGORITMOS, ESTRATEGIAS_MEMORIA
+from coordinador import CoordinadorSO
+from modulo_memoria import GestorMemoria
+from modulo_procesos import PCB
+
+TAMANOS = (100, 10_000, 1_000_000)  # Procesos de las cargas sintéticas
+ESCENARIOS_MEMORIA = ("vacia", "fragmentada")
+MEMORIA_BENCHMARK = 1 << 20  # KB
+TOLERANCIA = 0.2  # Empeoramiento relativo admitido antes de marcar una regresión
+REPETICIONES = 5  # Repeticiones de cada medición
+MINIMO_SEGUNDOS = 0.1  # Tiempo medido mínimo de cada repetición; más breve, el ruido supera la tolerancia
+MAXIMO_PASADAS = 1000  # Tope de pasadas por repetición al ajustar a MINIMO_SEGUNDOS
+
+
+@contextmanager
+def _sin_recolector():
+    """
+    Desactiva el recolector cíclico mientras se mide, como timeit
+
+    Antes se recoge la basura de las mediciones anteriores: si no, sus pausas
+    caen dentro de la medición siguiente y crecen con lo que quedó vivo
+    """
+    gc.collect()
+    activo = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if activo:
+            gc.enable()
+
+
+def _ajustar_pasadas(medir):
+    """
+    Elige cuántas pasadas de la carga forman una repetición para que su
+    tiempo medido llegue a MINIMO_SEGUNDOS, como timeit.Timer.autorange
+    (1, 2, 5, 10, 20, 50... hasta MAXIMO_PASADAS)
+
+    Args:
+        medir: Función que recibe el número de pasadas y devuelve la tupla
+               (segundos medidos, resultado)
+
+    Returns:
+        Tupla (pasadas, resultado de la última medición), que sirve como
+        primera repetición
+    """
+    escala = 1
+    while True:
+        for factor in (1, 2, 5):
+            pasadas = escala * factor
+            segundos, resultado = medir(pasadas)
+            if segundos >= MINIMO_SEGUNDOS or pasadas >= MAXIMO_PASADAS:
+                return pasadas, resultado
+        escala *= 10
+
+
+def _pasadas_ticks(algoritmo, estrategia, procesos, ticks, memoria_total, semilla, pasadas):
+    """
+    Ejecuta 'pasadas' veces la carga desde cero. En cada una, crear la carga
+    no se mide y el primer tick, en que se admiten de golpe los procesos que
+    caben, se mide aparte de los 'ticks' siguientes
+
+    Returns:
+        Tupla (segundos de los ticks medidos, segundos de las admisiones)
+    """
+    medido = 0.0
+    admision = 0.0
+    for _ in range(pasadas):
+        coordinador = CoordinadorSO(memoria_total, algoritmo, 3, estrategia, semilla=semilla)
+        coordinador.generar_procesos(procesos)
+        with _sin_recolector():
+            inicio = time.perf_counter()
+            coordinador.ejecutar_ciclo()
+            admitidos = time.perf_counter()
+            for _ in range(ticks):
+                coordinador.ejecutar_ciclo()
+            fin = time.perf_counter()
+        admision += admitidos - inicio
+        medido += fin - admitidos
+        del coordinador
+    return medido, admision
+
+
+def medir_ticks(algoritmo, estrategia, procesos, ticks, memoria_total=MEMORIA_BENCHMARK,
+                semilla=0, repeticiones=REPETICIONES):
+    """
+    Ticks por segundo de CoordinadorSO.ejecutar_ciclo con una carga sintética
+
+    El tick de la admisión inicial no cuenta: con miles de procesos cuesta
+    más que todos los demás juntos y ocultaría el costo de un tick normal;
+    se informa aparte. Con cargas chicas cada repetición encadena varias
+    pasadas hasta medir al menos MINIMO_SEGUNDOS. Se informan la repetición
+    más rápida, la menos afectada por el resto del sistema, y la mediana
+
+    Args:
+        algoritmo, estrategia: Configuración del coordinador
+        procesos: Procesos que llegan en el tick 0
+        ticks: Ticks medidos en cada pasada, después de la admisión inicial
+
+    Returns:
+        dict con la configuración, 'ticks_por_segundo' (mejor repetición),
+        'ticks_por_segundo_mediana', 'segundos' (de la mejor repetición),
+        'pasadas' por repetición y 'admision_segundos' (mejor tiempo del
+        tick de admisión inicial)
+    """
+    def medir(pasadas):
+        resultado = _pasadas_ticks(algoritmo, estrategia, procesos, ticks, memoria_total, semilla, pasadas)
+        return resultado[0], resultado
+
+    pasadas, primera = _ajustar_pasadas(medir)
+    corridas = [primera] + [
+        _pasadas_ticks(algoritmo, estrategia, procesos, ticks, memoria_total, semilla, pasadas)
+        for _ in range(repeticiones - 1)
+    ]
+    duraciones = sorted(medido for medido, _ in corridas)
+    mejor = duraciones[0]
+    mediana = duraciones[len(duraciones) // 2]
+    medidos = ticks * pasadas
+    return {
+        'algoritmo': algoritmo,
+        'estrategia': estrategia,
+        'procesos': procesos,
+        'ticks': ticks,
+        'pasadas': pasadas,
+        'repeticiones': len(corridas),
+        'segundos': mejor,
+        'ticks_por_segundo': medidos / mejor if mejor else float('inf'),
+        'ticks_por_segundo_mediana': medidos / mediana if mediana else float('inf'),
+        'admision_segundos': min(admision for _, admision in corridas) / pasadas
+    }
+
+
+def _resumir_latencias(latencias):
+    """
+    Promedio, percentiles y máximo de una lista de latencias en nanosegundos
+
+    Returns:
+        dict en microsegundos
+    """
+    if not latencias:
+        return {'llamadas': 0, 'promedio_us': 0.0, 'p50_us': 0.0, 'p99_us': 0.0, 'max_us': 0.0}
+    latencias.sort()
+    n = len(latencias)
+    return {
+        'llamadas': n,
+        'promedio_us': sum(latencias) / n / 1000,
+        'p50_us': latencias[n // 2] / 1000,
+        'p99_us': latencias[min(n - 1, n * 99 // 100)] / 1000,
+        'max_us': latencias[-1] / 1000
+    }
+
+
+def medir_memoria(estrategia, escenario, operaciones, memoria_total=MEMORIA_BENCHMARK, semilla=0,
+                  repeticiones=REPETICIONES):
+    """
+    Latencia de cada llamada a GestorMemoria.asignar_memoria y liberar_memoria
+
+    Cada repetición ejecuta la misma secuencia de operaciones, tantas pasadas
+    como hagan falta para medir al menos MINIMO_SEGUNDOS, y de cada
+    estadístico se informa la mediana entre repeticiones: las latencias de
+    unos pocos µs son bimodales y el mínimo salta de una moda a la otra
+
+    Cada operación pide memoria para un proceso nuevo; mientras no haya lugar
+    se libera un proceso residente. Al terminar se liberan tantos residentes
+    como operaciones, así liberar se mide aunque no se haya llenado; liberar
+    todos los del escenario fragmentado costaría más que lo medido. Escenarios:
+        vacia: la memoria empieza vacía y se libera el residente más antiguo
+               (el mapa se mantiene casi contiguo)
+        fragmentada: la memoria empieza llena con un hueco en cada bloque
+                     alterno y se libera un residente al azar
+
+    Args:
+        estrategia: Estrategia de asignación
+        escenario: "vacia" o "fragmentada"
+        operaciones: Procesos a asignar
+
+    Returns:
+        dict con la configuración, 'pasadas' por repetición y las latencias
+        de 'asignar' y 'liberar'
+    """
+    estado = _preparar_memoria(estrategia, escenario, memoria_total, semilla)
+
+    def medir(pasadas):
+        asignar = []
+        liberar = []
+        for _ in range(pasadas):
+            with _sin_recolector():
+                _medir_memoria_una_vez(estado, escenario, operaciones, asignar, liberar)
+        # Ambas operaciones deben llegar al mínimo: liberar suma además las del final
+        segundos = min(sum(asignar), sum(liberar)) / 1e9
+        return segundos, {'asignar': _resumir_latencias(asignar), 'liberar': _resumir_latencias(liberar)}
+
+    pasadas, primera = _ajustar_pasadas(medir)
+    corridas = [primera] + [medir(pasadas)[1] for _ in range(repeticiones - 1)]
+    resultado = {
+        'estrategia': estrategia,
+        'escenario': escenario,
+        'operaciones': operaciones,
+        'pasadas': pasadas,
+        'repeticiones': len(corridas)
+    }
+    for operacion in ('asignar', 'liberar'):
+        resumenes = [corrida[operacion] for corrida in corridas]
+        combinado = {'llamadas': resumenes[0]['llamadas']}
+        for estadistico in ('promedio_us', 'p50_us', 'p99_us', 'max_us'):
+            valores = sorted(r[estadistico] for r in resumenes)
+            combinado[estadistico] = valores[len(valores) // 2]
+        resultado[operacion] = combinado
+    return resultado
+
+
+def _preparar_memoria(estrategia, escenario, memoria_total, semilla):
+    """
+    Estado inicial de medir_memoria, serializado para restaurarlo en cada
+    pasada: llenar y fragmentar la memoria cuesta más que lo que se mide
+
+    Returns:
+        bytes con (memoria, residentes, generador aleatorio, último pid)
+    """
+    rng = random.Random(semilla)
+    memoria = GestorMemoria(memoria_total, estrategia)
+    residentes = []
+    pid = 0
+    if escenario == "fragmentada":
+        while True:
+            pid += 1
+            proceso = PCB(pid, rng.randint(20, 200), 1, 1)
+            if not memoria.asignar_memoria(proceso):
+                break
+            residentes.append(proceso)
+        for i in range(len(residentes) - 1, -1, -2):
+            memoria.liberar_memoria(residentes[i])
+            del residentes[i]
+    return pickle.dumps((memoria, residentes, rng, pid), pickle.HIGHEST_PROTOCOL)
+
+
+def _medir_memoria_una_vez(estado, escenario, operaciones, asignar, liberar):
+    """
+    Una pasada de medir_memoria desde el estado de _preparar_memoria: agrega
+    a las listas 'asignar' y 'liberar' la latencia de cada llamada en
+    nanosegundos
+    """
+    memoria, residentes, rng, pid = pickle.loads(estado)
+    fragmentada = escenario == "fragmentada"
+    if not fragmentada:
+        residentes = deque(residentes)
+
+    def nuevo_proceso():
+        nonlocal pid
+        pid += 1
+        return PCB(pid, rng.randint(20, 200), 1, 1)
+
+    def quitar_residente():
+        if not fragmentada:
+            return residentes.popleft()
+        # Quitar uno al azar en O(1): se reemplaza por el último
+        i = rng.randrange(len(residentes))
+        residentes[i], residentes[-1] = residentes[-1], residentes[i]
+        return residentes.pop()
+
+    reloj = time.perf_counter_ns
+    for _ in range(operaciones):
+        proceso = nuevo_proceso()
+        while True:
+            inicio = reloj()
+            asignado = memoria.asignar_memoria(proceso)
+            asignar.append(reloj() - inicio)
+            if asignado or not residentes:
+                break
+            victima = quitar_residente()
+            inicio = reloj()
+            memoria.liberar_memoria(victima)
+            liberar.append(reloj() - inicio)
+        if asignado:
+            residentes.append(proceso)
+
+    for _ in range(min(operaciones, len(residentes))):
+        victima = quitar_residente()
+        inicio = reloj()
+        memoria.liberar_memoria(victima)
+        liberar.append(reloj() - inicio)
+
+
+def ejecutar(algoritmos=ALGORITMOS, estrategias=ESTRATEGIAS_MEMORIA, tamanos=TAMANOS,
+             escenarios=ESCENARIOS_MEMORIA, ticks=200, memoria_total=MEMORIA_BENCHMARK,
+             semilla=0, repeticiones=REPETICIONES, progreso=None):
+    """
+    Ejecuta la suite completa
+
+    Args:
+        progreso: Función que recibe una línea de texto por medición (opcional)
+
+    Returns:
+        dict con el entorno, las mediciones de 'ticks' y las de 'memoria'
+    """
+    resultados = {
+        'entorno': {
+            'python': platform.python_version(),
+            'implementacion': platform.python_implementation(),
+            'plataforma': platform.platform(),
+            'fecha': time.strftime('%Y-%m-%dT%H:%M:%S')
+        },
+        'ticks': [],
+        'memoria': []
+    }
+    for procesos in tamanos:
+        for estrategia in estrategias:
+            for algoritmo in algoritmos:
+                medicion = medir_ticks(algoritmo, estrategia, procesos, ticks, memoria_total,
+                                       semilla, repeticiones)
+                resultados['ticks'].append(medicion)
+                if progreso:
+                    progreso(f"{algoritmo} / {estrategia} / {procesos} procesos: "
+                             f"{medicion['ticks_por_segundo']:.0f} ticks/s "
+                             f"(admisión inicial {medicion['admision_segundos'] * 1000:.1f} ms)")
+    for operaciones in tamanos:
+        for estrategia in estrategias:
+            for escenario in escenarios:
+                medicion = medir_memoria(estrategia, escenario, operaciones, memoria_total, semilla,
+                                         repeticiones)
+                resultados['memoria'].append(medicion)
+                if progreso:
+                    progreso(f"{estrategia} / {escenario} / {operaciones} operaciones: "
+                             f"asignar {medicion['asignar']['promedio_us']:.1f} µs, "
+                             f"liberar {medicion['liberar']['promedio_us']:.1f} µs")
+    return resultados
+
+
+def comparar(resultados, base, tolerancia=TOLERANCIA):
+    """
+    Compara una ejecución con la línea base
+
+    Es regresión que los ticks por segundo bajen, o que la latencia promedio
+    o mediana de asignar / liberar suba, más que la tolerancia relativa.
+    Se comparan la mejor repetición de ticks y la mediana de las latencias
+    (ver medir_ticks y medir_memoria). Las mediciones que no están en ambas
+    se ignoran
+
+    Returns:
+        Lista de regresiones (texto), vacía si no hay
+    """
+    regresiones = []
+
+    base_ticks = {(m['algoritmo'], m['estrategia'], m['procesos']): m for m in base.get('ticks', [])}
+    for medicion in resultados['ticks']:
+        clave = (medicion['algoritmo'], medicion['estrategia'], medicion['procesos'])
+        anterior = base_ticks.get(clave)
+        if anterior and medicion['ticks_por_segundo'] < anterior['ticks_por_segundo'] * (1 - tolerancia):
+            regresiones.append(f"ticks {' / '.join(map(str, clave))}: "
+                               f"{anterior['ticks_por_segundo']:.0f} → {medicion['ticks_por_segundo']:.0f} ticks/s")
+
+    base_memoria = {(m['estrategia'], m['escenario'], m['operaciones']): m for m in base.get('memoria', [])}
+    for medicion in resultados['memoria']:
+        clave = (medicion['estrategia'], medicion['escenario'], medicion['operaciones'])
+        anterior = base_memoria.get(clave)
+        if not anterior:
+            continue
+        for operacion in ('asignar', 'liberar'):
+            for estadistico in ('promedio_us', 'p50_us'):
+                antes = anterior[operacion][estadistico]
+                ahora = medicion[operacion][estadistico]
+                if antes and ahora > antes * (1 + tolerancia):
+                    regresiones.append(f"{operacion} {' / '.join(map(str, clave))} {estadistico}: "
+                                       f"{antes:.2f} → {ahora:.2f} µs")
+    return regresiones
+
+
+def main(argv=None):
+    """
+    Punto de entrada de la línea de comandos
+
+    Returns:
+        0, o 1 si se comparó con una línea base y hubo regresiones
+    """
+    parser = argparse.ArgumentParser(description="Benchmarks del núcleo de la simulación")
+    parser.add_argument("--algoritmos", nargs="+", default=list(ALGORITMOS))
+    parser.add_argument("--estrategias", nargs="+", default=list(ESTRATEGIAS_MEMORIA))
+    parser.add_argument("--tamanos", nargs="+", type=int, default=list(TAMANOS),
+                        help="Procesos de cada carga (y operaciones de memoria)")
+    parser.add_argument("--escenarios", nargs="+", choices=ESCENARIOS_MEMORIA, default=list(ESCENARIOS_MEMORIA))
+    parser.add_argument("--ticks", type=int, default=200, help="Ticks medidos por pasada, después de la admisión inicial")
+    parser.add_argument("--repeticiones", type=int, default=REPETICIONES,
+                        help="Repeticiones de cada medición")
+    parser.add_argument("--memoria", type=int, default=MEMORIA_BENCHMARK, help="Memoria total en KB")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--salida", default=None, help="Archivo JSON de resultados (por defecto la salida estándar)")
+    parser.add_argument("--base", default=None, help="Archivo JSON de línea base con el que comparar")
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCIA,
+                        help="Empeoramiento relativo admitido (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    resultados = ejecutar(args.algoritmos, args.estrategias, args.tamanos, args.escenarios,
+                          ticks=args.ticks, memoria_total=args.memoria, semilla=args.semilla,
+                          repeticiones=args.repeticiones,
+                          progreso=lambda linea: print(linea, file=sys.stderr))
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            json.dump(resultados, archivo, ensure_ascii=False, indent=2)
+    else:
+        json.dump(resultados, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+
+    if args.base:
+        with open(args.base, encoding="utf-8") as archivo:
+            base = json.load(archivo)
+        regresiones = comparar(resultados, base, args.tolerancia)
+        for regresion in regresiones:
+            print(f"REGRESIÓN {regresion}", file=sys.stderr)
+        if regresiones:
+            return 1
+        print("Sin regresiones respecto de la línea base", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,6 +6,37 @@ Contiene todas las constantes, colores y configuraciones del simulador
 # --- CONSTANTES DE MEMORIA ---
 MEMORIA_DEFAULT = 1024
 BLOQUE_MEMORIA = 1
+ESTRATEGIAS_MEMORIA = ("First Fit", "Best Fit", "Worst Fit", "Next Fit", "TLSF", "Buddy System")
+
+# --- CONSTANTES DE PAGINACIÓN ---
+TAMANO_MARCO = 4  # Tamaño de marco/página en KB
+ENTRADAS_TLB = 16
+
+# --- CONSTANTES DE COMPACTACIÓN ---
+COSTO_COMPACTACION_KB = 0.05  # Ticks de CPU por KB reubicado
+
+# --- CONSTANTES DE PLANIFICACIÓN ---
+ALGORITMOS = ("Round Robin", "FCFS", "SJF", "SRTF", "Prioridad", "Prioridad Apropiativa", "MLFQ")
+ALGORITMOS_CON_QUANTUM = ("Round Robin", "MLFQ")
+ALGORITMOS_APROPIATIVOS = ("SRTF", "Prioridad Apropiativa", "MLFQ")
+INTERVALO_ENVEJECIMIENTO = 20  # Ticks de espera para ganar un punto de prioridad
+NIVELES_MLFQ = 3
+PERIODO_BOOST_MLFQ = 50  # Ticks entre cada boost de prioridad en MLFQ
+
+# --- CONSTANTES DE I/O ---
+PROBABILIDAD_IO = 0.01  # Probabilidad de bloqueo por I/O en cada tick
+DURACION_IO_MIN = 5  # Ticks que dura un bloqueo (mínimo)
+DURACION_IO_MAX = 20  # Ticks que dura un bloqueo (máximo)
+
+# --- CONSTANTES DEL GANTT ---
+CAPACIDAD_GANTT = 4096  # Segmentos (y cubetas por nivel) que se conservan
+NIVELES_RESUMEN_GANTT = 4  # Niveles del resumen multirresolución
+FACTOR_RESUMEN_GANTT = 16  # Cada nivel agrupa este factor de ticks más que el anterior
+VENTANA_GANTT = 120  # Ticks que muestra la interfaz
+
+# --- CONSTANTES DE EVENTOS ---
+CAPACIDAD_EVENTOS = 4096  # Eventos recientes que se conservan
+LINEAS_LOG = 200  # Líneas que conserva el log de la interfaz
 
 # --- COLORES FUTURISTAS Y TECNOLÓGICOS - TEMA OSCURO ---
 COLOR_FONDO_PRINCIPAL = "#0a0e27"  # Azul oscuro profundo
@@ -6,8 +6,18 @@ Integra todos los módulos del simulador y coordina su funcionamiento
 from modulo_cpu import CPU
 from modulo_procesos import GestorProcesos
 from modulo_memoria import GestorMemoria
+from modulo_paginacion import GestorMemoriaPaginada
 from modulo_planificador import Planificador
 from modulo_despachador import Despachador
+from modulo_metricas import MetricasPlanificacion
+from modulo_trazas import LectorTraza, EscritorTraza, escribir_traza
+from modulo_eventos import (FlujoEventos, LLEGADA, BOOST, ADMISION, COMPACTACION, RETORNO_IO,
+                            EXPROPIACION, TERMINADO, DEGRADACION, QUANTUM, BLOQUEO_IO)
+from constantes import (COSTO_COMPACTACION_KB, ALGORITMOS_CON_QUANTUM, NIVELES_MLFQ, PERIODO_BOOST_MLFQ,
+                        INTERVALO_ENVEJECIMIENTO)
+import gc
+import math
+import pickle
 import random
 
 
@@ -16,7 +26,11 @@ class CoordinadorSO:
     Coordinador del Sistema Operativo
     Integra CPU, Procesos, Memoria, Planificador y Despachador
     """
-    def __init__(self, memoria_total=1024, algoritmo="Round Robin", quantum=3, estrategia_mem="First Fit"):
+    def __init__(self, memoria_total=1024, algoritmo="Round Robin", quantum=3, estrategia_mem="First Fit",
+                 modo_memoria="Contigua", costo_compactacion_kb=COSTO_COMPACTACION_KB,
+                 num_nucleos=1, colas_por_nucleo=False, semilla=None, modelo_io=None,
+                 niveles_mlfq=NIVELES_MLFQ, quantums_mlfq=None, periodo_boost=PERIODO_BOOST_MLFQ,
+                 intervalo_envejecimiento=INTERVALO_ENVEJECIMIENTO):
         """
         Inicializa el coordinador con todos los módulos
         
@@ -25,110 +39,567 @@ class CoordinadorSO:
             algoritmo: Algoritmo de planificación
             quantum: Tamaño del quantum
             estrategia_mem: Estrategia de asignación de memoria
+            modo_memoria: "Contigua" (particiones variables) o "Paginación"
+            costo_compactacion_kb: Ticks de CPU que cuesta reubicar cada KB al compactar
+            num_nucleos: Número de núcleos de CPU
+            colas_por_nucleo: Una cola de listos por núcleo con robo de trabajo
+                              en lugar de una cola global
+            semilla: Semilla de los generadores aleatorios propios (I/O y carga)
+            modelo_io: Modelo de bloqueo por I/O (ModeloIO por defecto)
+            niveles_mlfq: Número de niveles de MLFQ
+            quantums_mlfq: Quantum de cada nivel de MLFQ (None: se duplica en cada nivel)
+            periodo_boost: Ticks entre cada boost de prioridad en MLFQ
+            intervalo_envejecimiento: Ticks de espera en listos que mejoran la
+                                      prioridad en un punto (0 lo desactiva)
         """
-        self.cpu = CPU()
-        self.gestor_procesos = GestorProcesos()
-        self.memoria = GestorMemoria(memoria_total, estrategia_mem)
-        self.planificador = Planificador(algoritmo, quantum)
-        self.despachador = Despachador()
+        # Generadores propios: cada coordinador es reproducible e independiente
+        self.rng = random.Random(semilla)
+        self.rng_carga = random.Random(None if semilla is None else f"{semilla}-carga")
+        self.cpus = [CPU(self.rng, modelo_io) for _ in range(num_nucleos)]
+        self.planificador = Planificador(algoritmo, quantum, niveles_mlfq, quantums_mlfq, periodo_boost,
+                                         intervalo_envejecimiento, num_nucleos=num_nucleos,
+                                         colas_por_nucleo=colas_por_nucleo)
+        self.gestor_procesos = GestorProcesos(self.planificador.crear_cola_listos(), num_nucleos)
+        self.modo_memoria = modo_memoria
+        self.memoria = self._crear_memoria(memoria_total, estrategia_mem)
+        self.metricas = MetricasPlanificacion(algoritmo)
+        self.despachador = Despachador(self.metricas)
+        self.costo_compactacion_kb = costo_compactacion_kb
+        self.reloj = 0
+        self.traza = None  # LectorTraza con las llegadas pendientes
+        self.exportacion = None  # EscritorTraza que recibe cada proceso al crearse
+        self.eventos = FlujoEventos()
+        self._reiniciar_compactacion()
 
     def ejecutar_ciclo(self):
         """
         Ejecuta un ciclo completo del sistema operativo (tick)
-        
-        Returns:
-            Lista de mensajes de log generados durante el ciclo
+        Lo ocurrido se emite en self.eventos
         """
-        logs = []
+        eventos = self.eventos
+
+        # LLEGADAS DE LA TRAZA (las que llegan en el tick que acaba de terminar)
+        if self.traza:
+            self._recibir_llegadas()
+
+        self.reloj += 1
+        self.gestor_procesos.reloj = self.reloj
+
+        # 0. BOOST PERIÓDICO DE MLFQ
+        if self.planificador.verificar_boost(self.reloj, self.gestor_procesos.cola_listos):
+            eventos.emitir(self.reloj, BOOST)
 
         # 1. CARGAR PROCESOS NUEVOS A MEMORIA
-        for proc in list(self.gestor_procesos.cola_nuevos):
-            if self.memoria.asignar_memoria(proc):
-                # Si hay memoria disponible, agregar a cola de listos
-                self.gestor_procesos.agregar_a_listos(proc)
-                logs.append(f"✔ P{proc.pid} entra en RAM.")
-            # Si no hay memoria, el proceso permanece en cola_nuevos
+        admitidos = self._admitir_nuevos()
+        if not admitidos and self._memoria_liberada:
+            # Nadie entra aunque la memoria libre total alcanzaría: compactar reubicando
+            menor = self.gestor_procesos.cola_nuevos.tamano_minimo()
+            if menor is not None and menor <= self.memoria.memoria_libre:
+                self.compactar_memoria()
+                admitidos = self._admitir_nuevos()
 
         # 2. RETORNO DE I/O (Procesos bloqueados)
-        for proc in list(self.gestor_procesos.cola_bloqueados):
-            proc.tiempo_bloqueado_restante -= 1
-            if proc.tiempo_bloqueado_restante <= 0:
-                # El proceso vuelve de I/O
-                self.gestor_procesos.retornar_de_bloqueados(proc)
-                logs.append(f"⬅ P{proc.pid} vuelve de I/O.")
-
-        # 3. EJECUCIÓN (CPU - Tick)
-        if self.gestor_procesos.proceso_ejecucion:
-            proc = self.gestor_procesos.proceso_ejecucion
-            
-            # Ejecutar tick en CPU
-            resultado = self.cpu.ejecutar_tick(
-                proc, 
-                self.planificador.algoritmo, 
-                self.planificador.quantum,
-                self.planificador.contador_quantum
-            )
-            
-            # Registrar en Gantt
-            self.planificador.registrar_gantt(proc)
-
-            # Actualizar contador de quantum para Round Robin
-            if self.planificador.algoritmo == "Round Robin":
-                self.planificador.contador_quantum = resultado['nuevo_contador_quantum']
-
-            # Manejar resultados del tick
-            if resultado['proceso_terminado']:
-                # Proceso terminado
-                self.terminar_proceso(proc)
-                logs.append(f"★ P{proc.pid} TERMINADO.")
-                
-            elif self.planificador.algoritmo == "Round Robin" and resultado['quantum_agotado']:
-                # Quantum agotado en Round Robin
-                self.despachador.liberar_cpu(proc, self.gestor_procesos, "LISTO")
-                self.planificador.reset_quantum()
-                logs.append(f"⏱ [RR] P{proc.pid} Quantum agotado.")
+        retornados = 0
+        for proc in self.gestor_procesos.cola_bloqueados.extraer_despiertos(self.reloj):
+            # El proceso vuelve de I/O
+            self.gestor_procesos.retornar_de_bloqueados(proc)
+            eventos.emitir(self.reloj, RETORNO_IO, proc.pid)
+            retornados += 1
+
+        # 2b. EXPROPIACIÓN - Solo puede hacer falta si llegaron procesos a listos
+        if admitidos or retornados:
+            self._verificar_expropiacion()
+
+        # 3. EJECUCIÓN (CPU - Tick en cada núcleo)
+        if self.ticks_compactacion_restantes > 0:
+            # La CPU está ocupada reubicando memoria
+            self.ticks_compactacion_restantes -= 1
+        else:
+            for nucleo, proc in enumerate(self.gestor_procesos.en_ejecucion):
+                if proc:
+                    self._ejecutar_en_nucleo(nucleo, proc)
+
+        # 4. DESPACHADOR - Seleccionar y despachar próximo proceso en cada núcleo libre
+        for nucleo, proc in enumerate(self.gestor_procesos.en_ejecucion):
+            if proc is None and self.gestor_procesos.cola_listos:
+                # El planificador selecciona el próximo proceso
+                siguiente = self.planificador.seleccionar_proximo_proceso(
+                    self.gestor_procesos.cola_listos, nucleo
+                )
                 
-            elif resultado['bloqueado_io']:
-                # Proceso bloqueado por I/O
-                proc.tiempo_bloqueado_restante = resultado['tiempo_bloqueo']
-                self.gestor_procesos.agregar_a_bloqueados(proc)
-                self.despachador.liberar_cpu(proc, self.gestor_procesos, "BLOQUEADO")
-                logs.append(f"✋ P{proc.pid} Bloqueado por I/O.")
-
-        # 4. DESPACHADOR - Seleccionar y despachar próximo proceso
-        if not self.gestor_procesos.proceso_ejecucion and self.gestor_procesos.cola_listos:
-            # El planificador selecciona el próximo proceso
-            siguiente = self.planificador.seleccionar_proximo_proceso(
-                self.gestor_procesos.cola_listos
-            )
+                if siguiente:
+                    # El despachador asigna el núcleo
+                    self.despachador.despachar_proceso(siguiente, self.gestor_procesos, nucleo)
+                    self.planificador.reset_quantum(nucleo)
+
+    def _ejecutar_en_nucleo(self, nucleo, proc):
+        """
+        Ejecuta un tick del proceso que tiene un núcleo y maneja el resultado
+        """
+        # Ejecutar tick en CPU
+        resultado = self.cpus[nucleo].ejecutar_tick(
+            proc, 
+            self.planificador.algoritmo, 
+            self.planificador.quantum_actual(proc),
+            self.planificador.contadores_quantum[nucleo]
+        )
+        
+        # Acceso a memoria de la instrucción ejecutada (traducción de dirección)
+        self.memoria.traducir(proc, proc.pc % proc.size)
+
+        # Registrar en Gantt
+        self.planificador.registrar_gantt(proc, self.reloj - 1, nucleo=nucleo)
+
+        # Actualizar contador de quantum para Round Robin y MLFQ
+        if self.planificador.algoritmo in ALGORITMOS_CON_QUANTUM:
+            self.planificador.contadores_quantum[nucleo] = resultado['nuevo_contador_quantum']
+
+        # Manejar resultados del tick
+        if resultado['proceso_terminado']:
+            # Proceso terminado
+            self.terminar_proceso(proc)
+            self.eventos.emitir(self.reloj, TERMINADO, proc.pid)
+            
+        elif self.planificador.algoritmo in ALGORITMOS_CON_QUANTUM and resultado['quantum_agotado']:
+            # Quantum agotado en Round Robin / MLFQ (en MLFQ además baja de nivel)
+            if self.planificador.algoritmo == "MLFQ":
+                nivel = self.planificador.degradar(proc)
+                self.eventos.emitir(self.reloj, DEGRADACION, proc.pid, nivel)
+            else:
+                self.eventos.emitir(self.reloj, QUANTUM, proc.pid)
+            self.despachador.liberar_cpu(proc, self.gestor_procesos, "LISTO")
+            self.planificador.reset_quantum(nucleo)
             
-            if siguiente:
-                # El despachador asigna la CPU
-                self.despachador.despachar_proceso(siguiente, self.gestor_procesos)
-                self.planificador.reset_quantum()
+        elif resultado['bloqueado_io']:
+            # Proceso bloqueado por I/O
+            proc.tick_despertar = self.reloj + resultado['tiempo_bloqueo']
+            self.gestor_procesos.agregar_a_bloqueados(proc)
+            self.despachador.liberar_cpu(proc, self.gestor_procesos, "BLOQUEADO")
+            self.eventos.emitir(self.reloj, BLOQUEO_IO, proc.pid)
+
+    def avanzar(self, limite=None):
+        """
+        Modo por eventos: salta de una vez los ticks en que no puede pasar
+        nada y ejecuta con ejecutar_ciclo el tick del próximo evento
+        (fin de I/O, fin de quantum, fin de proceso, bloqueo, boost, fin de
+        la compactación o admisión). Gantt, métricas y tick_count quedan
+        idénticos a avanzar tick a tick
+
+        Args:
+            limite: Tick que no se debe sobrepasar saltando (p. ej. la próxima llegada)
+        """
+        ticks = self._ticks_sin_eventos()
+        if limite is not None:
+            ticks = min(ticks, limite - self.reloj)
+        if ticks == math.inf or ticks <= 0 or not self._saltar_ticks(ticks):
+            # Nada pendiente (el tiempo solo avanza) o hay un evento en el próximo tick
+            self.ejecutar_ciclo()
+
+    def _ticks_sin_eventos(self):
+        """
+        Cota de los próximos ticks en que con seguridad no ocurre ningún evento
+        El próximo bloqueo por I/O ya está sorteado en cada proceso; si falta
+        sortearlo no se salta, y el tick normal lo sortea en el mismo orden
+        que el modo tick a tick. Con la cola de listos vacía y todos los
+        núcleos ocupados, un fin de quantum solo devuelve el proceso a su
+        núcleo: no corta el salto y _saltar_ticks lo aplica
+
+        Returns:
+            Número de ticks (math.inf si no hay nada pendiente)
+        """
+        gestor = self.gestor_procesos
+        if gestor.cola_nuevos:
+            menor = gestor.cola_nuevos.tamano_minimo()
+            if (menor <= self.memoria.bloque_libre_mayor()
+                    or (self._memoria_liberada and menor <= self.memoria.memoria_libre)):
+                return 0
+        if gestor.cola_listos and gestor.nucleo_libre():
+            return 0
+
+        ticks = math.inf
+        despertar = gestor.cola_bloqueados.proximo_despertar()
+        if despertar is not None:
+            ticks = despertar - self.reloj - 1
+        if self.traza:
+            # Se puede saltar hasta el tick de llegada; el ciclo siguiente la recibe
+            ticks = min(ticks, self.traza.proxima_llegada() - self.reloj)
+            if ticks <= 0:
+                return 0
+        periodo = self.planificador.periodo_boost
+        if self.planificador.algoritmo == "MLFQ" and periodo:
+            ticks = min(ticks, periodo - self.reloj % periodo - 1)
+
+        if self.ticks_compactacion_restantes > 0:
+            return min(ticks, self.ticks_compactacion_restantes)
+        con_quantum = (self.planificador.algoritmo in ALGORITMOS_CON_QUANTUM
+                       and not self._quantum_renovable())
+        con_io = self.planificador.algoritmo != "Round Robin"
+        for nucleo, proc in enumerate(gestor.en_ejecucion):
+            if proc:
+                ticks = min(ticks, proc.burst_time_restante - 1)
+                if con_quantum:
+                    ticks = min(ticks, self.planificador.quantum_actual(proc)
+                                - self.planificador.contadores_quantum[nucleo] - 1)
+                if con_io:
+                    if proc.ticks_hasta_io is None:
+                        return 0
+                    ticks = min(ticks, proc.ticks_hasta_io - 1)
+        return ticks
+
+    def _quantum_renovable(self):
+        """
+        Indica si un fin de quantum solo devuelve cada proceso a su propio
+        núcleo: la cola de listos está vacía y no hay núcleos libres, así
+        que el proceso que sale es el único que puede volver a entrar
+        """
+        gestor = self.gestor_procesos
+        return (self.planificador.algoritmo in ALGORITMOS_CON_QUANTUM
+                and not gestor.cola_listos and not gestor.nucleo_libre())
+
+    def _saltar_ticks(self, ticks):
+        """
+        Aplica de una vez 'ticks' ticks sin eventos (salvo fines de quantum
+        que solo renuevan el quantum, ver _renovar_quantums)
 
-        return logs
+        Returns:
+            Ticks saltados; puede ser menos que 'ticks' (incluso 0) si un fin
+            de quantum necesita el tick normal
+        """
+        if self.ticks_compactacion_restantes > 0:
+            self.ticks_compactacion_restantes -= ticks
+            self.reloj += ticks
+            self.gestor_procesos.reloj = self.reloj
+            return ticks
+
+        inicio = self.reloj
+        con_quantum = self.planificador.algoritmo in ALGORITMOS_CON_QUANTUM
+        renovaciones = None
+        if con_quantum and self._quantum_renovable():
+            ticks, renovaciones = self._renovar_quantums(ticks)
+            if not ticks:
+                return 0
+        self.reloj += ticks
+        self.gestor_procesos.reloj = self.reloj
+
+        con_io = self.planificador.algoritmo != "Round Robin"
+        accesos = []
+        for nucleo, proc in enumerate(self.gestor_procesos.en_ejecucion):
+            if proc:
+                self.cpus[nucleo].avanzar_ticks(proc, ticks, con_io)
+                accesos.append((proc, proc.pc - ticks + 1))
+                self.planificador.registrar_gantt(proc, inicio, ticks, nucleo)
+                if renovaciones is not None:
+                    ultimo, cantidad = renovaciones[nucleo]
+                    if cantidad:
+                        self.planificador.contadores_quantum[nucleo] = inicio + ticks - ultimo
+                        if con_io:
+                            # En el tick en que se agota el quantum no corre la cuenta de I/O
+                            proc.ticks_hasta_io += cantidad
+                    else:
+                        self.planificador.contadores_quantum[nucleo] += ticks
+                elif con_quantum:
+                    self.planificador.contadores_quantum[nucleo] += ticks
+        if accesos:
+            # Los núcleos comparten la TLB: sus accesos se intercalan tick a tick
+            self.memoria.traducir_intercalado(accesos, ticks)
+        return ticks
+
+    def _renovar_quantums(self, ticks):
+        """
+        Aplica los fines de quantum que caen en los próximos 'ticks' ticks
+        cuando cada proceso vuelve a su propio núcleo (_quantum_renovable):
+        emite QUANTUM o DEGRADACION en su tick, degrada en MLFQ y marca el
+        paso por listos y el nuevo despacho en ese mismo tick, como el modo
+        tick a tick. Cada quantum cuesta O(1), sin recorrer sus ticks
+
+        En MLFQ con cola global, si varios núcleos agotan el quantum en el
+        mismo tick y al degradarse quedan en niveles que los harían cambiar
+        de núcleo al despacharse, el salto se corta antes de ese tick
+
+        Returns:
+            Tupla (ticks que se pueden saltar, [(tick del último fin de
+            quantum, cantidad de fines de quantum)] por núcleo)
+        """
+        planificador = self.planificador
+        en_ejecucion = self.gestor_procesos.en_ejecucion
+        mlfq = planificador.algoritmo == "MLFQ"
+        intercambia = mlfq and not planificador.colas_por_nucleo and len(en_ejecucion) > 1
+        inicio = self.reloj
+        fin = inicio + ticks
+        renovaciones = [(inicio, 0)] * len(en_ejecucion)
+        # Tick en que cada núcleo agota su quantum
+        vencimientos = [inicio + max(planificador.quantum_actual(proc) - contador, 1)
+                        for proc, contador in zip(en_ejecucion, planificador.contadores_quantum)]
+        while True:
+            tick = min(vencimientos)
+            if tick > fin:
+                return ticks, renovaciones
+            nucleos = [nucleo for nucleo, vence in enumerate(vencimientos) if vence == tick]
+            if intercambia and len(nucleos) > 1:
+                niveles = [min(planificador.nivel_de(en_ejecucion[nucleo]) + 1, planificador.niveles_mlfq - 1)
+                           for nucleo in nucleos]
+                if niveles != sorted(niveles):
+                    return tick - 1 - inicio, renovaciones
+            for nucleo in nucleos:
+                proc = en_ejecucion[nucleo]
+                if mlfq:
+                    nivel = planificador.degradar(proc)
+                    self.eventos.emitir(tick, DEGRADACION, proc.pid, nivel)
+                else:
+                    self.eventos.emitir(tick, QUANTUM, proc.pid)
+                proc.tick_listo = tick
+                proc.tick_despacho = tick
+                renovaciones[nucleo] = (tick, renovaciones[nucleo][1] + 1)
+                vencimientos[nucleo] = tick + planificador.quantum_actual(proc)
+
+    def _verificar_expropiacion(self):
+        """
+        En algoritmos apropiativos, quita el núcleo a un proceso en ejecución
+        si el primero de la cola de listos tiene preferencia, y despacha a este
+
+        Con cola global el candidato desplaza al proceso en ejecución menos
+        preferido, salvo que haya un núcleo libre (lo tomará al despachar).
+        Con colas por núcleo cada núcleo compite solo con su propia cola
+        """
+        gestor = self.gestor_procesos
+        if self.planificador.colas_por_nucleo:
+            for nucleo, en_ejecucion in enumerate(gestor.en_ejecucion):
+                if en_ejecucion:
+                    candidato = gestor.cola_listos.primero_de(nucleo, robar=False)
+                    self._expropiar(nucleo, en_ejecucion, candidato)
+            return
+
+        if gestor.nucleo_libre():
+            return
+        while True:
+            victima = max(gestor.en_ejecucion,
+                          key=lambda proc: self.planificador.clave_expropiacion(proc, self.reloj))
+            if not self._expropiar(victima.nucleo, victima, gestor.cola_listos.primero()):
+                return
+
+    def _expropiar(self, nucleo, en_ejecucion, candidato):
+        """
+        Expropia el núcleo si el planificador lo indica
+
+        Returns:
+            True si hubo expropiación
+        """
+        if not self.planificador.debe_expropiar(en_ejecucion, candidato, self.reloj):
+            return False
+        self.despachador.liberar_cpu(en_ejecucion, self.gestor_procesos, "LISTO")
+        self.despachador.despachar_proceso(candidato, self.gestor_procesos, nucleo)
+        self.planificador.reset_quantum(nucleo)
+        self.eventos.emitir(self.reloj, EXPROPIACION, en_ejecucion.pid, candidato.pid)
+        return True
+
+    def _admitir_nuevos(self):
+        """
+        Intenta cargar en memoria los procesos de la cola de nuevos
+
+        Se intentan en orden de llegada solo los procesos cuyo tamaño cabe en
+        el bloque libre más grande, que se vuelve a consultar tras cada
+        admisión; los demás ni se tocan. Con la memoria saturada el costo es
+        O(1) y cada intento cuesta O(log n)
+
+        Returns:
+            Número de procesos admitidos
+        """
+        cola_nuevos = self.gestor_procesos.cola_nuevos
+        admitidos = 0
+        desde = 0
+        while True:
+            siguiente = cola_nuevos.siguiente_admisible(self.memoria.bloque_libre_mayor(), desde)
+            if siguiente is None:
+                return admitidos
+            desde, proc = siguiente
+            desde += 1
+            if self.memoria.asignar_memoria(proc):
+                # Si hay memoria disponible, agregar a cola de listos (sale de la cola de nuevos)
+                self.gestor_procesos.agregar_a_listos(proc)
+                self.eventos.emitir(self.reloj, ADMISION, proc.pid)
+                admitidos += 1
+
+    def compactar_memoria(self):
+        """
+        Compacta la memoria reubicando procesos y cobra su costo en ticks de CPU
+        """
+        resultado = self.memoria.compactar_reubicando()
+        self._memoria_liberada = False
+        if not resultado['kb_movidos']:
+            return resultado
+
+        ticks = math.ceil(resultado['kb_movidos'] * self.costo_compactacion_kb)
+        self.ticks_compactacion_restantes += ticks
+        recuperada = resultado['fragmentacion_antes'] - resultado['fragmentacion_despues']
+
+        stats = self.estadisticas_compactacion
+        stats['compactaciones'] += 1
+        stats['kb_movidos'] += resultado['kb_movidos']
+        stats['ticks'] += ticks
+        stats['fragmentacion_recuperada'] += recuperada
+        self.eventos.emitir(self.reloj, COMPACTACION, datos={
+            'kb_movidos': resultado['kb_movidos'],
+            'fragmentacion_antes': resultado['fragmentacion_antes'],
+            'fragmentacion_despues': resultado['fragmentacion_despues'],
+            'ticks': ticks
+        })
+        return resultado
+
+    def _reiniciar_compactacion(self):
+        """
+        Reinicia el estado y las estadísticas de compactación
+        """
+        self.ticks_compactacion_restantes = 0
+        self._memoria_liberada = False
+        self.estadisticas_compactacion = {
+            'compactaciones': 0,
+            'kb_movidos': 0,
+            'ticks': 0,
+            'fragmentacion_recuperada': 0.0
+        }
 
     def terminar_proceso(self, proceso):
         """
         Termina un proceso: libera memoria y lo mueve a terminados
         """
-        proceso.estado = "TERMINADO"
         self.memoria.liberar_memoria(proceso)
+        self._memoria_liberada = True
         self.gestor_procesos.agregar_a_terminados(proceso)
         self.despachador.liberar_cpu(proceso, self.gestor_procesos, "TERMINADO")
+        proceso.tiempo_finalizacion = self.reloj
+        self.metricas.registrar_finalizacion(proceso)
 
-    def agregar_proceso(self, size, burst_time, prioridad):
+    def agregar_proceso(self, size, burst_time, prioridad, probabilidad_io=None):
         """
         Crea y agrega un nuevo proceso al sistema
+        Si hay una exportación en curso, el proceso se escribe en ella
+        """
+        proceso = self.gestor_procesos.crear_proceso(size, burst_time, prioridad)
+        proceso.probabilidad_io = probabilidad_io
+        if self.exportacion is not None:
+            self.exportacion.escribir(self._registro_traza(proceso))
+        return proceso
+
+    def cargar_traza(self, traza, conservar_terminados=False):
         """
-        return self.gestor_procesos.crear_proceso(size, burst_time, prioridad)
+        Carga una traza de procesos; cada uno se crea al llegar su tick de llegada
+        El coordinador pasa a ser dueño del lector y lo cierra al reemplazarlo
+
+        Args:
+            traza: LectorTraza o ruta de un archivo CSV / JSONL
+            conservar_terminados: Conservar los procesos terminados en
+                                  cola_terminados. Por defecto solo se cuentan
+                                  y quedan sus métricas, para que la memoria
+                                  no crezca con la longitud de la traza
+        """
+        self.cerrar_traza()
+        self.traza = LectorTraza(traza) if isinstance(traza, str) else traza
+        self.gestor_procesos.conservar_terminados = conservar_terminados
+
+    def cerrar_traza(self):
+        """
+        Cierra la traza cargada, si hay una, y descarta sus llegadas pendientes
+        """
+        if self.traza is not None:
+            self.traza.cerrar()
+            self.traza = None
+
+    def _recibir_llegadas(self):
+        """
+        Crea los procesos de la traza cuyo tick de llegada ya se alcanzó
+        """
+        for registro in self.traza.extraer_hasta(self.reloj):
+            proceso = self.agregar_proceso(registro['tamano'], registro['rafaga'], registro['prioridad'],
+                                           registro.get('probabilidad_io'))
+            self.eventos.emitir(self.reloj, LLEGADA, proceso.pid, proceso.size)
+
+    @staticmethod
+    def _registro_traza(proceso):
+        """
+        Registro de traza con los datos de creación de un proceso
+        """
+        return {'llegada': proceso.tiempo_llegada, 'tamano': proceso.size,
+                'rafaga': proceso.burst_time_total, 'prioridad': proceso.prioridad,
+                'probabilidad_io': proceso.probabilidad_io}
+
+    def _procesos_creados(self):
+        """
+        Procesos creados hasta ahora que siguen registrados, en orden de llegada
+
+        Raises:
+            ValueError: Si ya terminaron procesos que no se conservaron
+        """
+        gestor = self.gestor_procesos
+        if len(gestor.cola_terminados) != gestor.terminados:
+            raise ValueError("Los procesos terminados no se conservaron (traza cargada): "
+                             "use exportar_llegadas antes de simular")
+        procesos = gestor.obtener_todos_procesos() + gestor.cola_terminados
+        procesos.sort(key=lambda p: (p.tiempo_llegada, p.pid))
+        return procesos
+
+    def exportar_traza(self, ruta, formato=None):
+        """
+        Exporta los procesos creados hasta ahora (de cualquier origen) como traza
+
+        Args:
+            ruta: Archivo de salida (.csv o .jsonl)
+            formato: "csv" o "jsonl"; por defecto según la extensión
+
+        Returns:
+            Número de procesos exportados
+        """
+        registros = (self._registro_traza(p) for p in self._procesos_creados())
+        return escribir_traza(registros, ruta, formato)
+
+    def exportar_llegadas(self, ruta, formato=None):
+        """
+        Exporta como traza los procesos ya creados y, de aquí en adelante,
+        cada proceso en el momento en que se crea (de cualquier origen)
+        Nada se acumula en memoria; cerrar_exportacion termina el archivo
+
+        Args:
+            ruta: Archivo de salida (.csv o .jsonl)
+            formato: "csv" o "jsonl"; por defecto según la extensión
+        """
+        procesos = self._procesos_creados()
+        self.cerrar_exportacion()
+        self.exportacion = EscritorTraza(ruta, formato)
+        for proceso in procesos:
+            self.exportacion.escribir(self._registro_traza(proceso))
+
+    def cerrar_exportacion(self):
+        """
+        Cierra la exportación en curso, si hay una
+
+        Returns:
+            Número de procesos exportados (0 si no había exportación)
+        """
+        if self.exportacion is None:
+            return 0
+        escritos = self.exportacion.cerrar()
+        self.exportacion = None
+        return escritos
+
+    def generar_procesos(self, cantidad):
+        """
+        Crea procesos con atributos aleatorios usando el generador de carga del coordinador
+        Tamaño entre 20 y 200 KB (para que quepan varios en 1024 KB),
+        ráfaga entre 5 y 30 y prioridad entre 1 y 5
+
+        Returns:
+            Lista de procesos creados
+        """
+        rng = self.rng_carga
+        return [self.agregar_proceso(rng.randint(20, 200), rng.randint(5, 30), rng.randint(1, 5))
+                for _ in range(cantidad)]
 
     def cambiar_algoritmo(self, nuevo_algoritmo):
         """
         Cambia el algoritmo de planificación
         """
         self.planificador.algoritmo = nuevo_algoritmo
+        self.metricas.cambiar_algoritmo(nuevo_algoritmo, self.reloj)
+        self.gestor_procesos.cambiar_cola_listos(self.planificador.crear_cola_listos())
 
     def cambiar_estrategia_memoria(self, nueva_estrategia):
         """
@@ -136,6 +607,23 @@ class CoordinadorSO:
         """
         self.memoria.estrategia = nueva_estrategia
 
+    def _crear_memoria(self, memoria_total, estrategia_mem):
+        """
+        Crea el gestor de memoria correspondiente al modo actual
+        """
+        if self.modo_memoria == "Paginación":
+            return GestorMemoriaPaginada(memoria_total, estrategia_mem)
+        return GestorMemoria(memoria_total, estrategia_mem)
+
+    def cambiar_modo_memoria(self, nuevo_modo):
+        """
+        Cambia entre memoria contigua y paginada
+        Reinicia el sistema, ya que los procesos cargados no se pueden migrar
+        """
+        self.modo_memoria = nuevo_modo
+        self.memoria = self._crear_memoria(self.memoria.total_size, self.memoria.estrategia)
+        self.reset_total()
+
     def cambiar_quantum(self, nuevo_quantum):
         """
         Cambia el tamaño del quantum
@@ -148,9 +636,110 @@ class CoordinadorSO:
         """
         self.memoria.reiniciar_memoria(nuevo_tamano)
         self.gestor_procesos.reset_total()
-        self.cpu.reset()
+        for nucleo, cpu in enumerate(self.cpus):
+            cpu.reset()
+            self.planificador.reset_quantum(nucleo)
         self.planificador.limpiar_gantt()
-        self.planificador.reset_quantum()
+        self.reloj = 0
+        self.gestor_procesos.reloj = 0
+        self.gestor_procesos.conservar_terminados = True
+        self.cerrar_traza()
+        self.cerrar_exportacion()
+        self.eventos.limpiar()
+        self.metricas.reiniciar(self.planificador.algoritmo)
+        self._reiniciar_compactacion()
+
+    def estadisticas_nucleos(self):
+        """
+        Uso de cada núcleo y desbalance de carga
+
+        Returns:
+            dict con ticks ocupados y utilización por núcleo, y el desbalance
+            (máximo sobre promedio de ticks ocupados, menos 1; 0 = carga pareja)
+        """
+        ocupados = [cpu.tick_count for cpu in self.cpus]
+        promedio = sum(ocupados) / len(ocupados)
+        return {
+            'ticks_ocupados': ocupados,
+            'utilizacion': [t / self.reloj if self.reloj else 0.0 for t in ocupados],
+            'desbalance': max(ocupados) / promedio - 1 if promedio else 0.0
+        }
+
+    def resumen_metricas(self, algoritmo=None):
+        """
+        Métricas de planificación acumuladas hasta el tick actual
+
+        Args:
+            algoritmo: Algoritmo a consultar; None para todos los usados
+        """
+        return self.metricas.resumen(self.reloj, algoritmo)
+
+    def __getstate__(self):
+        # Un archivo de exportación abierto no se puede copiar: la copia no exporta
+        estado = self.__dict__.copy()
+        estado['exportacion'] = None
+        return estado
+
+    def snapshot(self):
+        """
+        Captura el estado completo del simulador: CPU, colas, mapa de memoria,
+        historia del Gantt, métricas y estado de los generadores aleatorios
+
+        El costo crece con la cantidad de procesos: cada PCB es un objeto que
+        pickle recorre por separado. Con 100 000 procesos tarda del orden de
+        0,6 s (restaurar, 0,4-0,5 s; fork, la suma), no milisegundos; eso
+        requeriría guardar la tabla de procesos en columnas
+
+        Returns:
+            bytes con el estado serializado (pickle, protocolo más alto)
+        """
+        return pickle.dumps(self, pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def restaurar(datos):
+        """
+        Reconstruye un coordinador a partir de un snapshot
+
+        Args:
+            datos: bytes devueltos por snapshot()
+
+        Returns:
+            Nuevo CoordinadorSO en el mismo estado, independiente del original
+        """
+        # La carga crea de golpe un objeto por proceso y por bloque: con el
+        # recolector de ciclos activo los recorrería una y otra vez a mitad de carga
+        activo = gc.isenabled()
+        gc.disable()
+        try:
+            return pickle.loads(datos)
+        finally:
+            if activo:
+                gc.enable()
+
+    def fork(self, algoritmo=None, quantum=None, estrategia_mem=None):
+        """
+        Copia independiente del estado actual para explorar otra rama
+
+        Ambas ramas continúan con el mismo estado de los generadores
+        aleatorios, así que solo difieren por los cambios indicados. Cuesta
+        un snapshot más una restauración (ver snapshot)
+
+        Args:
+            algoritmo: Algoritmo de planificación de la rama (None = el mismo)
+            quantum: Quantum de la rama (None = el mismo)
+            estrategia_mem: Estrategia de asignación de la rama (None = la misma)
+
+        Returns:
+            Nuevo CoordinadorSO
+        """
+        rama = CoordinadorSO.restaurar(self.snapshot())
+        if algoritmo is not None and algoritmo != rama.planificador.algoritmo:
+            rama.cambiar_algoritmo(algoritmo)
+        if quantum is not None:
+            rama.cambiar_quantum(quantum)
+        if estrategia_mem is not None:
+            rama.cambiar_estrategia_memoria(estrategia_mem)
+        return rama
 
     def reset_total(self):
         """
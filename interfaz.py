@@ -4,12 +4,13 @@ Interfaz del simulador del sistema operativo
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 import time
-import random
+from collections import deque
 
 from constantes import *
 from coordinador import CoordinadorSO
+from modulo_eventos import formatear
 from modulo_procesos import PCB
 
 
@@ -30,6 +31,10 @@ class SimuladorApp:
             quantum=3,
             estrategia_mem="First Fit"
         )
+        # Eventos aún no mostrados; solo se formatean los que llegan a verse
+        self.eventos_pendientes = deque(maxlen=LINEAS_LOG)
+        self.coordinador.eventos.suscribir(self.eventos_pendientes.append)
+        self.lineas_log = 0
 
         self.simulando = False
         self.configurar_estilos()
@@ -118,7 +123,7 @@ class SimuladorApp:
 
         # Algoritmo de planificación
         ttk.Label(panel, text="🔄 Algoritmo de Planificación:", style='Header.TLabel').pack(pady=(0, 5))
-        self.cb_algo = ttk.Combobox(panel, values=["Round Robin", "FCFS", "SJF", "Prioridad"], 
+        self.cb_algo = ttk.Combobox(panel, values=list(ALGORITMOS), 
                                     state="readonly", font=('Segoe UI', 9), width=18)
         self.cb_algo.current(0)
         self.cb_algo.pack(pady=(0, 10), fill='x')
@@ -137,12 +142,20 @@ class SimuladorApp:
 
         # Estrategia de memoria
         ttk.Label(panel, text="🧩 Estrategia de Asignación:", style='Header.TLabel').pack(pady=(0, 5))
-        self.cb_mem = ttk.Combobox(panel, values=["First Fit", "Best Fit", "Worst Fit"], 
+        self.cb_mem = ttk.Combobox(panel, values=list(ESTRATEGIAS_MEMORIA), 
                                    state="readonly", font=('Segoe UI', 9), width=18)
         self.cb_mem.current(0)
         self.cb_mem.pack(pady=(0, 10), fill='x')
         self.cb_mem.bind("<<ComboboxSelected>>", self.set_mem)
 
+        # Modo de memoria
+        ttk.Label(panel, text="📄 Modo de Memoria:", style='Header.TLabel').pack(pady=(0, 5))
+        self.cb_modo_mem = ttk.Combobox(panel, values=["Contigua", "Paginación"],
+                                        state="readonly", font=('Segoe UI', 9), width=18)
+        self.cb_modo_mem.current(0)
+        self.cb_modo_mem.pack(pady=(0, 10), fill='x')
+        self.cb_modo_mem.bind("<<ComboboxSelected>>", self.set_modo_mem)
+
         ttk.Separator(panel).pack(fill='x', pady=20)
 
         # Botones de acción
@@ -150,6 +163,12 @@ class SimuladorApp:
                   style='Action.TButton').pack(fill='x', pady=5, ipady=3)
         ttk.Button(panel, text="🎲 Generar Procesos De Forma Aleatorio", command=self.generar_test,
                   style='Action.TButton').pack(fill='x', pady=5, ipady=3)
+        f_traza = ttk.Frame(panel, style='TFrame')
+        f_traza.pack(fill='x', pady=5)
+        ttk.Button(f_traza, text="📂 Cargar Traza", command=self.cargar_traza).pack(
+            side=tk.LEFT, expand=True, fill='x', padx=(0, 3))
+        ttk.Button(f_traza, text="💾 Exportar Traza", command=self.exportar_traza).pack(
+            side=tk.LEFT, expand=True, fill='x', padx=(3, 0))
         self.btn_run = ttk.Button(panel, text="▶ INICIAR SIMULACIÓN", command=self.toggle,
                                   style='Action.TButton')
         self.btn_run.pack(fill='x', pady=(15, 0), ipady=8)
@@ -246,7 +265,7 @@ class SimuladorApp:
         nuevo_algo = self.cb_algo.get()
         self.coordinador.cambiar_algoritmo(nuevo_algo)
         self.log(f"Algoritmo: {nuevo_algo}")
-        if nuevo_algo == "Round Robin":
+        if nuevo_algo in ALGORITMOS_CON_QUANTUM:
             self.entry_quantum.config(state="normal")
             self.btn_set_q.config(state="normal")
         else:
@@ -257,6 +276,17 @@ class SimuladorApp:
         """Cambia la estrategia de memoria"""
         self.coordinador.cambiar_estrategia_memoria(self.cb_mem.get())
 
+    def set_modo_mem(self, e):
+        """Cambia entre memoria contigua y paginada (reinicia el sistema)"""
+        nuevo_modo = self.cb_modo_mem.get()
+        self.simulando = False
+        self.btn_run.config(text="▶ INICIAR SIMULACIÓN")
+        self.coordinador.cambiar_modo_memoria(nuevo_modo)
+        self.update_ui()
+        self.draw_mem()
+        self.limpiar_grafica_gantt()
+        self.log(f"⚠ SISTEMA REINICIADO. Modo de memoria: {nuevo_modo}")
+
     def set_quantum(self):
         """Establece el quantum"""
         try:
@@ -376,17 +406,8 @@ class SimuladorApp:
                     messagebox.showerror("Error", "La cantidad debe ser mayor a 0")
                     return
                 
-                # Generación de procesos aleatorios
-                for _ in range(cantidad):
-                    # Rangos aleatorios definidos:
-                    # Tamaño: Entre 20KB y 200KB (para que quepan varios en 1024KB)
-                    size = random.randint(20, 200)
-                    # Burst Time: Entre 5 seg y 30 seg
-                    burst = random.randint(5, 30)
-                    # Prioridad: Entre 1 y 5
-                    prio = random.randint(1, 5)
-                    
-                    self.coordinador.agregar_proceso(size, burst, prio)
+                # Generación de procesos aleatorios con el generador del coordinador
+                self.coordinador.generar_procesos(cantidad)
                 
                 self.log(f"🎲 Se generaron {cantidad} procesos aleatorios.")
                 self.update_ui()
@@ -404,6 +425,33 @@ class SimuladorApp:
         
         ttk.Button(btn_frame, text="✗ Cancelar", command=top.destroy).pack(side=tk.LEFT, expand=True, padx=(5, 0), ipady=5)
 
+    def cargar_traza(self):
+        """
+        Carga una traza CSV / JSONL; sus procesos se crean al llegar su tick
+        """
+        ruta = filedialog.askopenfilename(title="Cargar traza",
+                                          filetypes=[("Trazas", "*.csv *.jsonl"), ("Todos", "*.*")])
+        if not ruta:
+            return
+        try:
+            # Se conservan los terminados para poder exportar la traza después
+            self.coordinador.cargar_traza(ruta, conservar_terminados=True)
+        except (OSError, ValueError, KeyError) as e:
+            messagebox.showerror("Error", f"No se pudo leer la traza: {e}")
+            return
+        self.log(f"📂 Traza cargada: {ruta}")
+
+    def exportar_traza(self):
+        """
+        Exporta los procesos creados hasta ahora como traza CSV / JSONL
+        """
+        ruta = filedialog.asksaveasfilename(title="Exportar traza", defaultextension=".csv",
+                                            filetypes=[("CSV", "*.csv"), ("JSON Lines", "*.jsonl")])
+        if not ruta:
+            return
+        cantidad = self.coordinador.exportar_traza(ruta)
+        self.log(f"💾 {cantidad} procesos exportados a {ruta}")
+
     def toggle(self):
         """Inicia/pausa la simulación"""
         self.simulando = not self.simulando
@@ -417,17 +465,26 @@ class SimuladorApp:
     def loop(self):
         """Bucle principal de simulación"""
         if not self.simulando: return
-        msgs = self.coordinador.ejecutar_ciclo()
-        for m in msgs: self.log(m)
+        self.coordinador.ejecutar_ciclo()
+        self.mostrar_eventos()
         self.update_ui()
         self.draw_mem()
         self.draw_gantt()
         self.root.after(200, self.loop)
 
+    def mostrar_eventos(self):
+        """Muestra en el log los eventos emitidos desde la última vez"""
+        while self.eventos_pendientes:
+            self.log(formatear(self.eventos_pendientes.popleft()))
+
     def log(self, t):
         """Agrega un mensaje al log"""
-        if int(self.txt_log.index('end-1c').split('.')[0]) > 200:
-            self.txt_log.delete('1.0', '100.0')
+        if self.lineas_log >= LINEAS_LOG:
+            # Se descarta la mitad más antigua
+            mitad = LINEAS_LOG // 2
+            self.txt_log.delete('1.0', f'{mitad + 1}.0')
+            self.lineas_log -= mitad
+        self.lineas_log += 1
         self.txt_log.insert(tk.END, f"[{time.strftime('%H:%M:%S')}] {t}\n")
         self.txt_log.see(tk.END)
 
@@ -469,21 +526,20 @@ class SimuladorApp:
         total_actual = self.coordinador.memoria.total_size
         scale = h / total_actual
 
-        pid_ejecucion = (self.coordinador.gestor_procesos.proceso_ejecucion.pid 
-                        if self.coordinador.gestor_procesos.proceso_ejecucion else None)
+        pids_ejecucion = {p.pid for p in self.coordinador.gestor_procesos.procesos_en_ejecucion()}
 
         y = 0
         for b in self.coordinador.memoria.mapa_memoria:
-            bh = b["size"] * scale
-            if b["estado"] == "OCUPADO":
+            bh = b.size * scale
+            if b.estado == "OCUPADO":
                 proceso = None
                 all_procs = self.coordinador.gestor_procesos.obtener_todos_procesos()
                 for p in all_procs:
-                    if p.pid == b['pid']:
+                    if p.pid == b.pid:
                         proceso = p
                         break
                 
-                if b['pid'] == pid_ejecucion:
+                if b.pid in pids_ejecucion:
                     color = COLOR_EJECUCION
                     outline_color = COLOR_EJECUCION_BRILLO
                     outline_width = 3
@@ -502,24 +558,24 @@ class SimuladorApp:
             self.canvas_mem.create_rectangle(35, y, w - 15, y + bh, fill=color, 
                                              outline=outline_color, width=outline_width)
             
-            if b["estado"] == "OCUPADO" and b['pid'] == pid_ejecucion:
+            if b.estado == "OCUPADO" and b.pid in pids_ejecucion:
                 self.canvas_mem.create_rectangle(35, y, w - 15, y + min(bh * 0.3, 10), 
                                                  fill=COLOR_EJECUCION_BRILLO, 
                                                  outline="", stipple="gray25")
             
             if bh > 15:
-                txt = f"P{b['pid']}" if b['pid'] else "LIBRE"
-                if b['pid'] == pid_ejecucion:
-                    txt = f"⚡ P{b['pid']}"
+                txt = f"P{b.pid}" if b.pid else "LIBRE"
+                if b.pid in pids_ejecucion:
+                    txt = f"⚡ P{b.pid}"
                 self.canvas_mem.create_text((w + 20) / 2, y + bh / 2, text=txt, 
                                            font=("Segoe UI", 9, "bold"),
                                            fill=text_color)
             if bh > 20:
-                size_text = f"{int(b['size'])} KB"
+                size_text = f"{int(b.size)} KB"
                 self.canvas_mem.create_text((w + 20) / 2, y + bh / 2 + 12, text=size_text,
                                            font=("Segoe UI", 7),
                                            fill=text_color)
-            self.canvas_mem.create_text(30, y + 2, text=f"{int(b['start'])}", 
+            self.canvas_mem.create_text(30, y + 2, text=f"{int(b.start)}", 
                                        anchor="nw", font=("Segoe UI", 7),
                                        fill="#7a8499")
             y += bh
@@ -529,44 +585,48 @@ class SimuladorApp:
         self.canvas_gantt.delete("all")
         h = self.canvas_gantt.winfo_height()
         w = self.canvas_gantt.winfo_width()
-        if not self.coordinador.planificador.historia_gantt: return
-        visible = self.coordinador.planificador.historia_gantt[-60:]
-        total = sum(item["duracion"] for item in visible)
-        if total == 0: return
-        scale_x = (w - 20) / max(total, 30)
-        x = 10
+        historias = [hg for hg in self.coordinador.planificador.historias_gantt if hg]
+        if not historias: return
+        fin = max(hg.ultimo_tick() for hg in historias)
+        inicio = max(min(hg.primer_tick() for hg in historias), fin - VENTANA_GANTT)
+        # Ventana mínima de 30 ticks para que los primeros tramos no ocupen todo el ancho
+        fin_ventana = inicio + max(fin - inicio, 30)
         
-        pid_ejecucion = (self.coordinador.gestor_procesos.proceso_ejecucion.pid 
-                        if self.coordinador.gestor_procesos.proceso_ejecucion else None)
+        pids_ejecucion = {p.pid for p in self.coordinador.gestor_procesos.procesos_en_ejecucion()}
         
-        for item in visible:
-            ancho = item["duracion"] * scale_x
-            if ancho < 1: ancho = 1
-            
-            if item['pid'] == pid_ejecucion:
-                color_fill = COLOR_EJECUCION
-                outline_color = COLOR_EJECUCION_BRILLO
-                outline_width = 2
-                text_color = "#000000"
-            else:
-                color_fill = item["color"]
-                outline_color = "#2a3441"
-                outline_width = 1
-                text_color = COLOR_TEXTO_CLARO
-            
-            self.canvas_gantt.create_rectangle(x, 12, x + ancho, h - 12, 
-                                               fill=color_fill, outline=outline_color, width=outline_width)
-            if ancho > 25:
-                self.canvas_gantt.create_text(x + ancho / 2, h / 2, 
-                                             text=f"P{item['pid']}", 
-                                             font=("Segoe UI", 9, "bold"),
-                                             fill=text_color)
-            elif ancho > 15:
-                self.canvas_gantt.create_text(x + ancho / 2, h / 2, 
-                                             text=f"P{item['pid']}", 
-                                             font=("Segoe UI", 7),
-                                             fill=text_color)
-            x += ancho
+        # Un carril por núcleo
+        carriles = self.coordinador.planificador.historias_gantt
+        alto = (h - 24) / len(carriles)
+        for nucleo, historia in enumerate(carriles):
+            y0 = 12 + nucleo * alto
+            y1 = y0 + alto - (2 if len(carriles) > 1 else 0)
+            for pid, x0, x1 in historia.muestrear(inicio, fin_ventana, int(w - 20)):
+                x = 10 + x0
+                ancho = x1 - x0
+                
+                if pid in pids_ejecucion:
+                    color_fill = COLOR_EJECUCION
+                    outline_color = COLOR_EJECUCION_BRILLO
+                    outline_width = 2
+                    text_color = "#000000"
+                else:
+                    color_fill = get_color_proceso(pid)
+                    outline_color = "#2a3441"
+                    outline_width = 1
+                    text_color = COLOR_TEXTO_CLARO
+                
+                self.canvas_gantt.create_rectangle(x, y0, x + ancho, y1, 
+                                                   fill=color_fill, outline=outline_color, width=outline_width)
+                if ancho > 25 and alto > 14:
+                    self.canvas_gantt.create_text(x + ancho / 2, (y0 + y1) / 2, 
+                                                 text=f"P{pid}", 
+                                                 font=("Segoe UI", 9, "bold"),
+                                                 fill=text_color)
+                elif ancho > 15 and alto > 10:
+                    self.canvas_gantt.create_text(x + ancho / 2, (y0 + y1) / 2, 
+                                                 text=f"P{pid}", 
+                                                 font=("Segoe UI", 7),
+                                                 fill=text_color)
 
     def limpiar_grafica_gantt(self):
         """Limpia el gráfico de Gantt"""
@@ -584,23 +644,22 @@ class SimuladorApp:
 
         found = None
         for b in self.coordinador.memoria.mapa_memoria:
-            if b["start"] <= my < b["start"] + b["size"]: 
+            if b.start <= my < b.start + b.size: 
                 found = b
                 break
         
-        pid_ejecucion = (self.coordinador.gestor_procesos.proceso_ejecucion.pid 
-                        if self.coordinador.gestor_procesos.proceso_ejecucion else None)
+        pids_ejecucion = {p.pid for p in self.coordinador.gestor_procesos.procesos_en_ejecucion()}
         
         if found:
-            if found["estado"] == "OCUPADO":
-                if found['pid'] == pid_ejecucion:
-                    estado_text = f"⚡ EJECUTANDO | PID: P{found['pid']} | Tamaño: {found['size']} KB | Inicio: {found['start']} KB"
+            if found.estado == "OCUPADO":
+                if found.pid in pids_ejecucion:
+                    estado_text = f"⚡ EJECUTANDO | PID: P{found.pid} | Tamaño: {found.size} KB | Inicio: {found.start} KB"
                     self.lbl_hover.config(text=estado_text, foreground=COLOR_TEXTO_DORADO)
                 else:
-                    estado_text = f"🔵 OCUPADO | PID: P{found['pid']} | Tamaño: {found['size']} KB | Inicio: {found['start']} KB"
+                    estado_text = f"🔵 OCUPADO | PID: P{found.pid} | Tamaño: {found.size} KB | Inicio: {found.start} KB"
                     self.lbl_hover.config(text=estado_text, foreground=COLOR_TEXTO_CLARO)
             else:
-                estado_text = f"⚪ LIBRE | Tamaño: {found['size']} KB | Inicio: {found['start']} KB"
+                estado_text = f"⚪ LIBRE | Tamaño: {found.size} KB | Inicio: {found.start} KB"
                 self.lbl_hover.config(text=estado_text, foreground="#7a8499")
         else:
             self.lbl_hover.config(text="Pasa el mouse sobre la memoria para ver detalles", 
@@ -1,14 +1,24 @@
 """
 Archivo Principal del Simulador del Sistema Operativo
 Integra todos los módulos y ejecuta la aplicación
+
+Uso:
+    python main.py                 Interfaz gráfica
+    python main.py --headless ...  Simulación por lotes (ver simulacion.py --help)
 """
 
-import tkinter as tk
-from interfaz import SimuladorApp
+import sys
 
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--headless":
+        # Sin interfaz: no se importa tkinter
+        from simulacion import main
+        sys.exit(main(sys.argv[2:]))
+
+    import tkinter as tk
+    from interfaz import SimuladorApp
+
     root = tk.Tk()
     app = SimuladorApp(root)
     root.mainloop()
-
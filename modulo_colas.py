@@ -0,0 +1,457 @@
+"""
+Módulo de Colas
+Estructuras de datos para las colas de procesos del simulador
+"""
+
+import heapq
+from array import array
+from collections import deque
+
+SIN_PROCESO = 1 << 62  # Hoja del árbol de admisión sin proceso pendiente
+
+
+class ColaAdmision:
+    """
+    Cola de procesos nuevos en orden de llegada (PID)
+
+    Cada proceso ocupa una posición en orden de llegada y un árbol de
+    segmentos de mínimos sobre las posiciones guarda el menor tamaño
+    solicitado de cada rango. Así se sabe en O(1) si algún proceso cabe en
+    el bloque libre más grande y se encuentra en O(log n) el primero que
+    cabe, sin sacar de la cola a los que no caben
+    """
+    def __init__(self):
+        self.pendientes = {}  # pid -> proceso, en orden de llegada
+        self.posiciones = {}  # pid -> posición en el árbol
+        self._reconstruir()
+
+    def _reconstruir(self):
+        """
+        Reasigna las posiciones a los procesos pendientes, descartando las de
+        los ya quitados, con lugar para otros tantos procesos nuevos
+        """
+        vivos = list(self.pendientes.values())
+        self.hojas = 1
+        while self.hojas < 2 * len(vivos):
+            self.hojas *= 2
+        self.arbol = array('q', [SIN_PROCESO]) * (2 * self.hojas)
+        self.ranuras = vivos + [None] * (self.hojas - len(vivos))
+        self.ocupadas = len(vivos)
+        self.posiciones = {}
+        for pos, proceso in enumerate(vivos):
+            self.posiciones[proceso.pid] = pos
+            self.arbol[self.hojas + pos] = proceso.size
+        for i in range(self.hojas - 1, 0, -1):
+            self.arbol[i] = min(self.arbol[2 * i], self.arbol[2 * i + 1])
+
+    def _actualizar_hoja(self, pos, valor):
+        """
+        Actualiza la hoja de una posición y propaga el mínimo hacia la raíz
+        """
+        arbol = self.arbol
+        i = pos + self.hojas
+        arbol[i] = valor
+        i //= 2
+        while i:
+            izq = arbol[2 * i]
+            der = arbol[2 * i + 1]
+            nuevo = izq if izq <= der else der
+            if arbol[i] == nuevo:
+                break
+            arbol[i] = nuevo
+            i //= 2
+
+    def agregar(self, proceso):
+        """
+        Agrega un proceso que espera memoria
+        """
+        if self.ocupadas == self.hojas:
+            self._reconstruir()
+        pos = self.ocupadas
+        self.ocupadas += 1
+        self.ranuras[pos] = proceso
+        self.pendientes[proceso.pid] = proceso
+        self.posiciones[proceso.pid] = pos
+        self._actualizar_hoja(pos, proceso.size)
+
+    def quitar(self, proceso):
+        """
+        Quita un proceso de la cola
+        """
+        pos = self.posiciones.pop(proceso.pid, None)
+        if pos is None:
+            return
+        del self.pendientes[proceso.pid]
+        self.ranuras[pos] = None
+        self._actualizar_hoja(pos, SIN_PROCESO)
+
+    def tamano_minimo(self):
+        """
+        Retorna el menor tamaño solicitado en la cola, o None si está vacía
+        """
+        return self.arbol[1] if self.pendientes else None
+
+    def siguiente_admisible(self, limite, desde=0):
+        """
+        Primer proceso (en orden de llegada) desde una posición cuyo tamaño
+        no supera el límite. No lo saca de la cola
+
+        Returns:
+            Tupla (posición, proceso), o None si ninguno cabe
+        """
+        if self.arbol[1] > limite:
+            return None
+        pos = self._buscar_desde(1, 0, self.hojas, desde, limite)
+        return None if pos is None else (pos, self.ranuras[pos])
+
+    def _buscar_desde(self, nodo, izq, der, desde, limite):
+        """
+        Búsqueda recursiva en el árbol limitada al rango [desde, fin)
+        """
+        if der <= desde or self.arbol[nodo] > limite:
+            return None
+        if der - izq == 1:
+            return izq
+        medio = (izq + der) // 2
+        pos = self._buscar_desde(2 * nodo, izq, medio, desde, limite)
+        if pos is None:
+            pos = self._buscar_desde(2 * nodo + 1, medio, der, desde, limite)
+        return pos
+
+    def __contains__(self, proceso):
+        return proceso.pid in self.pendientes
+
+    def __iter__(self):
+        return iter(list(self.pendientes.values()))
+
+    def __len__(self):
+        return len(self.pendientes)
+
+
+class ColaListos:
+    """
+    Cola de procesos listos
+
+    Con clave de orden se respalda en un heap de entradas
+    [clave, orden de llegada, proceso], donde el orden de llegada desempata
+    claves iguales en FIFO (O(log n) por inserción y extracción).
+    Sin clave (Round Robin, FCFS) es una deque FIFO con costo O(1).
+    Quitar un proceso solo marca su entrada, que se descarta al llegar al frente
+    """
+    def __init__(self, clave=None):
+        """
+        Args:
+            clave: Función proceso -> valor de orden (menor sale primero).
+                   None equivale a FIFO puro
+        """
+        self.clave = clave
+        self.entradas = {}
+        self.contador = 0
+        self.heap = []
+        self.fifo = deque()
+
+    def agregar(self, proceso):
+        """
+        Inserta un proceso: O(1) en FIFO, O(log n) con clave
+        """
+        entrada = [0, self.contador, proceso]
+        self.contador += 1
+        self.entradas[proceso.pid] = entrada
+        if self.clave is None:
+            self.fifo.append(entrada)
+        else:
+            entrada[0] = self.clave(proceso)
+            heapq.heappush(self.heap, entrada)
+
+    def quitar(self, proceso):
+        """
+        Quita un proceso de la cola en O(1) (borrado perezoso)
+        """
+        entrada = self.entradas.pop(proceso.pid, None)
+        if entrada is not None:
+            entrada[2] = None
+
+    def primero(self):
+        """
+        Retorna el proceso al frente de la cola sin sacarlo, o None si está vacía
+        """
+        if self.clave is None:
+            fifo = self.fifo
+            while fifo and fifo[0][2] is None:
+                fifo.popleft()
+            return fifo[0][2] if fifo else None
+        heap = self.heap
+        while heap and heap[0][2] is None:
+            heapq.heappop(heap)
+        return heap[0][2] if heap else None
+
+    def sacar(self):
+        """
+        Saca y retorna el proceso al frente de la cola, o None si está vacía
+        """
+        proceso = self.primero()
+        if proceso is not None:
+            self.quitar(proceso)
+        return proceso
+
+    def limpiar(self):
+        """
+        Vacía la cola conservando su clave de orden
+        """
+        self.entradas = {}
+        self.heap = []
+        self.fifo = deque()
+
+    def __contains__(self, proceso):
+        return proceso.pid in self.entradas
+
+    def __iter__(self):
+        return iter([e[2] for e in self.entradas.values()])
+
+    def __len__(self):
+        return len(self.entradas)
+
+
+class ColaMultinivel:
+    """
+    Cola de listos para MLFQ: una deque FIFO por nivel de prioridad
+
+    Encolar y desencolar son O(1) (más un recorrido de los niveles, que son
+    pocos). El nivel de cada proceso lo indica la función 'nivel'
+    """
+    def __init__(self, niveles, nivel):
+        """
+        Args:
+            niveles: Número de niveles (0 = máxima prioridad)
+            nivel: Función proceso -> nivel actual del proceso
+        """
+        self.nivel = nivel
+        self.niveles = [deque() for _ in range(niveles)]
+        self.vivos = [0] * niveles
+        self.entradas = {}
+        self.contador = 0
+
+    def agregar(self, proceso):
+        """
+        Encola un proceso al final de la cola de su nivel
+        """
+        nivel = min(self.nivel(proceso), len(self.niveles) - 1)
+        entrada = [nivel, self.contador, proceso]
+        self.contador += 1
+        self.entradas[proceso.pid] = entrada
+        self.niveles[nivel].append(entrada)
+        self.vivos[nivel] += 1
+
+    def quitar(self, proceso):
+        """
+        Quita un proceso de la cola en O(1) (borrado perezoso)
+        """
+        entrada = self.entradas.pop(proceso.pid, None)
+        if entrada is not None:
+            entrada[2] = None
+            self.vivos[entrada[0]] -= 1
+
+    def primero(self):
+        """
+        Retorna el primer proceso del nivel más prioritario no vacío
+        """
+        for nivel, cola in enumerate(self.niveles):
+            if self.vivos[nivel]:
+                while cola[0][2] is None:
+                    cola.popleft()
+                return cola[0][2]
+        return None
+
+    def sacar(self):
+        """
+        Saca y retorna el primer proceso del nivel más prioritario no vacío
+        """
+        proceso = self.primero()
+        if proceso is not None:
+            self.quitar(proceso)
+        return proceso
+
+    def nivel_primero(self):
+        """
+        Nivel del proceso que saldría a continuación, o None si está vacía
+        """
+        for nivel in range(len(self.niveles)):
+            if self.vivos[nivel]:
+                return nivel
+        return None
+
+    def boost(self):
+        """
+        Sube todos los procesos encolados al nivel 0, respetando el orden
+        de los niveles y el FIFO dentro de cada uno
+        """
+        superior = self.niveles[0]
+        for nivel in range(1, len(self.niveles)):
+            for entrada in self.niveles[nivel]:
+                if entrada[2] is not None:
+                    entrada[0] = 0
+                    superior.append(entrada)
+            self.niveles[nivel] = deque()
+            self.vivos[0] += self.vivos[nivel]
+            self.vivos[nivel] = 0
+
+    def limpiar(self):
+        """
+        Vacía todos los niveles
+        """
+        self.niveles = [deque() for _ in self.niveles]
+        self.vivos = [0] * len(self.niveles)
+        self.entradas = {}
+
+    def __contains__(self, proceso):
+        return proceso.pid in self.entradas
+
+    def __iter__(self):
+        return iter([e[2] for e in self.entradas.values()])
+
+    def __len__(self):
+        return len(self.entradas)
+
+
+class ColasPorNucleo:
+    """
+    Colas de listos separadas por núcleo, con robo de trabajo
+
+    Cada proceso vuelve a la cola del núcleo donde se ejecutó por última vez
+    (afinidad, proceso.nucleo); uno que nunca se ejecutó va a la cola más
+    corta. Un núcleo con su cola vacía toma el primero de la cola más larga
+    """
+    def __init__(self, colas):
+        """
+        Args:
+            colas: Una cola de listos (ColaListos o ColaMultinivel) por núcleo
+        """
+        self.colas = colas
+
+    def agregar(self, proceso):
+        """
+        Encola un proceso en la cola de su núcleo
+        """
+        indice = proceso.nucleo
+        if indice is None or indice >= len(self.colas):
+            indice = min(range(len(self.colas)), key=self._longitud)
+            proceso.nucleo = indice
+        self.colas[indice].agregar(proceso)
+
+    def _longitud(self, indice):
+        return len(self.colas[indice])
+
+    def quitar(self, proceso):
+        """
+        Quita un proceso de la cola de su núcleo
+        """
+        if proceso.nucleo is not None and proceso.nucleo < len(self.colas):
+            self.colas[proceso.nucleo].quitar(proceso)
+
+    def primero_de(self, nucleo, robar=True):
+        """
+        Primer proceso para un núcleo: el de su propia cola o, si está vacía
+        y se permite robar, el primero de la cola más larga
+
+        Returns:
+            Proceso o None si no hay trabajo disponible
+        """
+        proceso = self.colas[nucleo].primero()
+        if proceso is None and robar:
+            victima = max(range(len(self.colas)), key=self._longitud)
+            proceso = self.colas[victima].primero()
+        return proceso
+
+    def primero(self):
+        return self.primero_de(0)
+
+    def boost(self):
+        """
+        Aplica el boost de MLFQ en todas las colas
+        """
+        for cola in self.colas:
+            cola.boost()
+
+    def limpiar(self):
+        for cola in self.colas:
+            cola.limpiar()
+
+    def __contains__(self, proceso):
+        return any(proceso in cola for cola in self.colas)
+
+    def __iter__(self):
+        return iter([proceso for cola in self.colas for proceso in cola])
+
+    def __len__(self):
+        return sum(len(cola) for cola in self.colas)
+
+
+class ColaBloqueados:
+    """
+    Cola de procesos bloqueados por I/O ordenada por tick de despertar
+
+    Se respalda en un heap de entradas [tick de despertar, orden de llegada,
+    proceso]: cada tick solo toca a los procesos que despiertan, así que
+    miles de procesos bloqueados no cuestan nada mientras esperan.
+    Quitar un proceso solo marca su entrada, que se descarta al llegar al frente
+    """
+    def __init__(self):
+        self.entradas = {}
+        self.contador = 0
+        self.heap = []
+
+    def agregar(self, proceso):
+        """
+        Inserta un proceso que despierta en proceso.tick_despertar, O(log n)
+        """
+        entrada = [proceso.tick_despertar, self.contador, proceso]
+        self.contador += 1
+        self.entradas[proceso.pid] = entrada
+        heapq.heappush(self.heap, entrada)
+
+    def quitar(self, proceso):
+        """
+        Quita un proceso de la cola en O(1) (borrado perezoso)
+        """
+        entrada = self.entradas.pop(proceso.pid, None)
+        if entrada is not None:
+            entrada[2] = None
+
+    def proximo_despertar(self):
+        """
+        Tick en que despierta el próximo proceso, o None si la cola está vacía
+        """
+        heap = self.heap
+        while heap and heap[0][2] is None:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def extraer_despiertos(self, reloj):
+        """
+        Saca los procesos cuyo tick de despertar ya llegó
+
+        Returns:
+            Lista de procesos en orden de despertar (y de llegada si empatan)
+        """
+        despiertos = []
+        heap = self.heap
+        while heap and (heap[0][2] is None or heap[0][0] <= reloj):
+            entrada = heapq.heappop(heap)
+            proceso = entrada[2]
+            if proceso is not None:
+                del self.entradas[proceso.pid]
+                despiertos.append(proceso)
+        return despiertos
+
+    def limpiar(self):
+        self.entradas = {}
+        self.heap = []
+
+    def __contains__(self, proceso):
+        return proceso.pid in self.entradas
+
+    def __iter__(self):
+        return iter([e[2] for e in self.entradas.values()])
+
+    def __len__(self):
+        return len(self.entradas)
@@ -5,15 +5,39 @@ Gestiona la unidad de tiempo (tick) y la ejecución de procesos
 
 import random
 
+from constantes import ALGORITMOS_CON_QUANTUM
+from modulo_io import ModeloIO
+
 
 class CPU:
     """
     Representa la CPU del sistema
     Gestiona la unidad de tiempo (tick) y la ejecución de procesos
     """
-    def __init__(self):
+    def __init__(self, rng=None, modelo_io=None):
+        """
+        Args:
+            rng: Generador aleatorio (random.Random) para la I/O; los núcleos
+                 de una misma máquina lo comparten
+            modelo_io: Modelo de bloqueo por I/O (ModeloIO por defecto)
+        """
         self.tick_count = 0
         self.proceso_actual = None
+        self.rng = rng if rng is not None else random.Random()
+        self.modelo_io = modelo_io if modelo_io is not None else ModeloIO()
+
+    def avanzar_ticks(self, proceso, ticks, con_io=False):
+        """
+        Ejecuta de una vez varios ticks sin eventos (ni fin, ni quantum, ni I/O)
+
+        Args:
+            con_io: Si en esos ticks corre la cuenta hacia el próximo bloqueo
+        """
+        self.tick_count += ticks
+        proceso.pc += ticks
+        proceso.burst_time_restante -= ticks
+        if con_io:
+            proceso.ticks_hasta_io -= ticks
 
     def ejecutar_tick(self, proceso, algoritmo="Round Robin", quantum=3, contador_quantum=0):
         """
@@ -22,13 +46,13 @@ class CPU:
         Args:
             proceso: Proceso que se está ejecutando
             algoritmo: Algoritmo de planificación actual
-            quantum: Tamaño del quantum para Round Robin
+            quantum: Tamaño del quantum (Round Robin, o el del nivel actual en MLFQ)
             contador_quantum: Contador actual del quantum
             
         Returns:
             dict con información del tick:
             - 'proceso_terminado': True si el proceso terminó
-            - 'quantum_agotado': True si se agotó el quantum (solo RR)
+            - 'quantum_agotado': True si se agotó el quantum (RR y MLFQ)
             - 'bloqueado_io': True si el proceso se bloqueó por I/O
             - 'tiempo_bloqueo': Tiempo de bloqueo si se bloqueó
             - 'nuevo_contador_quantum': Nuevo valor del contador
@@ -57,19 +81,23 @@ class CPU:
             return resultado
 
         # Manejar según el algoritmo
-        if algoritmo == "Round Robin":
+        if algoritmo in ALGORITMOS_CON_QUANTUM:
             nuevo_contador = contador_quantum + 1
             resultado['nuevo_contador_quantum'] = nuevo_contador
             
             if nuevo_contador >= quantum:
                 resultado['quantum_agotado'] = True
                 return resultado
-        else:
-            # Para FCFS, SJF, Prioridad: posibilidad de bloqueo por I/O
-            if random.random() < 0.01:  # 1% de probabilidad de bloqueo
-                tiempo_bloqueo = random.randint(5, 20)
+        if algoritmo != "Round Robin":
+            # Para FCFS, SJF, Prioridad, MLFQ: posibilidad de bloqueo por I/O.
+            # Los ticks hasta el próximo bloqueo se sortean de una vez
+            if proceso.ticks_hasta_io is None:
+                proceso.ticks_hasta_io = self.modelo_io.ticks_hasta_bloqueo(proceso, self.rng)
+            proceso.ticks_hasta_io -= 1
+            if proceso.ticks_hasta_io <= 0:
+                proceso.ticks_hasta_io = None
                 resultado['bloqueado_io'] = True
-                resultado['tiempo_bloqueo'] = tiempo_bloqueo
+                resultado['tiempo_bloqueo'] = self.modelo_io.duracion_bloqueo(proceso, self.rng)
                 return resultado
 
         return resultado
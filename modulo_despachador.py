@@ -9,10 +9,14 @@ class Despachador:
     Despachador de procesos
     Transfiere el control de la CPU al proceso seleccionado
     """
-    def __init__(self):
-        pass
+    def __init__(self, metricas=None):
+        """
+        Args:
+            metricas: MetricasPlanificacion donde registrar el tiempo de respuesta (opcional)
+        """
+        self.metricas = metricas
 
-    def despachar_proceso(self, proceso, gestor_procesos):
+    def despachar_proceso(self, proceso, gestor_procesos, nucleo=0):
         """
         Despacha (asigna CPU) a un proceso
         
@@ -21,6 +25,7 @@ class Despachador:
         Args:
             proceso: Proceso a despachar
             gestor_procesos: Gestor de procesos que contiene las colas
+            nucleo: Núcleo al que se asigna el proceso
             
         Returns:
             True si se despachó correctamente, False en caso contrario
@@ -28,15 +33,22 @@ class Despachador:
         if not proceso:
             return False
 
+        # Remover de la cola de listos si está ahí
+        gestor_procesos.sacar_de_listos(proceso)
+
         # Cambiar estado del proceso a EJECUCION
         proceso.estado = "EJECUCION"
         
-        # Remover de la cola de listos si está ahí
-        if proceso in gestor_procesos.cola_listos:
-            gestor_procesos.cola_listos.remove(proceso)
-        
-        # Asignar como proceso en ejecución
-        gestor_procesos.proceso_ejecucion = proceso
+        # Asignar como proceso en ejecución del núcleo
+        proceso.nucleo = nucleo
+        proceso.tick_despacho = gestor_procesos.reloj
+        gestor_procesos.en_ejecucion[nucleo] = proceso
+
+        # Primer despacho: tiempo de respuesta
+        if proceso.tiempo_primer_despacho is None:
+            proceso.tiempo_primer_despacho = gestor_procesos.reloj
+            if self.metricas:
+                self.metricas.registrar_despacho(proceso)
         
         return True
 
@@ -54,13 +66,13 @@ class Despachador:
         if not proceso:
             return
 
-        proceso.estado = nuevo_estado
-        
-        # Si el proceso vuelve a listos, agregarlo a la cola
-        if nuevo_estado == "LISTO" and proceso not in gestor_procesos.cola_listos:
-            gestor_procesos.cola_listos.append(proceso)
-        
         # Liberar la CPU
-        if gestor_procesos.proceso_ejecucion == proceso:
-            gestor_procesos.proceso_ejecucion = None
+        if proceso.nucleo is not None and gestor_procesos.en_ejecucion[proceso.nucleo] is proceso:
+            gestor_procesos.en_ejecucion[proceso.nucleo] = None
+
+        # Si el proceso vuelve a listos, agregarlo a la cola
+        if nuevo_estado == "LISTO":
+            gestor_procesos.devolver_a_listos(proceso)
+        else:
+            proceso.estado = nuevo_estado
 
@@ -0,0 +1,126 @@
+"""
+Módulo de Eventos
+Flujo de eventos estructurados del simulador, con formato diferido
+"""
+
+from collections import deque
+
+from constantes import CAPACIDAD_EVENTOS
+
+# Tipos de evento
+LLEGADA = "llegada"
+BOOST = "boost"
+ADMISION = "admision"
+COMPACTACION = "compactacion"
+RETORNO_IO = "retorno_io"
+EXPROPIACION = "expropiacion"
+TERMINADO = "terminado"
+DEGRADACION = "degradacion"
+QUANTUM = "quantum"
+BLOQUEO_IO = "bloqueo_io"
+
+# Texto de cada tipo; recibe pid y datos del evento
+FORMATOS = {
+    LLEGADA: "📥 P{pid} llega ({datos} KB).",
+    BOOST: "⏫ [MLFQ] Boost: todos los procesos vuelven al nivel 0.",
+    ADMISION: "✔ P{pid} entra en RAM.",
+    COMPACTACION: ("🧹 Compactación: {datos[kb_movidos]} KB reubicados, "
+                   "fragmentación {datos[fragmentacion_antes]:.0%} → "
+                   "{datos[fragmentacion_despues]:.0%}, costo {datos[ticks]} ticks."),
+    RETORNO_IO: "⬅ P{pid} vuelve de I/O.",
+    EXPROPIACION: "⤵ P{pid} expropiado por P{datos}.",
+    TERMINADO: "★ P{pid} TERMINADO.",
+    DEGRADACION: "⏬ [MLFQ] P{pid} Quantum agotado, baja al nivel {datos}.",
+    QUANTUM: "⏱ [RR] P{pid} Quantum agotado.",
+    BLOQUEO_IO: "✋ P{pid} Bloqueado por I/O.",
+}
+
+
+def formatear(evento):
+    """
+    Texto legible de un evento; solo se llama al mostrarlo
+
+    Args:
+        evento: Tupla (tick, tipo, pid, datos)
+    """
+    _, tipo, pid, datos = evento
+    return FORMATOS[tipo].format(pid=pid, datos=datos)
+
+
+class FlujoEventos:
+    """
+    Registro acotado de eventos (tick, tipo, pid, datos) en un buffer circular
+
+    Emitir un evento solo crea una tupla: ningún texto se arma hasta que un
+    consumidor lo pide con formatear(). Los suscriptores reciben cada evento
+    al emitirse, filtrado por tipo
+    """
+    def __init__(self, capacidad=CAPACIDAD_EVENTOS):
+        """
+        Args:
+            capacidad: Eventos recientes que se conservan
+        """
+        self.buffer = deque(maxlen=capacidad)
+        self.emitidos = 0  # Total emitido: número de secuencia del próximo evento
+        self.suscriptores = []
+
+    def __len__(self):
+        return len(self.buffer)
+
+    def emitir(self, tick, tipo, pid=None, datos=None):
+        """
+        Registra un evento y lo entrega a los suscriptores interesados
+        """
+        evento = (tick, tipo, pid, datos)
+        self.buffer.append(evento)
+        self.emitidos += 1
+        for callback, tipos in self.suscriptores:
+            if tipos is None or tipo in tipos:
+                callback(evento)
+
+    def suscribir(self, callback, tipos=None):
+        """
+        Registra una función que recibe cada evento emitido
+
+        Args:
+            callback: Función que recibe la tupla del evento
+            tipos: Tipos de evento que le interesan (None = todos)
+        """
+        self.suscriptores.append((callback, None if tipos is None else frozenset(tipos)))
+
+    def desuscribir(self, callback):
+        """
+        Quita todas las suscripciones de una función
+        """
+        self.suscriptores = [(c, t) for c, t in self.suscriptores if c != callback]
+
+    def recientes(self, desde=0, tipos=None):
+        """
+        Eventos conservados a partir de un número de secuencia
+
+        Args:
+            desde: Número de secuencia (valor de 'emitidos' en una lectura anterior)
+            tipos: Tipos de evento a incluir (None = todos)
+
+        Returns:
+            Lista de eventos, del más antiguo al más reciente
+        """
+        omitir = desde - (self.emitidos - len(self.buffer))
+        eventos = list(self.buffer)[max(omitir, 0):]
+        if tipos is not None:
+            eventos = [e for e in eventos if e[1] in tipos]
+        return eventos
+
+    def limpiar(self):
+        """
+        Descarta los eventos conservados (los suscriptores se mantienen)
+        """
+        self.buffer.clear()
+        self.emitidos = 0
+
+    def __getstate__(self):
+        # Los suscriptores pertenecen al consumidor (p. ej. la interfaz) y no
+        # forman parte del estado simulado: un snapshot no los arrastra
+        estado = self.__dict__.copy()
+        estado['suscriptores'] = []
+        return estado
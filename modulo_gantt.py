@@ -0,0 +1,213 @@
+"""
+Módulo del Gantt
+Historial acotado de ejecución de la CPU para el gráfico de Gantt
+"""
+
+from array import array
+
+from constantes import CAPACIDAD_GANTT, NIVELES_RESUMEN_GANTT, FACTOR_RESUMEN_GANTT
+
+
+class HistoriaGantt:
+    """
+    Historial de ejecución codificado por tramos (run-length) en un buffer circular
+
+    Cada tramo guarda pid, tick de inicio y duración en columnas array.
+    Además mantiene un resumen multirresolución: en el nivel k la línea de
+    tiempo se divide en cubetas de FACTOR**k ticks y cada cubeta guarda el
+    pid que más ticks ejecutó en ella. Así cualquier ventana se dibuja con
+    un costo proporcional a los píxeles y no a los tramos
+    """
+    def __init__(self, capacidad=CAPACIDAD_GANTT, niveles=NIVELES_RESUMEN_GANTT,
+                 factor=FACTOR_RESUMEN_GANTT):
+        """
+        Args:
+            capacidad: Tramos (y cubetas por nivel) que se conservan
+            niveles: Niveles del resumen (además de los tramos exactos)
+            factor: Relación de ticks por cubeta entre niveles consecutivos
+        """
+        self.capacidad = capacidad
+        self.anchos = [factor ** k for k in range(1, niveles + 1)]
+        self.limpiar()
+
+    def limpiar(self):
+        """
+        Vacía el historial
+        """
+        cap = self.capacidad
+        self.pids = array('l', [0]) * cap
+        self.inicios = array('q', [0]) * cap
+        self.duraciones = array('q', [0]) * cap
+        self.cabeza = 0  # Posición del tramo más antiguo
+        self.cantidad = 0
+
+        # Resumen: por nivel, pid dominante y número de cubeta de cada posición
+        self.resumen_pids = [array('l', [0]) * cap for _ in self.anchos]
+        self.resumen_cubetas = [array('q', [-1]) * cap for _ in self.anchos]
+        self.cubeta_actual = [-1] * len(self.anchos)
+        self.conteos_actuales = [{} for _ in self.anchos]
+
+    def __len__(self):
+        return self.cantidad
+
+    def _posicion(self, i):
+        """
+        Posición física del i-ésimo tramo (0 = el más antiguo)
+        """
+        return (self.cabeza + i) % self.capacidad
+
+    def registrar(self, pid, inicio, duracion=1):
+        """
+        Registra que el proceso pid ejecutó 'duracion' ticks desde 'inicio'
+        Si continúa el último tramo sin huecos, solo se extiende
+        """
+        if self.cantidad:
+            ultimo = self._posicion(self.cantidad - 1)
+            if self.pids[ultimo] == pid and self.inicios[ultimo] + self.duraciones[ultimo] == inicio:
+                self.duraciones[ultimo] += duracion
+                self._resumir(pid, inicio, duracion)
+                return
+
+        if self.cantidad == self.capacidad:
+            # Buffer lleno: se sobrescribe el tramo más antiguo
+            pos = self.cabeza
+            self.cabeza = (self.cabeza + 1) % self.capacidad
+        else:
+            pos = self._posicion(self.cantidad)
+            self.cantidad += 1
+        self.pids[pos] = pid
+        self.inicios[pos] = inicio
+        self.duraciones[pos] = duracion
+        self._resumir(pid, inicio, duracion)
+
+    def _resumir(self, pid, inicio, duracion):
+        """
+        Suma los ticks ejecutados a las cubetas de cada nivel del resumen
+        """
+        fin = inicio + duracion
+        for nivel, ancho in enumerate(self.anchos):
+            t = inicio
+            # Las cubetas anteriores a las últimas 'capacidad' se sobrescribirían igual
+            minimo = fin - self.capacidad * ancho
+            if t < minimo:
+                t = minimo - minimo % ancho
+            while t < fin:
+                cubeta = t // ancho
+                if cubeta != self.cubeta_actual[nivel]:
+                    self._cerrar_cubeta(nivel)
+                    self.cubeta_actual[nivel] = cubeta
+                hasta = min(fin, (cubeta + 1) * ancho)
+                conteos = self.conteos_actuales[nivel]
+                conteos[pid] = conteos.get(pid, 0) + hasta - t
+                t = hasta
+
+    def _cerrar_cubeta(self, nivel):
+        """
+        Guarda en el resumen el pid dominante de la cubeta en curso de un nivel
+        """
+        conteos = self.conteos_actuales[nivel]
+        if conteos:
+            cubeta = self.cubeta_actual[nivel]
+            pos = cubeta % self.capacidad
+            self.resumen_pids[nivel][pos] = max(conteos, key=conteos.get)
+            self.resumen_cubetas[nivel][pos] = cubeta
+            self.conteos_actuales[nivel] = {}
+
+    def primer_tick(self):
+        """
+        Tick de inicio del tramo más antiguo conservado
+        """
+        return self.inicios[self.cabeza] if self.cantidad else 0
+
+    def ultimo_tick(self):
+        """
+        Tick en que termina el tramo más reciente
+        """
+        if not self.cantidad:
+            return 0
+        ultimo = self._posicion(self.cantidad - 1)
+        return self.inicios[ultimo] + self.duraciones[ultimo]
+
+    def segmentos(self):
+        """
+        Recorre los tramos conservados como tuplas (pid, inicio, duracion)
+        """
+        for i in range(self.cantidad):
+            pos = self._posicion(i)
+            yield self.pids[pos], self.inicios[pos], self.duraciones[pos]
+
+    def _primer_tramo_desde(self, tick):
+        """
+        Índice lógico del primer tramo que termina después de 'tick' (búsqueda binaria)
+        """
+        izq, der = 0, self.cantidad
+        while izq < der:
+            medio = (izq + der) // 2
+            pos = self._posicion(medio)
+            if self.inicios[pos] + self.duraciones[pos] <= tick:
+                izq = medio + 1
+            else:
+                der = medio
+        return izq
+
+    def _pid_en_cubeta(self, nivel, cubeta):
+        """
+        Pid dominante de una cubeta del resumen (0 si no hubo ejecución)
+        """
+        if cubeta == self.cubeta_actual[nivel]:
+            conteos = self.conteos_actuales[nivel]
+            return max(conteos, key=conteos.get) if conteos else 0
+        pos = cubeta % self.capacidad
+        if self.resumen_cubetas[nivel][pos] == cubeta:
+            return self.resumen_pids[nivel][pos]
+        return 0
+
+    def muestrear(self, inicio, fin, pixeles):
+        """
+        Reduce la ventana [inicio, fin) a 'pixeles' columnas
+
+        Usa los tramos exactos si cada píxel abarca menos ticks que una cubeta
+        del primer nivel, y si no el nivel más grueso cuyas cubetas no superan
+        un píxel. El costo es proporcional a los píxeles
+
+        Returns:
+            Lista de tramos (pid, x_inicio, x_fin) en píxeles, sin los huecos inactivos
+        """
+        if pixeles <= 0 or fin <= inicio:
+            return []
+        ticks_por_pixel = (fin - inicio) / pixeles
+        columnas = []
+
+        if ticks_por_pixel < self.anchos[0]:
+            i = self._primer_tramo_desde(inicio)
+            for x in range(pixeles):
+                t = inicio + (x + 0.5) * ticks_por_pixel
+                while i < self.cantidad:
+                    pos = self._posicion(i)
+                    if self.inicios[pos] + self.duraciones[pos] > t:
+                        break
+                    i += 1
+                pid = 0
+                if i < self.cantidad:
+                    pos = self._posicion(i)
+                    if self.inicios[pos] <= t:
+                        pid = self.pids[pos]
+                columnas.append(pid)
+        else:
+            nivel = 0
+            while nivel + 1 < len(self.anchos) and self.anchos[nivel + 1] <= ticks_por_pixel:
+                nivel += 1
+            ancho = self.anchos[nivel]
+            for x in range(pixeles):
+                t = inicio + (x + 0.5) * ticks_por_pixel
+                columnas.append(self._pid_en_cubeta(nivel, int(t // ancho)))
+
+        # Agrupar píxeles consecutivos del mismo proceso
+        tramos = []
+        x0 = 0
+        for x in range(1, pixeles + 1):
+            if x == pixeles or columnas[x] != columnas[x0]:
+                if columnas[x0]:
+                    tramos.append((columnas[x0], x0, x))
+                x0 = x
+        return tramos
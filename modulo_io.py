@@ -0,0 +1,67 @@
+"""
+Módulo de I/O
+Modelos de bloqueo por I/O de los procesos en ejecución
+"""
+
+import math
+
+from constantes import PROBABILIDAD_IO, DURACION_IO_MIN, DURACION_IO_MAX
+
+
+class ModeloIO:
+    """
+    Modelo de I/O con la misma probabilidad de bloqueo en cada tick para todos los procesos
+
+    En vez de sortear en cada tick si el proceso se bloquea, se sortea de una
+    vez cuántos ticks faltan para el próximo bloqueo (distribución geométrica,
+    equivalente a un sorteo independiente por tick). Así hay un sorteo por
+    bloqueo y no uno por tick
+    """
+    def __init__(self, probabilidad=PROBABILIDAD_IO, duracion_min=DURACION_IO_MIN,
+                 duracion_max=DURACION_IO_MAX):
+        """
+        Args:
+            probabilidad: Probabilidad de bloqueo en cada tick
+            duracion_min, duracion_max: Rango de ticks que dura cada bloqueo
+        """
+        self.probabilidad = probabilidad
+        self.duracion_min = duracion_min
+        self.duracion_max = duracion_max
+
+    def probabilidad_de(self, proceso):
+        """
+        Probabilidad de bloqueo por tick de un proceso
+        """
+        return self.probabilidad
+
+    def ticks_hasta_bloqueo(self, proceso, rng):
+        """
+        Sortea cuántos ticks ejecutará el proceso hasta su próximo bloqueo
+        (el último de ellos es el que se bloquea)
+
+        Returns:
+            Número de ticks >= 1, o math.inf si el proceso nunca se bloquea
+        """
+        p = self.probabilidad_de(proceso)
+        if p <= 0:
+            return math.inf
+        if p >= 1:
+            return 1
+        return int(math.log(1.0 - rng.random()) / math.log(1.0 - p)) + 1
+
+    def duracion_bloqueo(self, proceso, rng):
+        """
+        Sortea cuántos ticks dura un bloqueo
+        """
+        return rng.randint(self.duracion_min, self.duracion_max)
+
+
+class ModeloIOPorProceso(ModeloIO):
+    """
+    Modelo de I/O con probabilidad propia de cada proceso (proceso.probabilidad_io);
+    los procesos sin probabilidad usan la del modelo
+    """
+    def probabilidad_de(self, proceso):
+        if proceso.probabilidad_io is None:
+            return self.probabilidad
+        return proceso.probabilidad_io
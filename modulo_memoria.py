@@ -4,12 +4,339 @@ Contiene los algoritmos de asignación de memoria, búsqueda de memoria disponib
 asignación y liberación de memoria para procesos
 """
 
+from array import array
+from bisect import bisect_left, bisect_right, insort
+
 from constantes import MEMORIA_DEFAULT
 
+# Parámetros de TLSF: cada primer nivel (potencia de dos) se divide en
+# 2**TLSF_SL_BITS clases de tamaño lineales
+TLSF_SL_BITS = 4
+TLSF_SL_COUNT = 1 << TLSF_SL_BITS
+
+# Bloques libres por cubeta del índice por dirección; una cubeta se parte al
+# llegar al doble
+CUBETA_LIBRES = 64
+
+# Códigos del índice por tamaño: tamaño << BITS_DIRECCION | inicio, así el
+# orden por código es por tamaño y a igual tamaño por dirección
+BITS_DIRECCION = 32
+MASCARA_DIRECCION = (1 << BITS_DIRECCION) - 1
+
+# Enlace nulo de las columnas anterior/siguiente
+SIN_BLOQUE = -1
+
+
+def clase_tlsf(tamano):
+    """
+    Retorna la clase (primer nivel, segundo nivel) TLSF de un tamaño
+    """
+    if tamano < TLSF_SL_COUNT:
+        return 0, tamano
+    msb = tamano.bit_length() - 1
+    return msb - TLSF_SL_BITS + 1, (tamano >> (msb - TLSF_SL_BITS)) - TLSF_SL_COUNT
+
+
+class IndiceLibres:
+    """
+    Índice de bloques libres ordenado por tamaño y por dirección
+
+    Cada bloque se identifica por su ranura en las columnas de GestorMemoria.
+    Mantiene tres estructuras sincronizadas con el mapa de memoria, todas en
+    columnas array('q') de tamaño proporcional a la cantidad de bloques libres
+    (no a la memoria total):
+    - Un array ordenado de códigos tamaño << BITS_DIRECCION | inicio para
+      Best Fit y Worst Fit: búsqueda O(log n); insertar o quitar desplaza el
+      array (memmove O(n))
+    - Los bloques libres ordenados por dirección en cubetas de hasta
+      2 * CUBETA_LIBRES, con un árbol de segmentos de máximos sobre las
+      cubetas, para encontrar el primer bloque que cabe (First Fit, Next Fit)
+      en O(log n + CUBETA_LIBRES) sin recorrer el mapa
+    - Listas segregadas por clase TLSF con mapas de bits de dos niveles
+    """
+    def __init__(self, total_size):
+        self.por_tamano = array('q')
+
+        # Cubetas por dirección: inicios, tamaños y ranuras en arrays paralelos
+        self.cubetas_inicios = []
+        self.cubetas_tamanos = []
+        self.cubetas_ranuras = []
+        self.primeros = array('q')  # Primer inicio de cada cubeta (para ubicarla con bisect)
+        self._reconstruir_arbol()
+
+        niveles = clase_tlsf(max(total_size, 1))[0] + 1
+        self.tlsf_fl = 0
+        self.tlsf_sl = [0] * niveles
+        self.tlsf_listas = [array('q') for _ in range(niveles * TLSF_SL_COUNT)]
+        self.tlsf_pos = array('q')  # Posición de cada ranura en su lista TLSF
+
+    def _reconstruir_arbol(self):
+        """
+        Rehace el árbol de máximos cuando cambia la cantidad de cubetas
+        """
+        cantidad = len(self.cubetas_tamanos)
+        self.hojas = 1
+        while self.hojas < max(cantidad, 1):
+            self.hojas *= 2
+        arbol = array('q', bytes(8 * 2 * self.hojas))
+        for k, tamanos in enumerate(self.cubetas_tamanos):
+            arbol[self.hojas + k] = max(tamanos)
+        for i in range(self.hojas - 1, 0, -1):
+            izq = arbol[2 * i]
+            der = arbol[2 * i + 1]
+            arbol[i] = izq if izq >= der else der
+        self.arbol = arbol
+
+    def _cubeta(self, inicio):
+        """
+        Índice de la cubeta donde está (o iría) la dirección
+        """
+        k = bisect_right(self.primeros, inicio) - 1
+        return k if k > 0 else 0
+
+    def _actualizar_hoja(self, k, valor):
+        """
+        Actualiza el máximo de la cubeta k y lo propaga hacia la raíz
+        """
+        arbol = self.arbol
+        i = k + self.hojas
+        arbol[i] = valor
+        i //= 2
+        while i:
+            izq = arbol[2 * i]
+            der = arbol[2 * i + 1]
+            nuevo = izq if izq >= der else der
+            if arbol[i] == nuevo:
+                break
+            arbol[i] = nuevo
+            i //= 2
+
+    def agregar(self, inicio, tamano, ranura):
+        """
+        Registra un bloque libre en el índice
+        """
+        insort(self.por_tamano, tamano << BITS_DIRECCION | inicio)
+
+        if not self.cubetas_inicios:
+            self.cubetas_inicios.append(array('q', (inicio,)))
+            self.cubetas_tamanos.append(array('q', (tamano,)))
+            self.cubetas_ranuras.append(array('q', (ranura,)))
+            self.primeros.append(inicio)
+            self._reconstruir_arbol()
+        else:
+            k = self._cubeta(inicio)
+            inicios = self.cubetas_inicios[k]
+            tamanos = self.cubetas_tamanos[k]
+            ranuras = self.cubetas_ranuras[k]
+            j = bisect_left(inicios, inicio)
+            inicios.insert(j, inicio)
+            tamanos.insert(j, tamano)
+            ranuras.insert(j, ranura)
+            if j == 0:
+                self.primeros[k] = inicio
+            if len(inicios) > 2 * CUBETA_LIBRES:
+                # Partir la cubeta en dos mitades
+                self.cubetas_inicios.insert(k + 1, inicios[CUBETA_LIBRES:])
+                self.cubetas_tamanos.insert(k + 1, tamanos[CUBETA_LIBRES:])
+                self.cubetas_ranuras.insert(k + 1, ranuras[CUBETA_LIBRES:])
+                self.primeros.insert(k + 1, inicios[CUBETA_LIBRES])
+                del inicios[CUBETA_LIBRES:]
+                del tamanos[CUBETA_LIBRES:]
+                del ranuras[CUBETA_LIBRES:]
+                self._reconstruir_arbol()
+            elif tamano > self.arbol[self.hojas + k]:
+                self._actualizar_hoja(k, tamano)
+
+        fl, sl = clase_tlsf(tamano)
+        lista = self.tlsf_listas[fl * TLSF_SL_COUNT + sl]
+        if ranura >= len(self.tlsf_pos):
+            self.tlsf_pos.frombytes(bytes(8 * (ranura + 1 - len(self.tlsf_pos))))
+        self.tlsf_pos[ranura] = len(lista)
+        lista.append(ranura)
+        self.tlsf_sl[fl] |= 1 << sl
+        self.tlsf_fl |= 1 << fl
+
+    def quitar(self, inicio, tamano, ranura):
+        """
+        Elimina un bloque libre del índice
+        """
+        i = bisect_left(self.por_tamano, tamano << BITS_DIRECCION | inicio)
+        del self.por_tamano[i]
+
+        k = self._cubeta(inicio)
+        inicios = self.cubetas_inicios[k]
+        tamanos = self.cubetas_tamanos[k]
+        j = bisect_left(inicios, inicio)
+        del inicios[j]
+        del tamanos[j]
+        del self.cubetas_ranuras[k][j]
+        if not inicios:
+            del self.cubetas_inicios[k]
+            del self.cubetas_tamanos[k]
+            del self.cubetas_ranuras[k]
+            del self.primeros[k]
+            self._reconstruir_arbol()
+        else:
+            if j == 0:
+                self.primeros[k] = inicios[0]
+            if tamano == self.arbol[self.hojas + k]:
+                self._actualizar_hoja(k, max(tamanos))
+
+        # Quitar de la lista TLSF intercambiando con el último elemento
+        fl, sl = clase_tlsf(tamano)
+        lista = self.tlsf_listas[fl * TLSF_SL_COUNT + sl]
+        pos = self.tlsf_pos[ranura]
+        ultima = lista.pop()
+        if ultima != ranura:
+            lista[pos] = ultima
+            self.tlsf_pos[ultima] = pos
+        if not lista:
+            self.tlsf_sl[fl] &= ~(1 << sl)
+            if not self.tlsf_sl[fl]:
+                self.tlsf_fl &= ~(1 << fl)
+
+    def ranura_de(self, inicio):
+        """
+        Ranura del bloque libre que empieza en la dirección dada
+        """
+        k = self._cubeta(inicio)
+        return self.cubetas_ranuras[k][bisect_left(self.cubetas_inicios[k], inicio)]
+
+    def mayor(self):
+        """
+        Retorna el tamaño del bloque libre más grande (0 si no hay)
+        """
+        return self.arbol[1]
+
+    def primer_ajuste(self, tamano_requerido):
+        """
+        Ranura del primer bloque libre (menor dirección) que cabe, o None
+        """
+        return self.primer_ajuste_desde(tamano_requerido, 0)
+
+    def primer_ajuste_desde(self, tamano_requerido, desde):
+        """
+        Ranura del primer bloque libre que cabe empezando en 'desde'
+        o más adelante, o None
+        """
+        if self.arbol[1] < tamano_requerido:
+            return None
+        k = self._cubeta(desde)
+        ranura = self._buscar_en_cubeta(k, tamano_requerido, desde)
+        if ranura is None:
+            # La primera cubeta posterior cuyo máximo alcanza
+            k = self._buscar_desde(1, 0, self.hojas, k + 1, tamano_requerido)
+            if k is not None:
+                ranura = self._buscar_en_cubeta(k, tamano_requerido, desde)
+        return ranura
+
+    def _buscar_en_cubeta(self, k, tamano_requerido, desde):
+        """
+        Ranura del primer bloque de la cubeta k que cabe con inicio >= desde,
+        o None
+        """
+        inicios = self.cubetas_inicios[k]
+        tamanos = self.cubetas_tamanos[k]
+        for j in range(bisect_left(inicios, desde), len(inicios)):
+            if tamanos[j] >= tamano_requerido:
+                return self.cubetas_ranuras[k][j]
+        return None
+
+    def _buscar_desde(self, nodo, izq, der, desde, tamano_requerido):
+        """
+        Búsqueda recursiva en el árbol de la primera cubeta en [desde, fin)
+        cuyo máximo alcanza el tamaño requerido
+        """
+        if der <= desde or self.arbol[nodo] < tamano_requerido:
+            return None
+        if der - izq == 1:
+            return izq
+        medio = (izq + der) // 2
+        k = self._buscar_desde(2 * nodo, izq, medio, desde, tamano_requerido)
+        if k is None:
+            k = self._buscar_desde(2 * nodo + 1, medio, der, desde, tamano_requerido)
+        return k
+
+    def tlsf_ajuste(self, tamano_requerido):
+        """
+        Búsqueda TLSF en O(1): redondea el tamaño a la siguiente clase para que
+        cualquier bloque de esa clase sirva y localiza la primera lista no
+        vacía con operaciones sobre los mapas de bits
+
+        Returns:
+            Ranura de un bloque libre que cabe, o None
+        """
+        if tamano_requerido >= TLSF_SL_COUNT:
+            msb = tamano_requerido.bit_length() - 1
+            tamano_requerido += (1 << (msb - TLSF_SL_BITS)) - 1
+        fl, sl = clase_tlsf(tamano_requerido)
+        if fl >= len(self.tlsf_sl):
+            return None
+
+        mapa = self.tlsf_sl[fl] & (-1 << sl)
+        if not mapa:
+            mapa_fl = self.tlsf_fl & (-1 << (fl + 1))
+            if not mapa_fl:
+                return None
+            fl = (mapa_fl & -mapa_fl).bit_length() - 1
+            mapa = self.tlsf_sl[fl]
+        sl = (mapa & -mapa).bit_length() - 1
+        return self.tlsf_listas[fl * TLSF_SL_COUNT + sl][-1]
+
+    def mejor_ajuste(self, tamano_requerido):
+        """
+        Ranura del bloque libre más pequeño que cabe, o None
+        A igual tamaño se elige el de menor dirección
+        """
+        i = bisect_left(self.por_tamano, tamano_requerido << BITS_DIRECCION)
+        if i == len(self.por_tamano):
+            return None
+        return self.ranura_de(self.por_tamano[i] & MASCARA_DIRECCION)
+
+    def peor_ajuste(self, tamano_requerido):
+        """
+        Ranura del bloque libre más grande si cabe, o None
+        A igual tamaño se elige el de menor dirección
+        """
+        if not self.por_tamano:
+            return None
+        mayor = self.por_tamano[-1] >> BITS_DIRECCION
+        if mayor < tamano_requerido:
+            return None
+        i = bisect_left(self.por_tamano, mayor << BITS_DIRECCION)
+        return self.ranura_de(self.por_tamano[i] & MASCARA_DIRECCION)
+
+
+class Bloque:
+    """
+    Vista de solo lectura de un bloque del mapa de memoria, para recorrerlo
+    (interfaz, estadísticas); el mapa en sí se guarda en columnas
+    """
+    __slots__ = ("start", "size", "pid")
+
+    def __init__(self, start, size, pid=None):
+        self.start = start
+        self.size = size
+        self.pid = pid
+
+    @property
+    def estado(self):
+        return "LIBRE" if self.pid is None else "OCUPADO"
+
+    def __repr__(self):
+        return f"Bloque({self.start}, {self.size}, {self.estado}, {self.pid})"
+
 
 class GestorMemoria:
     """
     Gestiona la memoria del sistema con diferentes algoritmos de asignación
+
+    El mapa de memoria es una lista doblemente enlazada ordenada por
+    dirección guardada en columnas: cada bloque ocupa una ranura de los
+    arrays paralelos inicios, tamanos, anteriores y siguientes y de la lista
+    procesos (PCB dueño o None si está libre). Dividir o unir bloques solo
+    toca los enlaces de sus vecinos, y las ranuras de los bloques unidos se
+    reutilizan en la próxima división
     """
     def __init__(self, total_size=MEMORIA_DEFAULT, estrategia="First Fit"):
         """
@@ -17,30 +344,183 @@ class GestorMemoria:
         
         Args:
             total_size: Tamaño total de la memoria en KB
-            estrategia: Algoritmo de asignación ("First Fit", "Best Fit", "Worst Fit")
+            estrategia: Algoritmo de asignación ("First Fit", "Best Fit", "Worst Fit",
+                        "Next Fit", "TLSF", "Buddy System")
+        """
+        self._estrategia = estrategia
+        self.reiniciar_memoria(total_size)
+
+    @property
+    def estrategia(self):
+        return self._estrategia
+
+    @estrategia.setter
+    def estrategia(self, nueva_estrategia):
+        """
+        Cambia la estrategia de asignación
+
+        Al entrar en Buddy System los bloques libres se parten en bloques
+        alineados de tamaño potencia de dos; al salir se vuelven a unir
         """
-        self.total_size = total_size
-        self.mapa_memoria = [{"start": 0, "size": total_size, "estado": "LIBRE", "pid": None}]
-        self.estrategia = estrategia
+        anterior = self._estrategia
+        self._estrategia = nueva_estrategia
+        if nueva_estrategia == "Buddy System" and anterior != "Buddy System":
+            self._construir_buddy()
+        elif anterior == "Buddy System" and nueva_estrategia != "Buddy System":
+            self.libres_buddy = None
+            self.compactar_memoria()
 
     def reiniciar_memoria(self, nuevo_tamano):
         """
         Reinicia la memoria con un nuevo tamaño
         """
         self.total_size = nuevo_tamano
-        self.mapa_memoria = [{"start": 0, "size": nuevo_tamano, "estado": "LIBRE", "pid": None}]
-        self.compactar_memoria()
+        self._vaciar_mapa()
+        self.indice_libres = IndiceLibres(nuevo_tamano)
+        self.libres_buddy = None
+        self.bloques_por_pid = {}
+        self.memoria_libre = 0
+        self.fragmentacion_interna = 0
+        self.puntero_next_fit = 0
+        ranura = self._nueva_ranura(0, nuevo_tamano)
+        self._enlazar_al_final(SIN_BLOQUE, ranura)
+        self._registrar_libre(ranura)
+        if self._estrategia == "Buddy System":
+            self._construir_buddy()
+
+    def _vaciar_mapa(self):
+        """
+        Crea las columnas del mapa de memoria sin ningún bloque
+        """
+        self.inicios = array('q')
+        self.tamanos = array('q')
+        self.anteriores = array('q')
+        self.siguientes = array('q')
+        self.procesos = []
+        self.ranuras_vacias = array('q')  # Ranuras de bloques unidos, para reutilizar
+        self.primer_bloque = SIN_BLOQUE
+        self.num_bloques = 0
+
+    def _nueva_ranura(self, inicio, tamano):
+        """
+        Ranura para un bloque libre todavía sin enlazar
+
+        Returns:
+            Índice de la ranura en las columnas
+        """
+        if self.ranuras_vacias:
+            ranura = self.ranuras_vacias.pop()
+            self.inicios[ranura] = inicio
+            self.tamanos[ranura] = tamano
+            return ranura
+        self.inicios.append(inicio)
+        self.tamanos.append(tamano)
+        self.anteriores.append(SIN_BLOQUE)
+        self.siguientes.append(SIN_BLOQUE)
+        self.procesos.append(None)
+        return len(self.procesos) - 1
+
+    @property
+    def mapa_memoria(self):
+        """
+        Vista iterable del mapa de memoria en orden de dirección
+        """
+        return self.bloques()
+
+    def bloques(self):
+        """
+        Recorre los bloques del mapa de memoria en orden de dirección
+
+        Returns:
+            Generador de vistas Bloque (start, size, pid, estado)
+        """
+        for ranura in self._ranuras():
+            proceso = self.procesos[ranura]
+            yield Bloque(self.inicios[ranura], self.tamanos[ranura], None if proceso is None else proceso.pid)
+
+    def _ranuras(self):
+        """
+        Recorre las ranuras de los bloques en orden de dirección
+        """
+        siguientes = self.siguientes
+        ranura = self.primer_bloque
+        while ranura != SIN_BLOQUE:
+            yield ranura
+            ranura = siguientes[ranura]
 
     def buscar_memoria_disponible(self, tamano_requerido):
         """
         Busca bloques de memoria disponibles que puedan alojar el tamaño requerido
         
         Returns:
-            Lista de índices de bloques libres que cumplen con el tamaño
+            Lista de bloques libres que cumplen con el tamaño
+        """
+        return [b for b in self.bloques() if b.pid is None and b.size >= tamano_requerido]
+
+    def _registrar_libre(self, ranura):
+        """
+        Agrega un bloque libre a los índices
+        """
+        inicio = self.inicios[ranura]
+        tamano = self.tamanos[ranura]
+        self.indice_libres.agregar(inicio, tamano, ranura)
+        self.memoria_libre += tamano
+        if self.libres_buddy is not None:
+            self.libres_buddy[tamano.bit_length() - 1][inicio] = ranura
+
+    def _quitar_libre(self, ranura):
+        """
+        Quita un bloque libre de los índices
         """
-        bloques_libres = [i for i, b in enumerate(self.mapa_memoria) if
-                          b["estado"] == "LIBRE" and b["size"] >= tamano_requerido]
-        return bloques_libres
+        inicio = self.inicios[ranura]
+        tamano = self.tamanos[ranura]
+        self.indice_libres.quitar(inicio, tamano, ranura)
+        self.memoria_libre -= tamano
+        if self.libres_buddy is not None:
+            self.libres_buddy[tamano.bit_length() - 1].pop(inicio, None)
+
+    def _insertar_antes(self, ranura, nueva):
+        """
+        Enlaza un bloque nuevo inmediatamente antes de otro
+        """
+        anterior = self.anteriores[ranura]
+        self.anteriores[nueva] = anterior
+        self.siguientes[nueva] = ranura
+        if anterior == SIN_BLOQUE:
+            self.primer_bloque = nueva
+        else:
+            self.siguientes[anterior] = nueva
+        self.anteriores[ranura] = nueva
+        self.num_bloques += 1
+
+    def _insertar_despues(self, ranura, nueva):
+        """
+        Enlaza un bloque nuevo inmediatamente después de otro
+        """
+        siguiente = self.siguientes[ranura]
+        self.anteriores[nueva] = ranura
+        self.siguientes[nueva] = siguiente
+        if siguiente != SIN_BLOQUE:
+            self.anteriores[siguiente] = nueva
+        self.siguientes[ranura] = nueva
+        self.num_bloques += 1
+
+    def _desenlazar(self, ranura):
+        """
+        Quita un bloque de la lista enlazada y deja su ranura para reutilizar
+        """
+        anteriores = self.anteriores
+        siguientes = self.siguientes
+        anterior = anteriores[ranura]
+        siguiente = siguientes[ranura]
+        if anterior == SIN_BLOQUE:
+            self.primer_bloque = siguiente
+        else:
+            siguientes[anterior] = siguiente
+        if siguiente != SIN_BLOQUE:
+            anteriores[siguiente] = anterior
+        self.num_bloques -= 1
+        self.ranuras_vacias.append(ranura)
 
     def asignar_memoria(self, proceso):
         """
@@ -53,73 +533,331 @@ class GestorMemoria:
             True si se asignó memoria, False si no hay espacio disponible
         """
         tamano_requerido = proceso.size
-        bloques_libres = self.buscar_memoria_disponible(tamano_requerido)
-
-        if not bloques_libres:
-            return False
-
-        # Seleccionar bloque según la estrategia
-        idx = -1
-        if self.estrategia == "First Fit":
-            # Primer bloque que cumpla con el tamaño
-            idx = bloques_libres[0]
-        elif self.estrategia == "Best Fit":
-            # Bloque más pequeño que cumpla con el tamaño
-            bloques_libres.sort(key=lambda i: self.mapa_memoria[i]["size"])
-            idx = bloques_libres[0]
-        elif self.estrategia == "Worst Fit":
-            # Bloque más grande disponible
-            bloques_libres.sort(key=lambda i: self.mapa_memoria[i]["size"], reverse=True)
-            idx = bloques_libres[0]
-
-        bloque = self.mapa_memoria[idx]
 
-        # Asignar memoria
-        if bloque["size"] > tamano_requerido:
-            # Dividir el bloque si es más grande
-            nuevo_bloque = {
-                "start": bloque["start"],
-                "size": tamano_requerido,
-                "estado": "OCUPADO",
-                "pid": proceso.pid
-            }
-            bloque["start"] += tamano_requerido
-            bloque["size"] -= tamano_requerido
-            self.mapa_memoria.insert(idx, nuevo_bloque)
-            proceso.base_address = nuevo_bloque["start"]
+        if self.estrategia == "Buddy System":
+            ranura = self._asignar_buddy(tamano_requerido)
+            if ranura is None:
+                return False
+            inicio = self.inicios[ranura]
+            tamano = self.tamanos[ranura]
         else:
-            # Usar todo el bloque
-            bloque["estado"] = "OCUPADO"
-            bloque["pid"] = proceso.pid
-            proceso.base_address = bloque["start"]
+            # Seleccionar bloque según la estrategia usando el índice de libres
+            ranura = None
+            if self.estrategia == "First Fit":
+                # Primer bloque que cumpla con el tamaño
+                ranura = self.indice_libres.primer_ajuste(tamano_requerido)
+            elif self.estrategia == "Best Fit":
+                # Bloque más pequeño que cumpla con el tamaño
+                ranura = self.indice_libres.mejor_ajuste(tamano_requerido)
+            elif self.estrategia == "Worst Fit":
+                # Bloque más grande disponible
+                ranura = self.indice_libres.peor_ajuste(tamano_requerido)
+            elif self.estrategia == "Next Fit":
+                # Primer bloque que cumpla a partir de la última asignación
+                ranura = self.indice_libres.primer_ajuste_desde(tamano_requerido, self.puntero_next_fit)
+                if ranura is None:
+                    ranura = self.indice_libres.primer_ajuste(tamano_requerido)
+            elif self.estrategia == "TLSF":
+                # Bloque de la primera clase de tamaño que garantiza el ajuste
+                ranura = self.indice_libres.tlsf_ajuste(tamano_requerido)
+                if ranura is None:
+                    # El único bloque que cabe puede estar en la clase del propio tamaño
+                    ranura = self.indice_libres.peor_ajuste(tamano_requerido)
+
+            if ranura is None:
+                return False
+
+            self._quitar_libre(ranura)
 
+            # Dividir el bloque si es más grande: el resto sigue libre en la misma ranura
+            inicio = self.inicios[ranura]
+            tamano = self.tamanos[ranura]
+            if tamano > tamano_requerido:
+                nueva = self._nueva_ranura(inicio, tamano_requerido)
+                self._insertar_antes(ranura, nueva)
+                self.inicios[ranura] = inicio + tamano_requerido
+                self.tamanos[ranura] = tamano - tamano_requerido
+                self._registrar_libre(ranura)
+                ranura = nueva
+                tamano = tamano_requerido
+
+            self.puntero_next_fit = inicio + tamano
+
+        # Asignar memoria
+        self.procesos[ranura] = proceso
+        self.bloques_por_pid[proceso.pid] = ranura
+        self.fragmentacion_interna += tamano - tamano_requerido
+        proceso.base_address = inicio
         return True
 
+    # --- BUDDY SYSTEM ---
+
+    def _construir_buddy(self):
+        """
+        Prepara las listas libres por orden (potencias de dos) a partir
+        de los bloques libres actuales del mapa
+        """
+        self.libres_buddy = [{} for _ in range(max(self.total_size, 1).bit_length())]
+        libres = [ranura for ranura in self._ranuras() if self.procesos[ranura] is None]
+        for ranura in libres:
+            self._quitar_libre(ranura)
+        for ranura in libres:
+            for trozo in self._partir_en_potencias(ranura):
+                self._fusionar_buddy(trozo)
+
+    def _partir_en_potencias(self, ranura):
+        """
+        Parte un bloque libre (no indexado) en bloques alineados de tamaño
+        potencia de dos, del mayor posible al menor
+
+        Returns:
+            Lista de ranuras resultantes en orden de dirección
+        """
+        trozos = []
+        while True:
+            inicio = self.inicios[ranura]
+            tamano_bloque = self.tamanos[ranura]
+            tamano = 1 << (tamano_bloque.bit_length() - 1)
+            alineacion = inicio & -inicio
+            if alineacion and alineacion < tamano:
+                tamano = alineacion
+            trozos.append(ranura)
+            if tamano == tamano_bloque:
+                return trozos
+            resto = self._nueva_ranura(inicio + tamano, tamano_bloque - tamano)
+            self.tamanos[ranura] = tamano
+            self._insertar_despues(ranura, resto)
+            ranura = resto
+
+    def _fusionar_buddy(self, ranura):
+        """
+        Une un bloque libre con su buddy (dirección XOR tamaño) mientras
+        el buddy esté libre y tenga el mismo orden, y lo registra como libre
+        """
+        while True:
+            inicio = self.inicios[ranura]
+            tamano = self.tamanos[ranura]
+            buddy = self.libres_buddy[tamano.bit_length() - 1].get(inicio ^ tamano)
+            if buddy is None:
+                break
+            self._quitar_libre(buddy)
+            if self.inicios[buddy] < inicio:
+                ranura, buddy = buddy, ranura
+            self._desenlazar(buddy)
+            self.tamanos[ranura] = 2 * tamano
+        self._registrar_libre(ranura)
+
+    def _asignar_buddy(self, tamano_requerido):
+        """
+        Toma el menor bloque buddy libre que cabe y lo divide a la mitad
+        hasta llegar al orden pedido
+
+        Returns:
+            Ranura asignable (ya fuera de los índices) o None si no hay espacio
+        """
+        orden = max(tamano_requerido - 1, 0).bit_length()
+        for k in range(orden, len(self.libres_buddy)):
+            if self.libres_buddy[k]:
+                break
+        else:
+            return None
+
+        _, ranura = self.libres_buddy[k].popitem()
+        self._quitar_libre(ranura)
+        while k > orden:
+            k -= 1
+            mitad = self._nueva_ranura(self.inicios[ranura] + (1 << k), 1 << k)
+            self.tamanos[ranura] = 1 << k
+            self._insertar_despues(ranura, mitad)
+            self._registrar_libre(mitad)
+        return ranura
+
     def liberar_memoria(self, proceso):
         """
         Libera la memoria asignada a un proceso cuando ha finalizado
+
+        El bloque se localiza por PID y solo se fusiona con sus dos vecinos
+        (o con su buddy en Buddy System), sin recorrer todo el mapa de memoria
         
         Args:
             proceso: Objeto PCB del proceso que terminó
         """
-        for bloque in self.mapa_memoria:
-            if bloque["pid"] == proceso.pid:
-                bloque["estado"] = "LIBRE"
-                bloque["pid"] = None
-                self.compactar_memoria()
-                return
+        ranura = self.bloques_por_pid.pop(proceso.pid, None)
+        if ranura is None:
+            return
+        self.procesos[ranura] = None
+        self.fragmentacion_interna -= self.tamanos[ranura] - proceso.size
+        if self.libres_buddy is not None:
+            for trozo in self._partir_en_potencias(ranura):
+                self._fusionar_buddy(trozo)
+        else:
+            self._fusionar_con_vecinos(ranura)
+
+    def _fusionar_con_vecinos(self, ranura):
+        """
+        Registra como libre un bloque y lo une con sus vecinos
+        inmediatos si también están libres
+        """
+        procesos = self.procesos
+        tamanos = self.tamanos
+
+        # Vecino derecho
+        siguiente = self.siguientes[ranura]
+        if siguiente != SIN_BLOQUE and procesos[siguiente] is None:
+            self._quitar_libre(siguiente)
+            tamanos[ranura] += tamanos[siguiente]
+            self._desenlazar(siguiente)
+
+        # Vecino izquierdo
+        anterior = self.anteriores[ranura]
+        if anterior != SIN_BLOQUE and procesos[anterior] is None:
+            self._quitar_libre(anterior)
+            tamanos[anterior] += tamanos[ranura]
+            self._desenlazar(ranura)
+            ranura = anterior
+
+        self._registrar_libre(ranura)
+
+    def capacidad(self):
+        """
+        Memoria libre cuando no hay ningún proceso asignado
+        """
+        return self.total_size
+
+    def bloque_libre_mayor(self):
+        """
+        Tamaño de la mayor solicitud que se puede asignar ahora mismo:
+        el bloque libre más grande (en Buddy System todos los libres son
+        bloques buddy, así que también vale)
+        """
+        return self.indice_libres.mayor()
+
+    def traducir(self, proceso, direccion_logica):
+        """
+        Traduce una dirección lógica del proceso a dirección física
+        (registro base + desplazamiento)
+
+        Returns:
+            Dirección física en KB
+        """
+        return proceso.base_address + direccion_logica
+
+    def traducir_rango(self, proceso, direccion_inicial, cantidad):
+        """
+        Equivale a traducir 'cantidad' direcciones consecutivas (circulares
+        dentro del proceso); con registro base no hay estado que actualizar
+        """
+
+    def traducir_intercalado(self, accesos, cantidad):
+        """
+        Equivale a 'cantidad' ticks de traducciones intercaladas de varios
+        procesos; con registro base no hay estado que actualizar
+        """
 
     def compactar_memoria(self):
         """
         Compacta la memoria uniendo bloques libres adyacentes
         """
-        i = 0
-        while i < len(self.mapa_memoria) - 1:
-            actual = self.mapa_memoria[i]
-            siguiente = self.mapa_memoria[i + 1]
-            if actual["estado"] == "LIBRE" and siguiente["estado"] == "LIBRE":
-                actual["size"] += siguiente["size"]
-                self.mapa_memoria.pop(i + 1)
+        ranura = self.primer_bloque
+        while ranura != SIN_BLOQUE and self.siguientes[ranura] != SIN_BLOQUE:
+            siguiente = self.siguientes[ranura]
+            if self.procesos[ranura] is None and self.procesos[siguiente] is None:
+                self._quitar_libre(ranura)
+                self._quitar_libre(siguiente)
+                self.tamanos[ranura] += self.tamanos[siguiente]
+                self._desenlazar(siguiente)
+                self._registrar_libre(ranura)
             else:
-                i += 1
+                ranura = siguiente
+
+    def compactar_reubicando(self):
+        """
+        Compactación con reubicación: desplaza todos los bloques ocupados
+        hacia el inicio de la memoria, actualizando el base_address de cada
+        PCB, y deja un único hueco libre al final. Las columnas se rehacen
+        sin ranuras vacías
+
+        Returns:
+            dict con los KB y bloques movidos y la fragmentación externa
+            y el bloque libre mayor antes y después
+        """
+        antes = self.estadisticas()
+        ocupados = [(self.inicios[ranura], self.tamanos[ranura], self.procesos[ranura])
+                    for ranura in self._ranuras() if self.procesos[ranura] is not None]
+        en_buddy = self.libres_buddy is not None
+
+        self._vaciar_mapa()
+        self.indice_libres = IndiceLibres(self.total_size)
+        self.libres_buddy = None
+        self.bloques_por_pid = {}
+        self.memoria_libre = 0
+        self.puntero_next_fit = 0
+
+        kb_movidos = 0
+        bloques_movidos = 0
+        direccion = 0
+        ultimo = SIN_BLOQUE
+        for inicio, tamano, proceso in ocupados:
+            if inicio != direccion:
+                kb_movidos += tamano
+                bloques_movidos += 1
+                proceso.base_address = direccion
+            ranura = self._nueva_ranura(direccion, tamano)
+            self.procesos[ranura] = proceso
+            self.bloques_por_pid[proceso.pid] = ranura
+            ultimo = self._enlazar_al_final(ultimo, ranura)
+            direccion += tamano
+
+        if direccion < self.total_size:
+            hueco = self._nueva_ranura(direccion, self.total_size - direccion)
+            self._enlazar_al_final(ultimo, hueco)
+            self._registrar_libre(hueco)
+        if en_buddy:
+            self._construir_buddy()
 
+        despues = self.estadisticas()
+        return {
+            'kb_movidos': kb_movidos,
+            'bloques_movidos': bloques_movidos,
+            'fragmentacion_antes': antes['fragmentacion_externa'],
+            'fragmentacion_despues': despues['fragmentacion_externa'],
+            'bloque_libre_mayor_antes': antes['bloque_libre_mayor'],
+            'bloque_libre_mayor_despues': despues['bloque_libre_mayor']
+        }
+
+    def _enlazar_al_final(self, ultima, ranura):
+        """
+        Agrega un bloque al final de la lista enlazada (usado al reconstruirla)
+
+        Returns:
+            La ranura agregada, que pasa a ser la última
+        """
+        self.anteriores[ranura] = ultima
+        self.siguientes[ranura] = SIN_BLOQUE
+        if ultima == SIN_BLOQUE:
+            self.primer_bloque = ranura
+        else:
+            self.siguientes[ultima] = ranura
+        self.num_bloques += 1
+        return ranura
+
+    def estadisticas(self):
+        """
+        Resumen del uso de memoria para comparar estrategias
+
+        Returns:
+            dict con memoria libre/ocupada, bloque libre mayor,
+            fragmentación interna (KB asignados de más) y externa
+            (fracción de la memoria libre fuera del bloque libre mayor)
+        """
+        mayor = self.indice_libres.mayor()
+        return {
+            'estrategia': self.estrategia,
+            'total': self.total_size,
+            'libre': self.memoria_libre,
+            'ocupada': self.total_size - self.memoria_libre,
+            'bloques': self.num_bloques,
+            'bloque_libre_mayor': mayor,
+            'fragmentacion_interna': self.fragmentacion_interna,
+            'fragmentacion_externa': 1 - mayor / self.memoria_libre if self.memoria_libre else 0.0
+        }
@@ -0,0 +1,143 @@
+"""
+Módulo de Métricas
+Acumula métricas de planificación (retorno, espera, respuesta, throughput)
+"""
+
+
+class Estadistica:
+    """
+    Acumulador incremental de una métrica: cantidad, suma, mínimo y máximo
+    """
+    __slots__ = ("cantidad", "suma", "minimo", "maximo")
+
+    def __init__(self):
+        self.cantidad = 0
+        self.suma = 0
+        self.minimo = None
+        self.maximo = None
+
+    def agregar(self, valor):
+        """
+        Suma una observación en O(1)
+        """
+        self.cantidad += 1
+        self.suma += valor
+        if self.minimo is None or valor < self.minimo:
+            self.minimo = valor
+        if self.maximo is None or valor > self.maximo:
+            self.maximo = valor
+
+    @property
+    def promedio(self):
+        return self.suma / self.cantidad if self.cantidad else 0.0
+
+    def resumen(self):
+        return {
+            'promedio': self.promedio,
+            'minimo': self.minimo,
+            'maximo': self.maximo
+        }
+
+
+class MetricasAlgoritmo:
+    """
+    Métricas acumuladas mientras estuvo activo un algoritmo de planificación
+    """
+    def __init__(self):
+        self.retorno = Estadistica()
+        self.espera = Estadistica()
+        self.respuesta = Estadistica()
+        self.listo = Estadistica()
+        self.bloqueado = Estadistica()
+        self.ticks = 0  # Ticks transcurridos con el algoritmo activo (intervalos cerrados)
+
+
+class MetricasPlanificacion:
+    """
+    Métricas de planificación por algoritmo
+
+    Cada evento (primer despacho o finalización) actualiza acumuladores en
+    O(1), así que llevar las métricas no agrega costo al ciclo por tick.
+    Cada proceso cuenta para el algoritmo activo en el momento del evento
+    """
+    def __init__(self, algoritmo, reloj=0):
+        """
+        Args:
+            algoritmo: Algoritmo de planificación activo
+            reloj: Tick actual
+        """
+        self.reiniciar(algoritmo, reloj)
+
+    def reiniciar(self, algoritmo, reloj=0):
+        """
+        Descarta todas las métricas acumuladas
+        """
+        self.por_algoritmo = {}
+        self.algoritmo = algoritmo
+        self.inicio_algoritmo = reloj
+        self._metricas(algoritmo)
+
+    def _metricas(self, algoritmo):
+        if algoritmo not in self.por_algoritmo:
+            self.por_algoritmo[algoritmo] = MetricasAlgoritmo()
+        return self.por_algoritmo[algoritmo]
+
+    def cambiar_algoritmo(self, algoritmo, reloj):
+        """
+        Cierra el intervalo del algoritmo anterior y empieza a contar para el nuevo
+        """
+        self._metricas(self.algoritmo).ticks += reloj - self.inicio_algoritmo
+        self.algoritmo = algoritmo
+        self.inicio_algoritmo = reloj
+        self._metricas(algoritmo)
+
+    def registrar_despacho(self, proceso):
+        """
+        Registra el tiempo de respuesta en el primer despacho de un proceso
+        """
+        self._metricas(self.algoritmo).respuesta.agregar(
+            proceso.tiempo_primer_despacho - proceso.tiempo_llegada)
+
+    def registrar_finalizacion(self, proceso):
+        """
+        Registra retorno, espera y tiempos en listos/bloqueado de un proceso terminado
+        La espera es el retorno menos la ráfaga y el tiempo bloqueado en I/O
+        """
+        metricas = self._metricas(self.algoritmo)
+        retorno = proceso.tiempo_finalizacion - proceso.tiempo_llegada
+        metricas.retorno.agregar(retorno)
+        metricas.espera.agregar(retorno - proceso.burst_time_total - proceso.tiempo_bloqueado_acumulado)
+        metricas.listo.agregar(proceso.tiempo_listo_acumulado)
+        metricas.bloqueado.agregar(proceso.tiempo_bloqueado_acumulado)
+
+    def resumen(self, reloj, algoritmo=None):
+        """
+        Resumen de las métricas
+
+        Args:
+            reloj: Tick actual (cierra el intervalo del algoritmo activo)
+            algoritmo: Algoritmo a consultar; None para todos
+
+        Returns:
+            dict con completados, ticks, throughput (procesos por tick) y
+            promedio/mínimo/máximo de retorno, espera, respuesta, listo y bloqueado.
+            Sin algoritmo, un dict de esos resúmenes por algoritmo
+        """
+        if algoritmo is None:
+            return {nombre: self.resumen(reloj, nombre) for nombre in self.por_algoritmo}
+
+        metricas = self.por_algoritmo.get(algoritmo) or MetricasAlgoritmo()
+        ticks = metricas.ticks
+        if algoritmo == self.algoritmo:
+            ticks += reloj - self.inicio_algoritmo
+        completados = metricas.retorno.cantidad
+        return {
+            'completados': completados,
+            'ticks': ticks,
+            'throughput': completados / ticks if ticks else 0.0,
+            'retorno': metricas.retorno.resumen(),
+            'espera': metricas.espera.resumen(),
+            'respuesta': metricas.respuesta.resumen(),
+            'listo': metricas.listo.resumen(),
+            'bloqueado': metricas.bloqueado.resumen()
+        }
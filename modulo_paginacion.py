@@ -0,0 +1,307 @@
+"""
+Módulo de Paginación
+Gestiona la memoria en marcos de tamaño fijo con tablas de páginas por proceso
+y una TLB simulada
+"""
+
+from array import array
+from collections import OrderedDict
+
+from constantes import MEMORIA_DEFAULT, TAMANO_MARCO, ENTRADAS_TLB
+from modulo_memoria import Bloque
+
+
+class TLB:
+    """
+    Translation Lookaside Buffer totalmente asociativa con reemplazo LRU
+    """
+    def __init__(self, capacidad=ENTRADAS_TLB):
+        self.capacidad = capacidad
+        self.entradas = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def buscar(self, pid, pagina):
+        """
+        Busca la traducción de una página
+
+        Returns:
+            Número de marco si está en la TLB (acierto), None en caso de fallo
+        """
+        marco = self.entradas.get((pid, pagina))
+        if marco is None:
+            self.fallos += 1
+            return None
+        self.entradas.move_to_end((pid, pagina))
+        self.aciertos += 1
+        return marco
+
+    def insertar(self, pid, pagina, marco):
+        """
+        Agrega una traducción, desalojando la menos usada si está llena
+        """
+        self.entradas[(pid, pagina)] = marco
+        if len(self.entradas) > self.capacidad:
+            self.entradas.popitem(last=False)
+
+    def invalidar_proceso(self, pid):
+        """
+        Elimina las traducciones de un proceso (al liberar su memoria)
+        """
+        for clave in [c for c in self.entradas if c[0] == pid]:
+            del self.entradas[clave]
+
+    def tasa_aciertos(self):
+        """
+        Fracción de accesos resueltos por la TLB
+        """
+        total = self.aciertos + self.fallos
+        return self.aciertos / total if total else 0.0
+
+    def reset(self):
+        """
+        Vacía la TLB y sus contadores
+        """
+        self.entradas.clear()
+        self.aciertos = 0
+        self.fallos = 0
+
+
+class GestorMemoriaPaginada:
+    """
+    Gestiona la memoria mediante paginación
+
+    Ofrece la misma interfaz que GestorMemoria para que el coordinador pueda
+    usar cualquiera de los dos modos sobre la misma carga de trabajo
+    """
+    def __init__(self, total_size=MEMORIA_DEFAULT, estrategia="First Fit",
+                 tamano_marco=TAMANO_MARCO, entradas_tlb=ENTRADAS_TLB):
+        """
+        Inicializa el gestor de memoria paginada
+        
+        Args:
+            total_size: Tamaño total de la memoria en KB
+            estrategia: Se conserva por compatibilidad; en paginación no se usa
+            tamano_marco: Tamaño de cada marco (y página) en KB
+            entradas_tlb: Número de entradas de la TLB
+        """
+        self.estrategia = estrategia
+        self.tamano_marco = tamano_marco
+        self.tlb = TLB(entradas_tlb)
+        self.reiniciar_memoria(total_size)
+
+    def reiniciar_memoria(self, nuevo_tamano):
+        """
+        Reinicia la memoria con un nuevo tamaño
+        """
+        self.total_size = nuevo_tamano
+        self.num_marcos = nuevo_tamano // self.tamano_marco
+        # Tabla de marcos: PID dueño de cada marco (0 = libre)
+        self.propietario = array('l', [0]) * self.num_marcos
+        # Pila de marcos libres; el marco más bajo queda en la cima
+        self.marcos_libres = array('l', range(self.num_marcos - 1, -1, -1))
+        self.fragmentacion_interna = 0
+        self.tlb.reset()
+
+    @property
+    def memoria_libre(self):
+        return len(self.marcos_libres) * self.tamano_marco
+
+    def capacidad(self):
+        """
+        Memoria libre con todos los marcos libres: si total_size no es
+        múltiplo de tamano_marco, el resto no forma un marco y no se usa
+        """
+        return self.num_marcos * self.tamano_marco
+
+    def bloque_libre_mayor(self):
+        """
+        Tamaño de la mayor solicitud que se puede asignar ahora mismo:
+        los marcos no necesitan ser contiguos, así que es toda la memoria libre
+        """
+        return self.memoria_libre
+
+    def paginas_necesarias(self, tamano):
+        """
+        Número de páginas que ocupa un proceso de un tamaño dado
+        """
+        return max(-(-tamano // self.tamano_marco), 1)
+
+    def asignar_memoria(self, proceso):
+        """
+        Asigna marcos libres a todas las páginas de un proceso y construye
+        su tabla de páginas
+        
+        Args:
+            proceso: Objeto PCB del proceso que necesita memoria
+            
+        Returns:
+            True si se asignó memoria, False si no hay marcos suficientes
+        """
+        paginas = self.paginas_necesarias(proceso.size)
+        if paginas > len(self.marcos_libres):
+            return False
+
+        libres = self.marcos_libres
+        tabla = libres[len(libres) - paginas:]
+        tabla.reverse()
+        del libres[len(libres) - paginas:]
+        for marco in tabla:
+            self.propietario[marco] = proceso.pid
+
+        proceso.tabla_paginas = tabla
+        proceso.base_address = tabla[0] * self.tamano_marco
+        self.fragmentacion_interna += paginas * self.tamano_marco - proceso.size
+        return True
+
+    def liberar_memoria(self, proceso):
+        """
+        Devuelve los marcos de un proceso a la pila de libres
+        
+        Args:
+            proceso: Objeto PCB del proceso que terminó
+        """
+        tabla = proceso.tabla_paginas
+        if tabla is None:
+            return
+        for marco in reversed(tabla):
+            self.propietario[marco] = 0
+        self.marcos_libres.extend(reversed(tabla))
+        self.fragmentacion_interna -= len(tabla) * self.tamano_marco - proceso.size
+        self.tlb.invalidar_proceso(proceso.pid)
+        proceso.tabla_paginas = None
+
+    def traducir(self, proceso, direccion_logica):
+        """
+        Traduce una dirección lógica del proceso a dirección física,
+        consultando primero la TLB y luego la tabla de páginas
+
+        Returns:
+            Dirección física en KB
+        """
+        pagina, desplazamiento = divmod(direccion_logica, self.tamano_marco)
+        marco = self.tlb.buscar(proceso.pid, pagina)
+        if marco is None:
+            marco = proceso.tabla_paginas[pagina]
+            self.tlb.insertar(proceso.pid, pagina, marco)
+        return marco * self.tamano_marco + desplazamiento
+
+    def traducir_rango(self, proceso, direccion_inicial, cantidad):
+        """
+        Equivale a traducir 'cantidad' direcciones consecutivas (circulares
+        dentro del proceso) con una consulta a la TLB por página: tras la
+        primera, los demás accesos a la misma página son aciertos
+        """
+        direccion = direccion_inicial % proceso.size
+        while cantidad > 0:
+            fin_pagina = min((direccion // self.tamano_marco + 1) * self.tamano_marco, proceso.size)
+            en_pagina = min(cantidad, fin_pagina - direccion)
+            self.traducir(proceso, direccion)
+            self.tlb.aciertos += en_pagina - 1
+            cantidad -= en_pagina
+            direccion = (direccion + en_pagina) % proceso.size
+
+    def traducir_intercalado(self, accesos, cantidad):
+        """
+        Equivale a 'cantidad' ticks en los que cada proceso de 'accesos', en
+        orden de núcleo, traduce en cada tick la dirección siguiente a la
+        anterior, como hacen los núcleos tick a tick sobre la TLB compartida
+
+        Solo se consulta la TLB en los ticks en que algún proceso empieza una
+        página: en los demás todos aciertan, y repetir la ronda en el mismo
+        orden no cambia el orden LRU que dejó la anterior
+
+        Args:
+            accesos: Lista de tuplas (proceso, dirección del primer tick)
+            cantidad: Ticks
+        """
+        if len(accesos) == 1:
+            proceso, direccion = accesos[0]
+            self.traducir_rango(proceso, direccion, cantidad)
+            return
+
+        # Ticks (contados desde 0) en que algún proceso cambia de página;
+        # el primero siempre se traduce completo
+        cortes = {0}
+        for proceso, direccion in accesos:
+            direccion %= proceso.size
+            tick = 0
+            while True:
+                fin_pagina = min((direccion // self.tamano_marco + 1) * self.tamano_marco, proceso.size)
+                tick += fin_pagina - direccion
+                if tick >= cantidad:
+                    break
+                cortes.add(tick)
+                direccion = fin_pagina % proceso.size
+
+        cortes = sorted(cortes)
+        cortes.append(cantidad)
+        for tick, siguiente in zip(cortes, cortes[1:]):
+            for proceso, direccion in accesos:
+                self.traducir(proceso, (direccion + tick) % proceso.size)
+            self.tlb.aciertos += (siguiente - tick - 1) * len(accesos)
+
+    def compactar_memoria(self):
+        """
+        En paginación no hay fragmentación externa que compactar
+        """
+        pass
+
+    def compactar_reubicando(self):
+        """
+        En paginación los marcos no necesitan ser contiguos, no se mueve nada
+
+        Returns:
+            dict con el mismo formato que GestorMemoria.compactar_reubicando
+        """
+        libre = self.memoria_libre
+        return {
+            'kb_movidos': 0,
+            'bloques_movidos': 0,
+            'fragmentacion_antes': 0.0,
+            'fragmentacion_despues': 0.0,
+            'bloque_libre_mayor_antes': libre,
+            'bloque_libre_mayor_despues': libre
+        }
+
+    @property
+    def mapa_memoria(self):
+        """
+        Vista iterable del mapa de memoria en orden de dirección
+        """
+        return self.bloques()
+
+    def bloques(self):
+        """
+        Agrupa marcos consecutivos del mismo dueño en bloques para mostrarlos
+        """
+        propietario = self.propietario
+        inicio = 0
+        for marco in range(1, self.num_marcos + 1):
+            if marco == self.num_marcos or propietario[marco] != propietario[inicio]:
+                pid = propietario[inicio] or None
+                yield Bloque(inicio * self.tamano_marco, (marco - inicio) * self.tamano_marco, pid)
+                inicio = marco
+
+    def estadisticas(self):
+        """
+        Resumen del uso de memoria y de la TLB
+
+        Returns:
+            dict con las mismas claves que GestorMemoria.estadisticas más
+            los contadores de la TLB
+        """
+        libre = self.memoria_libre
+        return {
+            'estrategia': "Paginación",
+            'total': self.total_size,
+            'libre': libre,
+            'ocupada': self.capacidad() - libre,
+            'bloques': self.num_marcos,
+            'bloque_libre_mayor': libre,
+            'fragmentacion_interna': self.fragmentacion_interna,
+            'fragmentacion_externa': 0.0,
+            'tlb_aciertos': self.tlb.aciertos,
+            'tlb_fallos': self.tlb.fallos,
+            'tlb_tasa_aciertos': self.tlb.tasa_aciertos()
+        }
@@ -3,101 +3,230 @@ Módulo del Planificador
 Selecciona el próximo proceso a ejecutarse según la política de planificación
 """
 
+from constantes import NIVELES_MLFQ, PERIODO_BOOST_MLFQ, INTERVALO_ENVEJECIMIENTO, ALGORITMOS_APROPIATIVOS
+from modulo_colas import ColaListos, ColaMultinivel, ColasPorNucleo
+from modulo_gantt import HistoriaGantt
+
 
 class Planificador:
     """
     Planificador de procesos
     Selecciona el próximo proceso a ejecutarse según diferentes algoritmos
     """
-    def __init__(self, algoritmo="Round Robin", quantum=3):
+    def __init__(self, algoritmo="Round Robin", quantum=3, niveles_mlfq=NIVELES_MLFQ,
+                 quantums_mlfq=None, periodo_boost=PERIODO_BOOST_MLFQ,
+                 intervalo_envejecimiento=INTERVALO_ENVEJECIMIENTO, num_nucleos=1,
+                 colas_por_nucleo=False):
         """
         Inicializa el planificador
         
         Args:
-            algoritmo: Algoritmo de planificación ("Round Robin", "FCFS", "SJF", "Prioridad")
-            quantum: Tamaño del quantum para Round Robin
+            algoritmo: Algoritmo de planificación ("Round Robin", "FCFS", "SJF", "SRTF",
+                       "Prioridad", "Prioridad Apropiativa", "MLFQ")
+            quantum: Tamaño del quantum para Round Robin (y del nivel 0 de MLFQ)
+            niveles_mlfq: Número de niveles de MLFQ
+            quantums_mlfq: Quantum de cada nivel de MLFQ; por defecto se duplica
+                           el quantum en cada nivel
+            periodo_boost: Ticks entre cada boost de prioridad en MLFQ
+            intervalo_envejecimiento: Ticks de espera en listos que mejoran la
+                                      prioridad en un punto (0 desactiva el envejecimiento)
+            num_nucleos: Número de núcleos de CPU
+            colas_por_nucleo: Una cola de listos por núcleo con robo de trabajo
+                              en lugar de una cola global
         """
         self.algoritmo = algoritmo
         self.quantum = quantum
-        self.contador_quantum = 0
-        self.historia_gantt = []
+        self.num_nucleos = num_nucleos
+        self.colas_por_nucleo = colas_por_nucleo
+        self.contadores_quantum = [0] * num_nucleos
+        self.historias_gantt = [HistoriaGantt() for _ in range(num_nucleos)]  # Un carril por núcleo
+        self.niveles_mlfq = niveles_mlfq
+        self.quantums_mlfq = quantums_mlfq
+        self.periodo_boost = periodo_boost
+        self.epoca_boost = 0
+        self.intervalo_envejecimiento = intervalo_envejecimiento
+
+    def crear_cola_listos(self):
+        """
+        Crea la cola de listos adecuada para el algoritmo actual
+        (una por núcleo si se usan colas por núcleo)
+        """
+        if self.colas_por_nucleo:
+            return ColasPorNucleo([self._crear_cola() for _ in range(self.num_nucleos)])
+        return self._crear_cola()
 
-    def seleccionar_proximo_proceso(self, cola_listos):
+    def _crear_cola(self):
+        if self.algoritmo == "MLFQ":
+            return ColaMultinivel(self.niveles_mlfq, self.nivel_de)
+        return ColaListos(self.funcion_orden())
+
+    def seleccionar_proximo_proceso(self, cola_listos, nucleo=0):
         """
         Selecciona el próximo proceso a ejecutarse según el algoritmo
         
         Args:
-            cola_listos: Lista de procesos listos para ejecutarse
+            cola_listos: ColaListos ordenada con clave_orden (o ColaMultinivel en MLFQ,
+                         o ColasPorNucleo)
+            nucleo: Núcleo que queda libre
             
         Returns:
             Proceso seleccionado o None si no hay procesos listos
         """
-        if not cola_listos:
-            return None
+        # La cola ya está ordenada por clave_orden: el primero es el seleccionado
+        if self.colas_por_nucleo:
+            return cola_listos.primero_de(nucleo)
+        return cola_listos.primero()
 
-        # Ordenar la cola según el algoritmo
-        self.ordenar_cola_listos(cola_listos)
+    def funcion_orden(self):
+        """
+        Función de orden para la cola de listos según el algoritmo,
+        o None si el algoritmo es FIFO (Round Robin, FCFS)
+        """
+        if self.algoritmo in ("SJF", "SRTF", "Prioridad", "Prioridad Apropiativa"):
+            return self.clave_orden
+        return None
 
-        # Retornar el primer proceso (el seleccionado)
-        return cola_listos[0] if cola_listos else None
+    def clave_orden(self, proceso):
+        """
+        Clave de orden de la cola de listos según el algoritmo
+        (menor valor = se ejecuta antes; los empates se resuelven en FIFO)
+        
+        Args:
+            proceso: Proceso que entra a la cola de listos
+        """
+        if self.algoritmo in ("SJF", "SRTF"):
+            # Shortest Job First: tiempo de ejecución restante
+            return proceso.burst_time_restante
+        # Prioridad: menor número = mayor prioridad
+        if not self.intervalo_envejecimiento:
+            return proceso.prioridad
+        # Envejecimiento: la prioridad efectiva mejora un punto por cada intervalo
+        # de espera, prioridad - (ahora - tick_listo) / intervalo. Como 'ahora' es
+        # común a todos, ordenar por prioridad + tick_listo / intervalo es
+        # equivalente y la clave no cambia mientras el proceso espera
+        return proceso.prioridad + proceso.tick_listo / self.intervalo_envejecimiento
 
-    def ordenar_cola_listos(self, cola_listos):
+    def debe_expropiar(self, en_ejecucion, candidato, reloj):
         """
-        Ordena la cola de listos según el algoritmo de planificación
+        Indica si un proceso que acaba de quedar listo debe quitarle la CPU
+        al proceso en ejecución (solo en algoritmos apropiativos)
         
         Args:
-            cola_listos: Lista de procesos a ordenar (se modifica in-place)
+            en_ejecucion: Proceso que tiene la CPU
+            candidato: Primer proceso de la cola de listos
+            reloj: Tick actual
+        """
+        if self.algoritmo not in ALGORITMOS_APROPIATIVOS or candidato is None:
+            return False
+        if self.algoritmo == "MLFQ":
+            return self.nivel_de(candidato) < self.nivel_de(en_ejecucion)
+        # SRTF compara el tiempo restante actual; Prioridad Apropiativa la
+        # prioridad envejecida del candidato contra la del proceso en ejecución
+        return self.clave_orden(candidato) < self.clave_expropiacion(en_ejecucion, reloj)
+
+    def clave_expropiacion(self, proceso, reloj):
+        """
+        Preferencia de un proceso en ejecución frente a la expropiación
+        (mayor valor = se expropia antes); elige la víctima entre varios núcleos
+
+        Con envejecimiento, el tiempo en la CPU no cuenta como espera: el
+        proceso conserva la prioridad envejecida que tenía al ser despachado,
+        prioridad - (tick_despacho - tick_listo) / intervalo. Expresada en la
+        misma escala que clave_orden (desplazada por el tick actual) es la
+        clave con que entró a listos más (reloj - tick_despacho) / intervalo
+        """
+        if self.algoritmo == "MLFQ":
+            return self.nivel_de(proceso)
+        clave = self.clave_orden(proceso)
+        if self.algoritmo in ("Prioridad", "Prioridad Apropiativa") and self.intervalo_envejecimiento:
+            clave += (reloj - proceso.tick_despacho) / self.intervalo_envejecimiento
+        return clave
+
+    # --- MLFQ ---
+
+    def nivel_de(self, proceso):
+        """
+        Nivel MLFQ actual de un proceso
+        Un nivel asignado antes del último boost cuenta como nivel 0
+        """
+        if proceso.epoca_mlfq != self.epoca_boost:
+            return 0
+        return proceso.nivel_mlfq
+
+    def quantum_actual(self, proceso):
+        """
+        Quantum que corresponde al proceso según el algoritmo (y su nivel en MLFQ)
+        """
+        if self.algoritmo != "MLFQ":
+            return self.quantum
+        nivel = self.nivel_de(proceso)
+        if self.quantums_mlfq:
+            return self.quantums_mlfq[min(nivel, len(self.quantums_mlfq) - 1)]
+        return self.quantum * 2 ** nivel
+
+    def degradar(self, proceso):
+        """
+        Baja un nivel al proceso que agotó su quantum completo
+
+        Returns:
+            Nuevo nivel del proceso
+        """
+        nivel = min(self.nivel_de(proceso) + 1, self.niveles_mlfq - 1)
+        proceso.nivel_mlfq = nivel
+        proceso.epoca_mlfq = self.epoca_boost
+        return nivel
+
+    def verificar_boost(self, reloj, cola_listos):
+        """
+        Aplica el boost periódico de MLFQ: todos los procesos vuelven al nivel 0
+        Los procesos fuera de la cola se actualizan de forma perezosa con la época
+
+        Returns:
+            True si se aplicó el boost en este tick
         """
-        if self.algoritmo == "SJF":
-            # Shortest Job First: ordenar por tiempo de ejecución restante
-            cola_listos.sort(key=lambda p: p.burst_time_restante)
-        elif self.algoritmo == "Prioridad":
-            # Prioridad: ordenar por prioridad (menor número = mayor prioridad)
-            cola_listos.sort(key=lambda p: p.prioridad)
-        # Para Round Robin y FCFS no se ordena (FIFO)
+        if self.algoritmo != "MLFQ" or not self.periodo_boost or reloj % self.periodo_boost:
+            return False
+        self.epoca_boost += 1
+        cola_listos.boost()
+        return True
 
-    def registrar_gantt(self, proceso):
+    def registrar_gantt(self, proceso, tick, duracion=1, nucleo=0):
         """
         Registra la ejecución de un proceso en el gráfico de Gantt
         
         Args:
             proceso: Proceso que se está ejecutando
+            tick: Tick en que empezó la ejecución registrada
+            duracion: Ticks ejecutados de forma continua
+            nucleo: Núcleo (carril del Gantt) en que se ejecutó
         """
-        if self.historia_gantt and self.historia_gantt[-1]["pid"] == proceso.pid:
-            # Si es el mismo proceso, incrementar duración
-            self.historia_gantt[-1]["duracion"] += 1
-        else:
-            # Nuevo proceso, agregar entrada
-            self.historia_gantt.append({
-                "pid": proceso.pid,
-                "duracion": 1,
-                "color": proceso.color
-            })
+        self.historias_gantt[nucleo].registrar(proceso.pid, tick, duracion)
 
     def limpiar_gantt(self):
         """
         Limpia el historial del gráfico de Gantt
         """
-        self.historia_gantt = []
+        for historia in self.historias_gantt:
+            historia.limpiar()
 
-    def reset_quantum(self):
+    def reset_quantum(self, nucleo=0):
         """
-        Resetea el contador de quantum
+        Resetea el contador de quantum de un núcleo
         """
-        self.contador_quantum = 0
+        self.contadores_quantum[nucleo] = 0
 
-    def incrementar_quantum(self):
+    def incrementar_quantum(self, nucleo=0):
         """
-        Incrementa el contador de quantum
+        Incrementa el contador de quantum de un núcleo
         """
-        self.contador_quantum += 1
+        self.contadores_quantum[nucleo] += 1
 
-    def quantum_agotado(self):
+    def quantum_agotado(self, nucleo=0):
         """
-        Verifica si el quantum se ha agotado
+        Verifica si el quantum de un núcleo se ha agotado
         
         Returns:
             True si el quantum se agotó, False en caso contrario
         """
-        return self.contador_quantum >= self.quantum
+        return self.contadores_quantum[nucleo] >= self.quantum
 
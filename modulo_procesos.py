@@ -3,12 +3,27 @@ Módulo de Procesos
 Gestiona la creación de procesos, colas de procesos y estados
 """
 
+from operator import attrgetter
+
 from constantes import get_color_proceso
+from modulo_colas import ColaAdmision, ColaListos, ColaBloqueados
 
 
 class PCB:
+    """
+    Bloque de control de proceso
 
-    def __init__(self, pid, size, burst_time, prioridad):
+    Usa __slots__: sin __dict__ por instancia, cada PCB ocupa una fracción de
+    la memoria, lo que importa con trazas de millones de procesos
+    """
+    __slots__ = ("pid", "size", "burst_time_total", "burst_time_restante", "prioridad", "estado",
+                 "base_address", "tabla_paginas", "tick_despertar", "nucleo", "ticks_hasta_io",
+                 "probabilidad_io", "pc", "nivel_mlfq", "epoca_mlfq", "tick_listo", "tick_bloqueado",
+                 "tick_despacho",
+                 "tiempo_llegada", "tiempo_primer_despacho", "tiempo_finalizacion",
+                 "tiempo_listo_acumulado", "tiempo_bloqueado_acumulado")
+
+    def __init__(self, pid, size, burst_time, prioridad, tiempo_llegada=0):
         self.pid = pid
         self.size = size
         self.burst_time_total = burst_time
@@ -16,106 +31,209 @@ class PCB:
         self.prioridad = prioridad
         self.estado = "NUEVO"
         self.base_address = -1
-        self.tiempo_bloqueado_restante = 0
-        self.color = get_color_proceso(pid)
+        self.tabla_paginas = None  # Solo en modo paginación
+        self.tick_despertar = 0  # Tick en que termina su I/O
+        self.nucleo = None  # Núcleo en que se ejecutó por última vez (afinidad)
+        self.ticks_hasta_io = None  # Ticks de ejecución hasta su próximo bloqueo (sorteados)
+        self.probabilidad_io = None  # Probabilidad de I/O propia (ModeloIOPorProceso)
         self.pc = 0  # Program Counter: 
+        self.nivel_mlfq = 0
+        self.epoca_mlfq = 0
+        self.tick_listo = 0  # Tick en que entró por última vez a la cola de listos
+        self.tick_bloqueado = 0  # Tick en que se bloqueó por última vez
+        self.tick_despacho = 0  # Tick en que recibió la CPU por última vez
+
+        # Tiempos para las métricas de planificación
+        self.tiempo_llegada = tiempo_llegada
+        self.tiempo_primer_despacho = None
+        self.tiempo_finalizacion = None
+        self.tiempo_listo_acumulado = 0
+        self.tiempo_bloqueado_acumulado = 0
+
+    @property
+    def color(self):
+        """
+        Color del proceso; se calcula solo al dibujar
+        """
+        return get_color_proceso(self.pid)
 
     def __repr__(self):
         return f"P{self.pid}"
 
+    def __getstate__(self):
+        # Tupla posicional en el orden de __slots__: la mitad de tamaño que el
+        # diccionario por defecto en los snapshots
+        return _valores_pcb(self)
+
+    def __setstate__(self, estado):
+        for campo, valor in zip(PCB.__slots__, estado):
+            setattr(self, campo, valor)
+
+
+_valores_pcb = attrgetter(*PCB.__slots__)
+
 
 class GestorProcesos:
     """
     Gestiona las colas de procesos y sus transiciones de estado
+
+    El campo estado de cada PCB indica en qué estructura está el proceso,
+    así que cada transición es O(1): no hay búsquedas en listas
     """
-    def __init__(self):
-        self.cola_nuevos = []
-        self.cola_listos = []
-        self.cola_bloqueados = []
+    def __init__(self, cola_listos=None, num_nucleos=1):
+        """
+        Args:
+            cola_listos: Cola de listos a usar (la crea el planificador); FIFO por defecto
+            num_nucleos: Número de núcleos (un proceso en ejecución por núcleo)
+        """
+        self.cola_nuevos = ColaAdmision()
+        self.cola_listos = cola_listos if cola_listos is not None else ColaListos()
+        self.cola_bloqueados = ColaBloqueados()
         self.cola_terminados = []
-        self.proceso_ejecucion = None
+        self.terminados = 0  # Procesos terminados, se conserven o no en cola_terminados
+        # Con False los terminados solo se cuentan: con trazas largas la
+        # memoria no crece con cada proceso que ya terminó
+        self.conservar_terminados = True
+        self.en_ejecucion = [None] * num_nucleos  # Proceso en ejecución de cada núcleo
         self.pid_counter = 1
+        self.reloj = 0  # Tick actual, lo actualiza el coordinador
 
     def crear_proceso(self, size, burst_time, prioridad):
         """
         Crea un nuevo proceso y lo agrega a la cola de nuevos
         """
-        proceso = PCB(self.pid_counter, size, burst_time, prioridad)
-        self.cola_nuevos.append(proceso)
+        proceso = PCB(self.pid_counter, size, burst_time, prioridad, self.reloj)
+        self.cola_nuevos.agregar(proceso)
         self.pid_counter += 1
         return proceso
 
+    def _salir_de_estado(self, proceso):
+        """
+        Quita al proceso de la estructura que corresponde a su estado actual
+        """
+        estado = proceso.estado
+        if estado == "LISTO":
+            self.cola_listos.quitar(proceso)
+            proceso.tiempo_listo_acumulado += self.reloj - proceso.tick_listo
+        elif estado == "BLOQUEADO":
+            self.cola_bloqueados.quitar(proceso)
+            proceso.tiempo_bloqueado_acumulado += self.reloj - proceso.tick_bloqueado
+        elif estado == "NUEVO":
+            self.cola_nuevos.quitar(proceso)
+        elif estado == "EJECUCION" and self.en_ejecucion[proceso.nucleo] is proceso:
+            self.en_ejecucion[proceso.nucleo] = None
+
+    def _entrar_a_listos(self, proceso):
+        """
+        Marca el proceso como LISTO y lo encola, registrando el tick de llegada
+        """
+        proceso.estado = "LISTO"
+        proceso.tick_listo = self.reloj
+        self.cola_listos.agregar(proceso)
+
     def agregar_a_listos(self, proceso):
         """
         Agrega un proceso a la cola de listos
         Solo se agrega si hay memoria disponible (verificado externamente)
         """
         if proceso.estado == "NUEVO":
-            proceso.estado = "LISTO"
-            self.cola_listos.append(proceso)
-            if proceso in self.cola_nuevos:
-                self.cola_nuevos.remove(proceso)
+            self._salir_de_estado(proceso)
+            self._entrar_a_listos(proceso)
 
     def agregar_a_terminados(self, proceso):
         """
-        Agrega un proceso a la cola de terminados
+        Agrega un proceso a la cola de terminados (o solo lo cuenta si no
+        se conservan los terminados)
         """
-        proceso.estado = "TERMINADO"
-        if proceso in self.cola_terminados:
+        if proceso.estado == "TERMINADO":
             return
-        self.cola_terminados.append(proceso)
-        # Remover de otras colas
-        if proceso in self.cola_listos:
-            self.cola_listos.remove(proceso)
-        if proceso in self.cola_bloqueados:
-            self.cola_bloqueados.remove(proceso)
-        if self.proceso_ejecucion == proceso:
-            self.proceso_ejecucion = None
+        self._salir_de_estado(proceso)
+        proceso.estado = "TERMINADO"
+        self.terminados += 1
+        if self.conservar_terminados:
+            self.cola_terminados.append(proceso)
 
     def sacar_de_listos(self, proceso):
         """
         Saca un proceso de la cola de listos
         (Usado cuando el proceso ha culminado o pasa a ejecución)
         """
-        if proceso in self.cola_listos:
-            self.cola_listos.remove(proceso)
+        if proceso.estado == "LISTO":
+            self.cola_listos.quitar(proceso)
+            proceso.tiempo_listo_acumulado += self.reloj - proceso.tick_listo
 
     def agregar_a_bloqueados(self, proceso):
         """
         Agrega un proceso a la cola de bloqueados (I/O)
         """
+        if proceso.estado == "BLOQUEADO":
+            return
+        self._salir_de_estado(proceso)
         proceso.estado = "BLOQUEADO"
-        if proceso not in self.cola_bloqueados:
-            self.cola_bloqueados.append(proceso)
-        if self.proceso_ejecucion == proceso:
-            self.proceso_ejecucion = None
+        proceso.tick_bloqueado = self.reloj
+        self.cola_bloqueados.agregar(proceso)
 
     def retornar_de_bloqueados(self, proceso):
         """
         Retorna un proceso de la cola de bloqueados a la cola de listos
         """
-        if proceso in self.cola_bloqueados:
-            proceso.estado = "LISTO"
-            self.cola_bloqueados.remove(proceso)
-            self.cola_listos.append(proceso)
+        if proceso.estado == "BLOQUEADO":
+            self._salir_de_estado(proceso)
+            self._entrar_a_listos(proceso)
+
+    def devolver_a_listos(self, proceso):
+        """
+        Devuelve a la cola de listos un proceso que deja la CPU
+        (quantum agotado o expropiación)
+        """
+        if proceso.estado != "LISTO":
+            self._salir_de_estado(proceso)
+            self._entrar_a_listos(proceso)
+
+    def cambiar_cola_listos(self, nueva_cola):
+        """
+        Reemplaza la cola de listos (al cambiar de algoritmo) pasando los
+        procesos en su orden de llegada
+        """
+        for proceso in self.cola_listos:
+            nueva_cola.agregar(proceso)
+        self.cola_listos = nueva_cola
 
     def reset_total(self):
         """
         Resetea todas las colas de procesos
         """
-        self.cola_nuevos = []
-        self.cola_listos = []
-        self.cola_bloqueados = []
+        self.cola_nuevos = ColaAdmision()
+        self.cola_listos.limpiar()
+        self.cola_bloqueados = ColaBloqueados()
         self.cola_terminados = []
-        self.proceso_ejecucion = None
+        self.terminados = 0
+        self.en_ejecucion = [None] * len(self.en_ejecucion)
         self.pid_counter = 1
 
+    def hay_activos(self):
+        """
+        Indica si queda algún proceso sin terminar
+        """
+        return bool(self.cola_nuevos or self.cola_listos or self.cola_bloqueados
+                    or any(self.en_ejecucion))
+
+    def procesos_en_ejecucion(self):
+        """
+        Retorna los procesos que tienen algún núcleo
+        """
+        return [proceso for proceso in self.en_ejecucion if proceso]
+
+    def nucleo_libre(self):
+        """
+        Indica si algún núcleo está sin proceso
+        """
+        return None in self.en_ejecucion
+
     def obtener_todos_procesos(self):
         """
         Retorna todos los procesos activos (no terminados)
         """
-        all_procs = self.cola_nuevos + self.cola_listos + self.cola_bloqueados
-        if self.proceso_ejecucion:
-            all_procs.append(self.proceso_ejecucion)
+        all_procs = list(self.cola_nuevos) + list(self.cola_listos) + list(self.cola_bloqueados)
+        all_procs.extend(self.procesos_en_ejecucion())
         return all_procs
-
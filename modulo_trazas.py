@@ -0,0 +1,225 @@
+"""
+Módulo de Trazas
+Lectura en streaming y escritura de trazas de carga de trabajo (CSV y JSONL)
+
+Cada registro tiene el tick de llegada, el tamaño en KB, la ráfaga y la
+prioridad del proceso, y opcionalmente su probabilidad de I/O
+"""
+
+import csv
+import io
+import json
+
+CAMPOS_TRAZA = ["llegada", "tamano", "rafaga", "prioridad"]
+CAMPO_PROBABILIDAD_IO = "probabilidad_io"
+
+
+def formato_de(ruta):
+    """
+    Formato de una traza según su extensión: "csv" o "jsonl"
+    """
+    return "csv" if ruta.lower().endswith(".csv") else "jsonl"
+
+
+class LectorTraza:
+    """
+    Lee una traza ordenada por llegada registro a registro
+
+    Solo se mantiene en memoria el próximo registro (lectura anticipada de
+    uno), así que una traza de millones de procesos nunca se carga completa
+    """
+    def __init__(self, ruta, formato=None):
+        """
+        Args:
+            ruta: Archivo de la traza
+            formato: "csv" o "jsonl"; por defecto según la extensión
+
+        Raises:
+            OSError: Si no se puede abrir el archivo
+            ValueError: Si el primer registro es inválido (el archivo queda cerrado)
+        """
+        self.ruta = ruta
+        self.formato = formato or formato_de(ruta)
+        self.columnas = None
+        self.archivo = None
+        self._abrir(0)
+
+    def _abrir(self, posicion, linea=0, ultima_llegada=0):
+        """
+        Abre el archivo y se posiciona en un byte dado (0 = inicio)
+        Si falla la lectura del primer registro, el archivo se cierra
+
+        Args:
+            linea: Número de la última línea leída antes de 'posicion'
+            ultima_llegada: Llegada del registro anterior a 'posicion'
+        """
+        self.archivo = open(self.ruta, "rb")
+        try:
+            self.linea = 0
+            if self.formato == "csv":
+                # La primera línea es el encabezado
+                self.columnas = next(csv.reader([self.archivo.readline().decode("utf-8")]))
+                self.linea = 1
+            if posicion:
+                self.archivo.seek(posicion)
+                self.linea = linea
+            self.ultima_llegada = ultima_llegada
+            self.proximo = self._leer()
+        except BaseException:
+            self.cerrar()
+            raise
+
+    def _leer(self):
+        """
+        Lee el siguiente registro, o None al final de la traza
+
+        Returns:
+            dict con llegada, tamano, rafaga, prioridad y opcionalmente probabilidad_io
+
+        Raises:
+            ValueError: Si el registro es inválido; el mensaje indica la línea
+        """
+        while True:
+            self.posicion = self.archivo.tell()
+            linea = self.archivo.readline()
+            if not linea:
+                self.archivo.close()
+                return None
+            self.linea += 1
+            linea = linea.decode("utf-8").strip()
+            if linea:
+                break
+        try:
+            if self.formato == "csv":
+                datos = dict(zip(self.columnas, next(csv.reader([linea]))))
+            else:
+                datos = json.loads(linea)
+            registro = {campo: int(datos[campo]) for campo in CAMPOS_TRAZA}
+            # En las trazas exportadas una probabilidad ausente queda vacía (CSV) o null (JSONL)
+            if datos.get(CAMPO_PROBABILIDAD_IO) not in (None, ""):
+                registro[CAMPO_PROBABILIDAD_IO] = float(datos[CAMPO_PROBABILIDAD_IO])
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"La traza {self.ruta}, línea {self.linea}: registro inválido ({e!r})") from e
+
+        if registro["tamano"] <= 0 or registro["rafaga"] <= 0:
+            raise ValueError(f"La traza {self.ruta}, línea {self.linea}: tamano y rafaga deben ser "
+                             f"positivos (tamano={registro['tamano']}, rafaga={registro['rafaga']})")
+        if registro["llegada"] < self.ultima_llegada:
+            raise ValueError(f"La traza {self.ruta}, línea {self.linea}: no está ordenada por llegada "
+                             f"({registro['llegada']} después de {self.ultima_llegada})")
+        self.ultima_llegada = registro["llegada"]
+        return registro
+
+    def proxima_llegada(self):
+        """
+        Tick de llegada del próximo proceso, o None si la traza terminó
+        """
+        return self.proximo["llegada"] if self.proximo else None
+
+    def extraer_hasta(self, tick):
+        """
+        Genera los registros que llegan hasta 'tick' inclusive
+        """
+        while self.proximo is not None and self.proximo["llegada"] <= tick:
+            registro = self.proximo
+            self.proximo = self._leer()
+            yield registro
+
+    def cerrar(self):
+        """
+        Cierra el archivo; la traza queda terminada (sin más llegadas)
+        """
+        if self.archivo is not None:
+            self.archivo.close()
+            self.archivo = None
+        self.proximo = None
+
+    def __bool__(self):
+        return self.proximo is not None
+
+    def __getstate__(self):
+        # El archivo abierto no se puede copiar: se guarda la posición del próximo registro
+        return {'ruta': self.ruta, 'formato': self.formato,
+                'posicion': self.posicion if self.proximo else None,
+                'linea': self.linea - 1, 'ultima_llegada': self.ultima_llegada}
+
+    def __setstate__(self, estado):
+        self.ruta = estado['ruta']
+        self.formato = estado['formato']
+        self.columnas = None
+        self.archivo = None
+        if estado['posicion'] is None:
+            self.posicion = None
+            self.linea = 0
+            self.ultima_llegada = 0
+            self.proximo = None
+        else:
+            # Se relee el próximo registro: la llegada anterior es la suya
+            self._abrir(estado['posicion'], estado['linea'], estado['ultima_llegada'])
+
+
+class EscritorTraza:
+    """
+    Escribe una traza registro a registro a medida que se producen,
+    sin acumular los registros en memoria
+    """
+    def __init__(self, ruta, formato=None):
+        """
+        Args:
+            ruta: Archivo de salida
+            formato: "csv" o "jsonl"; por defecto según la extensión
+        """
+        self.ruta = ruta
+        self.formato = formato or formato_de(ruta)
+        self.escritos = 0
+        self.archivo = io.open(ruta, "w", newline="", encoding="utf-8")
+        self.escritor = None
+        if self.formato == "csv":
+            self.escritor = csv.DictWriter(self.archivo, fieldnames=CAMPOS_TRAZA + [CAMPO_PROBABILIDAD_IO],
+                                           lineterminator="\n")
+            self.escritor.writeheader()
+
+    def escribir(self, registro):
+        """
+        Escribe un registro (dict con llegada, tamano, rafaga, prioridad y
+        opcionalmente probabilidad_io); deben llegar ordenados por llegada
+        """
+        if self.escritor is not None:
+            self.escritor.writerow(registro)
+        else:
+            self.archivo.write(json.dumps(registro) + "\n")
+        self.escritos += 1
+
+    def cerrar(self):
+        """
+        Cierra el archivo
+
+        Returns:
+            Número de registros escritos
+        """
+        if self.archivo is not None:
+            self.archivo.close()
+            self.archivo = None
+        return self.escritos
+
+
+def escribir_traza(registros, ruta, formato=None):
+    """
+    Escribe una traza registro a registro
+
+    Args:
+        registros: Iterable de dicts con llegada, tamano, rafaga, prioridad
+                   (y opcionalmente probabilidad_io), ordenados por llegada
+        ruta: Archivo de salida
+        formato: "csv" o "jsonl"; por defecto según la extensión
+
+    Returns:
+        Número de registros escritos
+    """
+    escritor = EscritorTraza(ruta, formato)
+    try:
+        for registro in registros:
+            escritor.escribir(registro)
+    finally:
+        escritor.cerrar()
+    return escritor.escritos
@@ -0,0 +1,205 @@
+"""
+Módulo de Simulación por Lotes
+Ejecuta el simulador sin interfaz gráfica, tan rápido como permita la CPU
+"""
+
+import argparse
+import json
+import random
+import sys
+
+from coordinador import CoordinadorSO
+from modulo_eventos import formatear
+from constantes import MEMORIA_DEFAULT, NIVELES_MLFQ, PERIODO_BOOST_MLFQ, INTERVALO_ENVEJECIMIENTO
+
+
+def generar_carga(cantidad, semilla=None):
+    """
+    Genera procesos aleatorios con los mismos rangos que el generador de la interfaz
+
+    Args:
+        cantidad: Número de procesos
+        semilla: Semilla del generador (None para no fijarla)
+
+    Returns:
+        Lista de tuplas (tamaño KB, ráfaga, prioridad)
+    """
+    rng = random.Random(semilla)
+    return [(rng.randint(20, 200), rng.randint(5, 30), rng.randint(1, 5))
+            for _ in range(cantidad)]
+
+
+def run(procesos=None, ticks=None, memoria_total=MEMORIA_DEFAULT, algoritmo="Round Robin", quantum=3,
+        estrategia_mem="First Fit", modo_memoria="Contigua", semilla=None,
+        gantt=False, linea_memoria=False, intervalo_memoria=1, logs=False, eventos=False,
+        num_nucleos=1, colas_por_nucleo=False, modelo_io=None, traza=None, exportar_traza=None,
+        niveles_mlfq=NIVELES_MLFQ, quantums_mlfq=None, periodo_boost=PERIODO_BOOST_MLFQ,
+        intervalo_envejecimiento=INTERVALO_ENVEJECIMIENTO):
+    """
+    Ejecuta una carga de trabajo sin interfaz
+
+    La simulación termina al cumplirse 'ticks' o cuando no queda ningún
+    proceso activo ni por llegar. También termina si solo quedan procesos
+    nuevos que no caben ni con la memoria vacía, ya que nunca podrían entrar
+
+    Args:
+        procesos: Lista de tuplas (tamaño KB, ráfaga, prioridad) que llegan en el tick 0
+        ticks: Máximo de ticks a simular (None: hasta que terminen todos)
+        memoria_total, algoritmo, quantum, estrategia_mem, modo_memoria: Configuración del coordinador
+        semilla: Semilla del generador aleatorio de I/O
+        gantt: Incluir los tramos del Gantt en el resultado
+        linea_memoria: Incluir la evolución de la memoria en el resultado
+        intervalo_memoria: Cada cuántos ticks se toma una muestra de memoria
+        logs: Incluir los mensajes de log en el resultado
+        eventos: Usar el modo por eventos (salta los ticks sin eventos, mismo resultado)
+        num_nucleos: Número de núcleos de CPU
+        colas_por_nucleo: Colas de listos por núcleo con robo de trabajo (si no, cola global)
+        modelo_io: Modelo de bloqueo por I/O (ModeloIO por defecto)
+        traza: Traza de llegadas (ruta CSV / JSONL o LectorTraza), leída en streaming
+        exportar_traza: Ruta donde exportar como traza cada proceso al crearse
+        niveles_mlfq, quantums_mlfq, periodo_boost: Configuración de MLFQ
+        intervalo_envejecimiento: Ticks de espera por punto de prioridad (0 lo desactiva)
+
+    Returns:
+        dict con ticks simulados, procesos terminados y no admitidos,
+        métricas por algoritmo, estadísticas de memoria, de compactación y
+        de uso de los núcleos, y opcionalmente 'gantt', 'linea_memoria' y 'logs'
+    """
+    coordinador = CoordinadorSO(memoria_total, algoritmo, quantum, estrategia_mem,
+                                modo_memoria=modo_memoria, num_nucleos=num_nucleos,
+                                colas_por_nucleo=colas_por_nucleo, semilla=semilla,
+                                modelo_io=modelo_io, niveles_mlfq=niveles_mlfq,
+                                quantums_mlfq=quantums_mlfq, periodo_boost=periodo_boost,
+                                intervalo_envejecimiento=intervalo_envejecimiento)
+    if exportar_traza:
+        coordinador.exportar_llegadas(exportar_traza)
+    for size, burst, prioridad in procesos or ():
+        coordinador.agregar_proceso(size, burst, prioridad)
+    if traza is not None:
+        coordinador.cargar_traza(traza)
+
+    gestor = coordinador.gestor_procesos
+    muestras = []
+    proxima_muestra = intervalo_memoria
+    registro = []
+    if logs:
+        # Se guardan las tuplas; el texto se arma solo al final
+        coordinador.eventos.suscribir(registro.append)
+    while ticks is None or coordinador.reloj < ticks:
+        if not coordinador.traza:
+            # Sin llegadas pendientes: terminar si ya nada puede avanzar
+            if not gestor.hay_activos():
+                break
+            if (not gestor.cola_listos and not gestor.cola_bloqueados and not any(gestor.en_ejecucion)
+                    and coordinador.memoria.memoria_libre == coordinador.memoria.capacidad()
+                    and coordinador.ticks_compactacion_restantes == 0
+                    and gestor.cola_nuevos.tamano_minimo() > coordinador.memoria.bloque_libre_mayor()):
+                # Con la memoria vacía ningún proceso restante cabe
+                break
+
+        if eventos:
+            coordinador.avanzar(ticks)
+        else:
+            coordinador.ejecutar_ciclo()
+        if linea_memoria and coordinador.reloj >= proxima_muestra:
+            # En un salto de ticks la memoria no cambia: la misma muestra vale para todos
+            estadisticas = coordinador.memoria.estadisticas()
+            while proxima_muestra <= coordinador.reloj:
+                muestras.append({
+                    'tick': proxima_muestra,
+                    'libre': estadisticas['libre'],
+                    'bloque_libre_mayor': estadisticas['bloque_libre_mayor'],
+                    'fragmentacion_externa': estadisticas['fragmentacion_externa']
+                })
+                proxima_muestra += intervalo_memoria
+
+    resultado = {
+        'ticks': coordinador.reloj,
+        'terminados': gestor.terminados,
+        'no_admitidos': len(gestor.cola_nuevos),
+        'metricas': coordinador.resumen_metricas(),
+        'memoria': coordinador.memoria.estadisticas(),
+        'compactacion': dict(coordinador.estadisticas_compactacion),
+        'nucleos': coordinador.estadisticas_nucleos()
+    }
+    if gantt:
+        resultado['gantt'] = [
+            {'nucleo': nucleo, 'pid': pid, 'inicio': inicio, 'duracion': duracion}
+            for nucleo, historia in enumerate(coordinador.planificador.historias_gantt)
+            for pid, inicio, duracion in historia.segmentos()
+        ]
+    if linea_memoria:
+        resultado['linea_memoria'] = muestras
+    if logs:
+        resultado['logs'] = [formatear(evento) for evento in registro]
+    coordinador.cerrar_exportacion()
+    coordinador.cerrar_traza()
+    return resultado
+
+
+def crear_parser():
+    """
+    Crea el parser de argumentos de la línea de comandos
+    """
+    parser = argparse.ArgumentParser(description="Simulación por lotes del sistema operativo (sin interfaz)")
+    parser.add_argument("--procesos", type=int, default=20, help="Procesos aleatorios a generar")
+    parser.add_argument("--traza", default=None, help="Traza CSV / JSONL de llegadas (reemplaza a --procesos)")
+    parser.add_argument("--exportar-traza", default=None, help="Exportar los procesos creados como traza")
+    parser.add_argument("--ticks", type=int, default=None, help="Máximo de ticks (por defecto hasta terminar)")
+    parser.add_argument("--memoria", type=int, default=MEMORIA_DEFAULT, help="Memoria total en KB")
+    parser.add_argument("--algoritmo", default="Round Robin", help="Algoritmo de planificación")
+    parser.add_argument("--quantum", type=int, default=3, help="Tamaño del quantum")
+    parser.add_argument("--estrategia", default="First Fit", help="Estrategia de asignación de memoria")
+    parser.add_argument("--modo-memoria", default="Contigua", choices=["Contigua", "Paginación"])
+    parser.add_argument("--semilla", type=int, default=None, help="Semilla de la carga y de la I/O")
+    parser.add_argument("--gantt", action="store_true", help="Incluir los tramos del Gantt")
+    parser.add_argument("--linea-memoria", action="store_true", help="Incluir la evolución de la memoria")
+    parser.add_argument("--intervalo-memoria", type=int, default=1, help="Ticks entre muestras de memoria")
+    parser.add_argument("--eventos", action="store_true", help="Modo por eventos: salta los ticks sin eventos")
+    parser.add_argument("--nucleos", type=int, default=1, help="Número de núcleos de CPU")
+    parser.add_argument("--colas-por-nucleo", action="store_true",
+                        help="Una cola de listos por núcleo con robo de trabajo")
+    parser.add_argument("--niveles-mlfq", type=int, default=NIVELES_MLFQ, help="Niveles de MLFQ")
+    parser.add_argument("--quantums-mlfq", nargs="+", type=int, default=None,
+                        help="Quantum de cada nivel de MLFQ (por defecto se duplica en cada nivel)")
+    parser.add_argument("--periodo-boost", type=int, default=PERIODO_BOOST_MLFQ,
+                        help="Ticks entre cada boost de prioridad en MLFQ")
+    parser.add_argument("--envejecimiento", type=int, default=INTERVALO_ENVEJECIMIENTO,
+                        help="Ticks de espera por punto de prioridad (0 lo desactiva)")
+    return parser
+
+
+def main(argv=None):
+    """
+    Punto de entrada de la línea de comandos: imprime el resultado en JSON
+    """
+    args = crear_parser().parse_args(argv)
+    resultado = run(
+        None if args.traza else generar_carga(args.procesos, args.semilla),
+        ticks=args.ticks,
+        memoria_total=args.memoria,
+        algoritmo=args.algoritmo,
+        quantum=args.quantum,
+        estrategia_mem=args.estrategia,
+        modo_memoria=args.modo_memoria,
+        semilla=args.semilla,
+        gantt=args.gantt,
+        linea_memoria=args.linea_memoria,
+        intervalo_memoria=args.intervalo_memoria,
+        eventos=args.eventos,
+        num_nucleos=args.nucleos,
+        colas_por_nucleo=args.colas_por_nucleo,
+        traza=args.traza,
+        exportar_traza=args.exportar_traza,
+        niveles_mlfq=args.niveles_mlfq,
+        quantums_mlfq=args.quantums_mlfq,
+        periodo_boost=args.periodo_boost,
+        intervalo_envejecimiento=args.envejecimiento
+    )
+    json.dump(resultado, sys.stdout, indent=2, ensure_ascii=False)
+    print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
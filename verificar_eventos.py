@@ -0,0 +1,110 @@
+"""
+Módulo de Verificación del Modo por Eventos
+Comprueba que el modo por eventos (CoordinadorSO.avanzar) produce lo mismo
+que el modo tick a tick (ejecutar_ciclo): Gantt, métricas, eventos, memoria,
+tick_count de cada núcleo y tick final
+
+Uso:
+    python verificar_eventos.py                 Todas las configuraciones
+    python verificar_eventos.py --semillas 3    Más cargas aleatorias por configuración
+"""
+
+import argparse
+import itertools
+import os
+import random
+import sys
+import tempfile
+
+from constantes import ALGORITMOS, ESTRATEGIAS_MEMORIA
+from modulo_trazas import escribir_traza
+from simulacion import run
+
+# (núcleos, colas por núcleo)
+NUCLEOS = ((1, False), (2, False), (2, True))
+MEMORIAS = tuple(("Contigua", estrategia) for estrategia in ESTRATEGIAS_MEMORIA) + (("Paginación", "First Fit"),)
+
+
+def escribir_carga(ruta, semilla, cantidad=40):
+    """
+    Escribe una traza aleatoria con llegadas escalonadas; algunos procesos
+    son grandes para forzar esperas de memoria y compactaciones
+
+    Args:
+        ruta: Archivo de la traza
+        semilla: Semilla de la carga (0 = un único proceso largo)
+        cantidad: Procesos de la traza
+    """
+    if semilla == 0:
+        # Un solo proceso largo: el fin de cada quantum solo lo renueva
+        escribir_traza([{'llegada': 0, 'tamano': 100, 'rafaga': 2000, 'prioridad': 1}], ruta)
+        return
+    rng = random.Random(semilla)
+    llegada = 0
+    registros = []
+    for _ in range(cantidad):
+        llegada += rng.choice((0, 0, 1, 5, 20, 60))
+        registros.append({'llegada': llegada, 'tamano': rng.choice((20, 60, 100, 250, 400)),
+                          'rafaga': rng.randint(5, 80), 'prioridad': rng.randint(1, 5)})
+    escribir_traza(registros, ruta)
+
+
+def comparar(ruta, algoritmo, modo_memoria, estrategia, num_nucleos, colas_por_nucleo, semilla):
+    """
+    Ejecuta la misma traza tick a tick y por eventos
+
+    Returns:
+        Lista con las claves del resultado que difieren (vacía si son idénticos)
+    """
+    resultados = [
+        run(traza=ruta, algoritmo=algoritmo, modo_memoria=modo_memoria, estrategia_mem=estrategia,
+            num_nucleos=num_nucleos, colas_por_nucleo=colas_por_nucleo, semilla=semilla,
+            gantt=True, logs=True, eventos=eventos)
+        for eventos in (False, True)
+    ]
+    tick_a_tick, por_eventos = resultados
+    return [clave for clave in tick_a_tick if tick_a_tick[clave] != por_eventos.get(clave)]
+
+
+def main(argv=None):
+    """
+    Punto de entrada de la línea de comandos
+
+    Returns:
+        0 si todas las configuraciones coinciden, 1 si alguna difiere
+    """
+    parser = argparse.ArgumentParser(description="Verifica que el modo por eventos equivale al tick a tick")
+    parser.add_argument("--algoritmos", nargs="+", default=list(ALGORITMOS))
+    parser.add_argument("--semillas", type=int, default=2, help="Cargas aleatorias por configuración")
+    args = parser.parse_args(argv)
+
+    directorio = tempfile.mkdtemp(prefix="verificar_eventos_")
+    semillas = range(args.semillas + 1)  # La semilla 0 es la carga de un único proceso
+    rutas = {}
+    for semilla in semillas:
+        rutas[semilla] = os.path.join(directorio, f"carga_{semilla}.csv")
+        escribir_carga(rutas[semilla], semilla)
+
+    configuraciones = 0
+    diferencias = 0
+    try:
+        for algoritmo, (modo, estrategia), (nucleos, por_nucleo), semilla in itertools.product(
+                args.algoritmos, MEMORIAS, NUCLEOS, semillas):
+            configuraciones += 1
+            distintas = comparar(rutas[semilla], algoritmo, modo, estrategia, nucleos, por_nucleo, semilla)
+            if distintas:
+                diferencias += 1
+                print(f"DIFERENCIA {algoritmo} / {modo} / {estrategia} / {nucleos} núcleos"
+                      f"{' (colas por núcleo)' if por_nucleo else ''} / carga {semilla}: {', '.join(distintas)}",
+                      file=sys.stderr)
+    finally:
+        for ruta in rutas.values():
+            os.remove(ruta)
+        os.rmdir(directorio)
+
+    print(f"{configuraciones} configuraciones, {diferencias} con diferencias")
+    return 1 if diferencias else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())